@@ -0,0 +1,91 @@
+"""Bounded, short-lived memo for GraphQL read payloads.
+
+Several domains (system, key, notification) keep recent read results for a
+few seconds to minutes so an agent re-asking the same question in one
+conversation skips the round-trip. This is the one shared implementation:
+entries expire on the monotonic clock, the oldest entry is evicted once
+``maxsize`` is reached, and ``clear()`` bumps a generation counter so a read
+that was already in flight when a mutation invalidated the memo can't store
+its (possibly pre-mutation) payload afterwards.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+# Default entry ceiling. Keys include caller-supplied values (key ids,
+# notification filters), so the memo must not grow without bound.
+DEFAULT_CACHE_MAXSIZE: int = 256
+
+
+class TTLCache:
+    """Memo of read payloads with per-entry expiry and least-recently-stored eviction."""
+
+    __slots__ = ("_entries", "_generation", "maxsize", "ttl")
+
+    def __init__(self, ttl: float, maxsize: int = DEFAULT_CACHE_MAXSIZE) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Incremented by every ``clear()``; pass it back to ``set`` to guard a store."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the live payload for ``key``, or None when missing or expired."""
+        hit = self._entries.get(key)
+        if hit is None:
+            return None
+        expires_at, value = hit
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        *,
+        ttl: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (default: the cache TTL).
+
+        When ``generation`` is given and the cache has been cleared since it was
+        read, the value predates an invalidation and is dropped instead.
+        """
+        if generation is not None and generation != self._generation:
+            return
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and invalidate reads still in flight."""
+        self._entries.clear()
+        self._generation += 1
+
+    @contextmanager
+    def cleared_after(self, active: bool = True) -> Iterator[None]:
+        """Clear the cache when the block exits, even on error, if ``active``.
+
+        Mutations wrap their request in this rather than clearing up front, so
+        a read that lands while the mutation is outstanding can't repopulate
+        the memo with the old state.
+        """
+        try:
+            yield
+        finally:
+            if active:
+                self.clear()
@@ -5,6 +5,7 @@ to the Unraid API with proper timeout handling and error management.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import random
@@ -265,9 +266,12 @@ async def _create_http_client() -> httpx.AsyncClient:
         A new AsyncClient configured for Unraid API communication
     """
     return httpx.AsyncClient(
-        # Connection pool settings
+        # Connection pool settings. Idle connections are kept for a minute: an
+        # agent's think time between tool calls often exceeds 30s, and expiring
+        # sooner would make the next call pay a fresh TCP+TLS handshake. 60s
+        # stays under nginx's default 75s keepalive_timeout on the Unraid side.
         limits=httpx.Limits(
-            max_keepalive_connections=20, max_connections=20, keepalive_expiry=30.0
+            max_keepalive_connections=20, max_connections=20, keepalive_expiry=60.0
         ),
         # Default timeout (can be overridden per-request)
         timeout=DEFAULT_TIMEOUT,
@@ -410,6 +414,44 @@ def _synthesize_idempotent_success(
     }
 
 
+@functools.lru_cache(maxsize=256)
+def _encoded_query_body(query: str) -> bytes:
+    """Encode the request body for a query sent without variables.
+
+    Those queries are module constants, so the body is identical on every call;
+    encode it once. Mirrors httpx's own ``json=`` encoding (compact separators,
+    UTF-8, NaN rejected).
+    """
+    return json.dumps(
+        {"query": query}, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _encoded_query_prefix(query: str) -> bytes:
+    """Encoded body up to the variables value: ``{"query":"...","variables":``."""
+    return _encoded_query_body(query)[:-1] + b',"variables":'
+
+
+def _encode_request_body(query: str, variables: dict[str, Any] | None) -> bytes:
+    """Encode a request body, reusing the cached query encoding.
+
+    Queries with variables (ups_device, container lookups, every mutation input)
+    still send a constant query string, so only the variables are encoded per
+    call and spliced after the cached prefix. The result is byte-identical to
+    encoding ``{"query": query, "variables": variables}`` in one go.
+    """
+    if not variables:
+        return _encoded_query_body(query)
+    return (
+        _encoded_query_prefix(query)
+        + json.dumps(variables, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode(
+            "utf-8"
+        )
+        + b"}"
+    )
+
+
 async def make_graphql_request(
     query: str,
     variables: dict[str, Any] | None = None,
@@ -444,21 +486,27 @@ async def make_graphql_request(
         "X-API-Key": _settings.UNRAID_API_KEY,
     }
 
-    payload: dict[str, Any] = {"query": query}
-    if variables:
-        payload["variables"] = variables
-
-    logger.debug("Making GraphQL request to %s:", safe_display_url(_settings.UNRAID_API_URL))
-    logger.debug("Query: %s%s", query[:200], "..." if len(query) > 200 else "")
-    if variables and logger.isEnabledFor(logging.DEBUG):
-        logger.debug("Variables: %s", redact_sensitive(variables))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Making GraphQL request to %s:", safe_display_url(_settings.UNRAID_API_URL))
+        logger.debug("Query: %s%s", query[:200], "..." if len(query) > 200 else "")
+        if variables:
+            logger.debug("Variables: %s", redact_sensitive(variables))
 
     try:
         # Get the shared HTTP client with connection pooling
         client = await get_http_client()
 
-        # POST with retry/backoff for 429 rate limit responses
-        post_kwargs: dict[str, Any] = {"json": payload, "headers": headers}
+        # POST with retry/backoff for 429 rate limit responses. The JSON hop stays on
+        # the stdlib codec: the body is encoded compactly (as httpx's `json=` would)
+        # and `Response.json()` parses the raw bytes without a text-decode pass.
+        # Swapping in orjson would have to be a locked runtime dependency (CI runs
+        # `uv sync --locked`), and payloads here are small next to the network
+        # round-trip. The query part of the body is encoded once per query string;
+        # only variables are encoded per call.
+        post_kwargs: dict[str, Any] = {
+            "content": _encode_request_body(query, variables),
+            "headers": headers,
+        }
         if custom_timeout is not None:
             post_kwargs["timeout"] = custom_timeout
 
@@ -4,6 +4,7 @@ Provides gate_destructive_action() — a single call to guard any destructive
 tool action with interactive user confirmation or confirm=True bypass.
 """
 
+from collections.abc import Set
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
@@ -71,7 +72,7 @@ async def elicit_destructive_confirmation(
 async def gate_destructive_action(
     ctx: "Context | None",
     action: str,
-    destructive_actions: set[str],
+    destructive_actions: Set[str],
     confirm: bool,
     description: str | dict[str, str],
 ) -> None:
@@ -30,7 +30,9 @@ def _item_bytes(item: Any) -> int:
     ``_LIVE_EVENT_BYTE_BUDGET`` = half the response cap) to absorb the difference.
     """
     try:
-        return len(json.dumps(item, default=str).encode())
+        # ensure_ascii (the default) escapes every non-ASCII char, so the string
+        # length already is the UTF-8 byte count — no need to encode a copy.
+        return len(json.dumps(item, default=str))
     except (TypeError, ValueError):
         return len(str(item).encode())
 
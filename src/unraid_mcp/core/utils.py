@@ -1,6 +1,8 @@
 """Shared utility functions for Unraid MCP tools."""
 
+import functools
 import re
+from collections.abc import Set
 from typing import Any
 from urllib.parse import urlparse
 
@@ -205,6 +207,17 @@ def coerce_list(value: Any) -> list[Any]:
     return value if isinstance(value, list) else []
 
 
+def compact_query(query: str) -> str:
+    """Collapse a multi-line GraphQL document literal into single-spaced text.
+
+    Query constants are written indented for readability, but that padding is
+    re-sent (and re-lexed by the server) on every request. Only safe for documents
+    without string literals, where whitespace runs carry no meaning — true of
+    every query constant in this package, which pass values as variables.
+    """
+    return " ".join(query.split())
+
+
 def mutation_success(result: Any, *, boolean: bool) -> bool:
     """Derive a mutation's success flag from its GraphQL result.
 
@@ -233,6 +246,9 @@ def _coerce_int(value: Any) -> int | None:
         return None
 
 
+_BYTE_UNITS: tuple[str, ...] = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+
+
 def format_bytes(bytes_value: int | None) -> str:
     """Format byte values into human-readable sizes.
 
@@ -245,12 +261,12 @@ def format_bytes(bytes_value: int | None) -> str:
     coerced = _coerce_int(bytes_value)
     if coerced is None:
         return "N/A"
-    value = float(coerced)
-    for unit in ["B", "KB", "MB", "GB", "TB", "PB"]:
-        if value < 1024.0:
-            return f"{value:.2f} {unit}"
-        value /= 1024.0
-    return f"{value:.2f} EB"
+    if coerced < 1024:
+        return f"{coerced:.2f} B"
+    # Each unit is 2**10 of the previous one, so the unit index falls straight
+    # out of the bit length; no divide-and-compare loop.
+    exponent = min((coerced.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{coerced / (1 << (10 * exponent)):.2f} {_BYTE_UNITS[exponent]}"
 
 
 def safe_display_url(url: str | None) -> str | None:
@@ -290,15 +306,23 @@ def format_kb(k: Any) -> str:
     return format_bytes(kb * 1024)
 
 
-def validate_subaction(subaction: str, valid_set: set[str], domain: str) -> None:
+def validate_subaction(subaction: str, valid_set: Set[str], domain: str) -> None:
     """Raise ToolError if subaction is not in the valid set.
 
     Args:
         subaction: The subaction string to validate.
-        valid_set: Set of valid subaction names.
+        valid_set: Set of valid subaction names (the domain's frozenset is passed
+            as-is; no per-call copy is needed for the membership check).
         domain: The domain name for error messages (e.g. "docker").
     """
     if subaction not in valid_set:
-        raise ToolError(
-            f"Invalid subaction '{subaction}' for {domain}. Must be one of: {sorted(valid_set)}"
+        choices = (
+            _sorted_choices(valid_set) if isinstance(valid_set, frozenset) else sorted(valid_set)
         )
+        raise ToolError(f"Invalid subaction '{subaction}' for {domain}. Must be one of: {choices}")
+
+
+@functools.lru_cache(maxsize=64)
+def _sorted_choices(valid_set: frozenset[str]) -> str:
+    """Render a domain's subaction list once; the domain sets are frozen at import."""
+    return str(sorted(valid_set))
@@ -22,9 +22,12 @@ MAX_VALUE_LENGTH: int = 4096
 # to the original set. Any rclone remote config key containing those characters
 # will now be rejected. This is intentional — those characters are unsafe in
 # shell contexts and were never expected in rclone remote names or settings keys.
-DANGEROUS_KEY_PATTERN: re.Pattern[str] = re.compile(
-    r"\.\.|[/\\;|`$(){}&<>\"'#\x20\x7f]|[\x00-\x1f]"
-)
+# Space and the control characters share one range so the whole character set
+# is a single class.
+DANGEROUS_KEY_PATTERN: re.Pattern[str] = re.compile(r"\.\.|[/\\;|`$(){}&<>\"'#\x00-\x20\x7f]")
+
+# Scalar value types accepted by the mapping validators.
+_SCALAR_TYPES = (str, int, float, bool)
 
 
 def validate_input_mapping(
@@ -72,7 +75,7 @@ def validate_input_mapping(
             return out
         if isinstance(value, list):
             return [_check(item, f"{path}[]", depth + 1) for item in value]
-        if value is None or isinstance(value, (str, int, float, bool)):
+        if value is None or isinstance(value, _SCALAR_TYPES):
             if isinstance(value, str) and len(value) > MAX_VALUE_LENGTH:
                 raise ToolError(
                     f"{path} value exceeds max length ({len(value)} > {MAX_VALUE_LENGTH})"
@@ -138,7 +141,7 @@ def validate_scalar_mapping(
             raise ToolError(f"{label} keys must be non-empty strings, got: {type(key).__name__}")
         if DANGEROUS_KEY_PATTERN.search(key):
             raise ToolError(f"{label} key '{key}' contains disallowed characters")
-        if not isinstance(value, (str, int, float, bool)):
+        if not isinstance(value, _SCALAR_TYPES):
             raise ToolError(
                 f"{label}['{key}'] must be a string, number, or boolean"
                 + (f", got: {type(value).__name__}" if not stringify else "")
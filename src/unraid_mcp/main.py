@@ -5,9 +5,30 @@ This is the main entry point for the Unraid MCP Server. It imports and starts
 the modular server implementation from unraid_mcp.server.
 """
 
+import asyncio
 import sys
 
 
+def _use_uvloop() -> None:
+    """Run the server on uvloop when it is available.
+
+    uvloop ships with ``uvicorn[standard]`` on Linux/macOS but not on Windows, so
+    fall back to the stock asyncio loop when the import fails. Setting the policy
+    before ``run_server()`` covers stdio too, not just uvicorn's HTTP transports.
+    Event loop policies are deprecated from Python 3.14 and FastMCP creates the
+    loop inside its own runner, leaving no loop factory to hand uvloop to, so on
+    3.14+ the stock loop is kept rather than calling the deprecated setter.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    if sys.version_info < (3, 14):
+        # Only reached before 3.14, where the setter is not deprecated; ty flags
+        # the call regardless of the version guard.
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())  # ty: ignore[deprecated]
+
+
 def main() -> None:
     """Main entry point for the Unraid MCP Server."""
     argv = sys.argv[1:]
@@ -35,6 +56,7 @@ def main() -> None:
     try:
         from .server import run_server
 
+        _use_uvloop()
         run_server()
     except KeyboardInterrupt:
         print("\nServer stopped by user")
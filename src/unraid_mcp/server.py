@@ -140,12 +140,18 @@ _rate_limiter = SlidingWindowRateLimitingMiddleware(max_requests=540, window_min
 #    signals the agent to narrow its query. See core/response_limit.py.
 _response_limiter = StructuredResponseLimitingMiddleware(max_size=UNRAID_MCP_MAX_RESPONSE_BYTES)
 
-# Note: there is no response/query caching anywhere in this server. The only thing
-# ever removed was FastMCP's ResponseCachingMiddleware: the consolidated `unraid`
-# tool mixes reads and mutations under one name, making per-subaction cache
-# exclusion impossible, so a fully disabled middleware added overhead with no
-# benefit. Caching can be re-added if/when the tool is split into separate
-# read/write tools.
+# Note: there is no response caching middleware. FastMCP's ResponseCachingMiddleware
+# keys on the tool name, and the consolidated `unraid` tool mixes reads and mutations
+# under one name, so it cannot exclude individual subactions. Caching lives in the
+# domain handlers instead, per subaction:
+#   - system, key and notification keep short-lived read memos (core/cache.py
+#     TTLCache). Mutations wrap their request in cleared_after(), which drops the
+#     memo once the mutation returns, even on error; other domains whose writes
+#     change system data use _system.invalidate_system_reads(). Each clear bumps a
+#     generation, so a read that was in flight across the mutation is not stored.
+#   - docker reuses its container name/id index for a few seconds. Subactions
+#     that recreate or delete containers drop it and resolve against a fresh
+#     list, and a mutation that fails on a cached id re-resolves and retries once.
 
 
 @asynccontextmanager
@@ -210,7 +216,7 @@ def register_all_modules(app: FastMCP) -> None:
         logger.info("unraid tool registered successfully - Server ready!")
 
     except Exception as e:
-        logger.error(f"Failed to register modules: {e}", exc_info=True)
+        logger.error("Failed to register modules: %s", e, exc_info=True)
         raise
 
 
@@ -442,8 +448,8 @@ def run_server() -> None:
             mcp.run()
         else:
             logger.error(
-                f"Unsupported MCP_TRANSPORT: {_settings.UNRAID_MCP_TRANSPORT}. "
-                "Choose 'streamable-http', 'sse', or 'stdio'."
+                "Unsupported MCP_TRANSPORT: %s. Choose 'streamable-http', 'sse', or 'stdio'.",
+                _settings.UNRAID_MCP_TRANSPORT,
             )
             sys.exit(1)
     except Exception as e:
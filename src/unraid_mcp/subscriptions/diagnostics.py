@@ -178,7 +178,7 @@ async def test_subscription_query(subscription_query: str) -> dict[str, Any]:
     field_name = _validate_subscription_query(subscription_query)
 
     try:
-        logger.info(f"[TEST_SUBSCRIPTION] Testing validated subscription field '{field_name}'")
+        logger.info("[TEST_SUBSCRIPTION] Testing validated subscription field '%s'", field_name)
 
         try:
             ws_url = build_ws_url()
@@ -292,6 +292,8 @@ async def diagnose_subscriptions() -> dict[str, Any]:
             except ValueError:
                 ws_url_display = None
 
+        startup_error = get_last_startup_error()
+
         # Add environment info with explicit typing
         diagnostic_info: dict[str, Any] = {
             "timestamp": datetime.now(UTC).isoformat(),
@@ -301,7 +303,7 @@ async def diagnose_subscriptions() -> dict[str, Any]:
                 "unraid_api_url": safe_display_url(_settings.UNRAID_API_URL),
                 "api_key_configured": bool(_settings.UNRAID_API_KEY),
                 "websocket_url": ws_url_display,
-                "startup_error": get_last_startup_error(),
+                "startup_error": startup_error,
             },
             "subscriptions": status,
             "summary": {
@@ -317,32 +319,29 @@ async def diagnose_subscriptions() -> dict[str, Any]:
         # Add troubleshooting recommendations
         recommendations: list[str] = []
 
-        if not diagnostic_info["environment"]["api_key_configured"]:
+        if not _settings.UNRAID_API_KEY:
             recommendations.append(
                 "CRITICAL: No API key configured. Set UNRAID_API_KEY environment variable."
             )
 
-        if diagnostic_info["environment"]["startup_error"] is not None:
+        if startup_error is not None:
             recommendations.append(
                 "Subscription autostart failed at startup "
-                f"({diagnostic_info['environment']['startup_error']}). Live data may be "
+                f"({startup_error}). Live data may be "
                 "unavailable; check server logs for the root cause."
             )
 
-        if diagnostic_info["summary"]["in_error_state"] > 0:
+        if error_count > 0:
             recommendations.append(
                 "Some subscriptions are in error state. Check 'connection_issues' for details."
             )
 
-        if diagnostic_info["summary"]["with_data"] == 0:
+        if summary["with_data"] == 0:
             recommendations.append(
                 "No subscriptions have received data yet. Check WebSocket connectivity and authentication."
             )
 
-        if (
-            diagnostic_info["summary"]["active_count"]
-            < diagnostic_info["summary"]["auto_start_count"]
-        ):
+        if summary["active_count"] < summary["auto_start_count"]:
             recommendations.append(
                 "Not all auto-start subscriptions are active. Check server startup logs."
             )
@@ -362,7 +361,10 @@ async def diagnose_subscriptions() -> dict[str, Any]:
         }
 
         logger.info(
-            f"[DIAGNOSTIC] Completed. Active: {diagnostic_info['summary']['active_count']}, With data: {diagnostic_info['summary']['with_data']}, Errors: {diagnostic_info['summary']['in_error_state']}"
+            "[DIAGNOSTIC] Completed. Active: %s, With data: %s, Errors: %s",
+            summary["active_count"],
+            summary["with_data"],
+            error_count,
         )
         return diagnostic_info
 
@@ -374,7 +376,7 @@ async def diagnose_subscriptions() -> dict[str, Any]:
 
 
 # Subactions exposed via the `unraid` tool's `subscriptions` action.
-_SUBSCRIPTIONS_SUBACTIONS: set[str] = {"diagnose", "test_query"}
+_SUBSCRIPTIONS_SUBACTIONS: frozenset[str] = frozenset({"diagnose", "test_query"})
 
 
 async def _handle_subscriptions(subaction: str, subscription_query: str | None) -> dict[str, Any]:
@@ -97,8 +97,11 @@ def _cap_log_content(data: dict[str, Any]) -> dict[str, Any]:
                     truncated = truncated[nl_pos + 1 :]
 
             logger.warning(
-                f"[RESOURCE] Capped log content from {original_line_count} to "
-                f"{len(lines)} lines ({len(value)} -> {len(truncated)} chars)"
+                "[RESOURCE] Capped log content from %s to %s lines (%s -> %s chars)",
+                original_line_count,
+                len(lines),
+                len(value),
+                len(truncated),
             )
             result[key] = truncated
         else:
@@ -226,25 +229,23 @@ class SubscriptionManager:
             for action, query in SNAPSHOT_ACTIONS.items()
         }
         self.subscription_configs["logFileSubscription"] = {
-            "query": """
-                subscription LogFileSubscription($path: String!) {
-                    logFile(path: $path) {
-                        path
-                        content
-                        totalLines
-                    }
-                }
-                """,
+            "query": (
+                "subscription LogFileSubscription($path: String!) {"
+                " logFile(path: $path) { path content totalLines } }"
+            ),
             "resource": "unraid://logs/stream",
             "description": "Real-time log file streaming",
             "auto_start": False,  # Started manually with path parameter
         }
 
         logger.info(
-            f"[SUBSCRIPTION_MANAGER] Initialized with auto_start={self.auto_start_enabled}, max_reconnects={self.max_reconnect_attempts}"
+            "[SUBSCRIPTION_MANAGER] Initialized with auto_start=%s, max_reconnects=%s",
+            self.auto_start_enabled,
+            self.max_reconnect_attempts,
         )
         logger.debug(
-            f"[SUBSCRIPTION_MANAGER] Available subscriptions: {list(self.subscription_configs.keys())}"
+            "[SUBSCRIPTION_MANAGER] Available subscriptions: %s",
+            list(self.subscription_configs.keys()),
         )
 
     def _clear_graphql_error_burst(self, subscription_name: str) -> None:
@@ -368,19 +369,20 @@ class SubscriptionManager:
             return
 
         logger.info(
-            f"[SUBSCRIPTION_MANAGER] Starting auto-start process for {len(auto_start_configs)} subscriptions in parallel..."
+            "[SUBSCRIPTION_MANAGER] Starting auto-start process for %s subscriptions in parallel...",
+            len(auto_start_configs),
         )
 
         start_errors: list[tuple[str, Exception]] = []
 
         async def _start_one(name: str, config: dict[str, Any]) -> None:
             try:
-                logger.info(f"[SUBSCRIPTION_MANAGER] Auto-starting subscription: {name}")
+                logger.info("[SUBSCRIPTION_MANAGER] Auto-starting subscription: %s", name)
                 await self.start_subscription(name, str(config["query"]))
             except asyncio.CancelledError:
                 raise  # Never swallow cancellation — propagate for clean shutdown
             except Exception as e:
-                logger.error(f"[SUBSCRIPTION_MANAGER] Failed to auto-start {name}: {e}")
+                logger.error("[SUBSCRIPTION_MANAGER] Failed to auto-start %s: %s", name, e)
                 async with self._task_lock:
                     self.last_error[name] = str(e)
                 start_errors.append((name, e))
@@ -405,12 +407,16 @@ class SubscriptionManager:
 
         started = len(auto_start_configs) - len(start_errors)
         logger.info(
-            f"[SUBSCRIPTION_MANAGER] Auto-start completed. Started {started}/{len(auto_start_configs)} subscriptions"
+            "[SUBSCRIPTION_MANAGER] Auto-start completed. Started %s/%s subscriptions",
+            started,
+            len(auto_start_configs),
         )
         if start_errors:
             failed_names = ", ".join(n for n, _ in start_errors)
             logger.warning(
-                f"[SUBSCRIPTION_MANAGER] {len(start_errors)} subscription(s) failed to auto-start: {failed_names}"
+                "[SUBSCRIPTION_MANAGER] %s subscription(s) failed to auto-start: %s",
+                len(start_errors),
+                failed_names,
             )
 
     async def start_subscription(
@@ -422,14 +428,14 @@ class SubscriptionManager:
                 f"subscription_name must contain only [a-zA-Z0-9_], got: {subscription_name!r}"
             )
         self._clear_graphql_error_burst(subscription_name)
-        logger.info(f"[SUBSCRIPTION:{subscription_name}] Starting subscription...")
+        logger.info("[SUBSCRIPTION:%s] Starting subscription...", subscription_name)
 
         # Guard must be inside the lock to prevent a TOCTOU race where two
         # concurrent callers both pass the check before either creates the task.
         async with self._task_lock:
             if subscription_name in self.active_subscriptions:
                 logger.warning(
-                    f"[SUBSCRIPTION:{subscription_name}] Subscription already active, skipping"
+                    "[SUBSCRIPTION:%s] Subscription already active, skipping", subscription_name
                 )
                 return
 
@@ -453,12 +459,12 @@ class SubscriptionManager:
                 )
                 self.active_subscriptions[subscription_name] = task
                 logger.info(
-                    f"[SUBSCRIPTION:{subscription_name}] Subscription task created and started"
+                    "[SUBSCRIPTION:%s] Subscription task created and started", subscription_name
                 )
                 self._set_connection_state(subscription_name, "active")
             except Exception as e:
                 logger.error(
-                    f"[SUBSCRIPTION:{subscription_name}] Failed to start subscription task: {e}"
+                    "[SUBSCRIPTION:%s] Failed to start subscription task: %s", subscription_name, e
                 )
                 self._set_connection_state(subscription_name, "failed", str(e))
                 raise
@@ -471,12 +477,14 @@ class SubscriptionManager:
         deadlock if _subscription_loop's cleanup path also needs _task_lock
         (it does, at loop exit). Pattern: lock → snapshot → release → await.
         """
-        logger.info(f"[SUBSCRIPTION:{subscription_name}] Stopping subscription...")
+        logger.info("[SUBSCRIPTION:%s] Stopping subscription...", subscription_name)
 
         async with self._task_lock:
             task = self.active_subscriptions.pop(subscription_name, None)
             if task is None:
-                logger.warning(f"[SUBSCRIPTION:{subscription_name}] No active subscription to stop")
+                logger.warning(
+                    "[SUBSCRIPTION:%s] No active subscription to stop", subscription_name
+                )
                 return
             state = self.states[subscription_name]
             state.generation += 1
@@ -493,13 +501,13 @@ class SubscriptionManager:
         try:
             await task
         except asyncio.CancelledError:
-            logger.debug(f"[SUBSCRIPTION:{subscription_name}] Task cancelled successfully")
+            logger.debug("[SUBSCRIPTION:%s] Task cancelled successfully", subscription_name)
         async with self._task_lock:
             state = self.states.get(subscription_name)
             if state is not None and state.generation == stop_generation:
                 self._set_connection_state(subscription_name, "stopped")
                 self._clear_graphql_error_burst(subscription_name)
-        logger.info(f"[SUBSCRIPTION:{subscription_name}] Subscription stopped")
+        logger.info("[SUBSCRIPTION:%s] Subscription stopped", subscription_name)
 
     async def stop_all(self) -> None:
         """Stop all active subscriptions (called during server shutdown)."""
@@ -509,8 +517,10 @@ class SubscriptionManager:
             try:
                 await self.stop_subscription(name)
             except Exception as e:
-                logger.error(f"[SHUTDOWN] Error stopping subscription '{name}': {e}", exc_info=True)
-        logger.info(f"[SHUTDOWN] Stopped {len(subscription_names)} subscription(s)")
+                logger.error(
+                    "[SHUTDOWN] Error stopping subscription '%s': %s", name, e, exc_info=True
+                )
+        logger.info("[SHUTDOWN] Stopped %s subscription(s)", len(subscription_names))
 
     @staticmethod
     def _compute_reconnect_delay(
@@ -554,12 +564,17 @@ class SubscriptionManager:
             self.reconnect_attempts[subscription_name] = attempt
 
             logger.info(
-                f"[WEBSOCKET:{subscription_name}] Connection attempt #{attempt} (max: {self.max_reconnect_attempts})"
+                "[WEBSOCKET:%s] Connection attempt #%s (max: %s)",
+                subscription_name,
+                attempt,
+                self.max_reconnect_attempts,
             )
 
             if attempt > self.max_reconnect_attempts:
                 logger.error(
-                    f"[WEBSOCKET:{subscription_name}] Max reconnection attempts ({self.max_reconnect_attempts}) exceeded, stopping"
+                    "[WEBSOCKET:%s] Max reconnection attempts (%s) exceeded, stopping",
+                    subscription_name,
+                    self.max_reconnect_attempts,
                 )
                 self._set_connection_state(subscription_name, "max_retries_exceeded")
                 break
@@ -567,9 +582,11 @@ class SubscriptionManager:
             handshake_slot_acquired = False
             try:
                 ws_url = build_ws_url()
-                logger.debug(f"[WEBSOCKET:{subscription_name}] Connecting to: {ws_url}")
+                logger.debug("[WEBSOCKET:%s] Connecting to: %s", subscription_name, ws_url)
                 logger.debug(
-                    f"[WEBSOCKET:{subscription_name}] API Key present: {'Yes' if _settings.UNRAID_API_KEY else 'No'}"
+                    "[WEBSOCKET:%s] API Key present: %s",
+                    subscription_name,
+                    "Yes" if _settings.UNRAID_API_KEY else "No",
                 )
 
                 ssl_context = build_ws_ssl_context(ws_url)
@@ -577,7 +594,7 @@ class SubscriptionManager:
                 # Connection with timeout
                 connect_timeout = _WS_OPEN_TIMEOUT
                 logger.debug(
-                    f"[WEBSOCKET:{subscription_name}] Connection timeout: {connect_timeout}s"
+                    "[WEBSOCKET:%s] Connection timeout: %ss", subscription_name, connect_timeout
                 )
 
                 await self._connection_semaphore.acquire()
@@ -593,7 +610,7 @@ class SubscriptionManager:
                 ) as websocket:
                     selected_proto = websocket.subprotocol or "none"
                     logger.info(
-                        f"[WEBSOCKET:{subscription_name}] Connected! Protocol: {selected_proto}"
+                        "[WEBSOCKET:%s] Connected! Protocol: %s", subscription_name, selected_proto
                     )
                     self._set_connection_state(subscription_name, "connected")
 
@@ -603,27 +620,29 @@ class SubscriptionManager:
 
                     # Initialize GraphQL-WS protocol
                     logger.debug(
-                        f"[PROTOCOL:{subscription_name}] Initializing GraphQL-WS protocol..."
+                        "[PROTOCOL:%s] Initializing GraphQL-WS protocol...", subscription_name
                     )
                     init_payload = build_connection_init()
                     if "payload" in init_payload:
-                        logger.debug(f"[AUTH:{subscription_name}] Adding authentication payload")
+                        logger.debug("[AUTH:%s] Adding authentication payload", subscription_name)
                     else:
                         logger.warning(
-                            f"[AUTH:{subscription_name}] No API key available for authentication"
+                            "[AUTH:%s] No API key available for authentication", subscription_name
                         )
 
-                    logger.debug(f"[PROTOCOL:{subscription_name}] Sending connection_init message")
+                    logger.debug("[PROTOCOL:%s] Sending connection_init message", subscription_name)
                     await websocket.send(json.dumps(init_payload))
 
                     # Wait for connection acknowledgment
-                    logger.debug(f"[PROTOCOL:{subscription_name}] Waiting for connection_ack...")
+                    logger.debug("[PROTOCOL:%s] Waiting for connection_ack...", subscription_name)
                     init_raw = await asyncio.wait_for(websocket.recv(), timeout=_WS_ACK_TIMEOUT)
 
                     try:
                         init_data = json.loads(init_raw)
                         logger.debug(
-                            f"[PROTOCOL:{subscription_name}] Received init response: {init_data.get('type')}"
+                            "[PROTOCOL:%s] Received init response: %s",
+                            subscription_name,
+                            init_data.get("type"),
                         )
                     except json.JSONDecodeError as e:
                         init_preview = (
@@ -632,7 +651,9 @@ class SubscriptionManager:
                             else init_raw[:200].decode("utf-8", errors="replace")
                         )
                         logger.error(
-                            f"[PROTOCOL:{subscription_name}] Failed to decode init response: {init_preview}..."
+                            "[PROTOCOL:%s] Failed to decode init response: %s...",
+                            subscription_name,
+                            init_preview,
                         )
                         # Raise rather than continue — continue skips the reconnect
                         # backoff at the bottom of the while loop, causing tight retry
@@ -644,13 +665,13 @@ class SubscriptionManager:
                     # Handle connection acknowledgment
                     if init_data.get("type") == "connection_ack":
                         logger.info(
-                            f"[PROTOCOL:{subscription_name}] Connection acknowledged successfully"
+                            "[PROTOCOL:%s] Connection acknowledged successfully", subscription_name
                         )
                         self._set_connection_state(subscription_name, "authenticated")
                     elif init_data.get("type") == "connection_error":
                         error_payload = init_data.get("payload", {})
                         logger.error(
-                            f"[AUTH:{subscription_name}] Authentication failed: {error_payload}"
+                            "[AUTH:%s] Authentication failed: %s", subscription_name, error_payload
                         )
                         self._set_connection_state(
                             subscription_name,
@@ -660,13 +681,15 @@ class SubscriptionManager:
                         break
                     else:
                         logger.warning(
-                            f"[PROTOCOL:{subscription_name}] Unexpected init response: {init_data}"
+                            "[PROTOCOL:%s] Unexpected init response: %s",
+                            subscription_name,
+                            init_data,
                         )
                         # Continue anyway - some servers send other messages first
 
                     # Start the subscription
                     logger.debug(
-                        f"[SUBSCRIPTION:{subscription_name}] Starting GraphQL subscription..."
+                        "[SUBSCRIPTION:%s] Starting GraphQL subscription...", subscription_name
                     )
                     start_type = (
                         "subscribe" if selected_proto == "graphql-transport-ws" else "start"
@@ -678,16 +701,20 @@ class SubscriptionManager:
                     }
 
                     logger.debug(
-                        f"[SUBSCRIPTION:{subscription_name}] Subscription message type: {start_type}"
+                        "[SUBSCRIPTION:%s] Subscription message type: %s",
+                        subscription_name,
+                        start_type,
                     )
-                    logger.debug(f"[SUBSCRIPTION:{subscription_name}] Query: {query[:100]}...")
+                    logger.debug("[SUBSCRIPTION:%s] Query: %s...", subscription_name, query[:100])
                     logger.debug(
-                        f"[SUBSCRIPTION:{subscription_name}] Variables: {redact_sensitive(variables)}"
+                        "[SUBSCRIPTION:%s] Variables: %s",
+                        subscription_name,
+                        redact_sensitive(variables),
                     )
 
                     await websocket.send(json.dumps(subscription_message))
                     logger.info(
-                        f"[SUBSCRIPTION:{subscription_name}] Subscription started successfully"
+                        "[SUBSCRIPTION:%s] Subscription started successfully", subscription_name
                     )
                     self._set_connection_state(subscription_name, "subscribed")
                     self._connection_semaphore.release()
@@ -755,30 +782,30 @@ class SubscriptionManager:
 
             except TimeoutError:
                 error_msg = "Connection or authentication timeout"
-                logger.error(f"[WEBSOCKET:{subscription_name}] {error_msg}")
+                logger.error("[WEBSOCKET:%s] %s", subscription_name, error_msg)
                 self._set_connection_state(subscription_name, "timeout", error_msg)
 
             except websockets.exceptions.ConnectionClosed as e:
                 error_msg = f"WebSocket connection closed: {e}"
-                logger.warning(f"[WEBSOCKET:{subscription_name}] {error_msg}")
+                logger.warning("[WEBSOCKET:%s] %s", subscription_name, error_msg)
                 self._set_connection_state(subscription_name, "disconnected", error_msg)
 
             except websockets.exceptions.InvalidURI as e:
                 error_msg = f"Invalid WebSocket URI: {e}"
-                logger.error(f"[WEBSOCKET:{subscription_name}] {error_msg}")
+                logger.error("[WEBSOCKET:%s] %s", subscription_name, error_msg)
                 self._set_connection_state(subscription_name, "invalid_uri", error_msg)
                 break  # Don't retry on invalid URI
 
             except ValueError as e:
                 # Non-retryable configuration error (e.g. UNRAID_API_URL not set)
                 error_msg = f"Configuration error: {e}"
-                logger.error(f"[WEBSOCKET:{subscription_name}] {error_msg}")
+                logger.error("[WEBSOCKET:%s] %s", subscription_name, error_msg)
                 self._set_connection_state(subscription_name, "error", error_msg)
                 break  # Don't retry on configuration errors
 
             except Exception as e:
                 error_msg = f"Unexpected error: {e}"
-                logger.error(f"[WEBSOCKET:{subscription_name}] {error_msg}", exc_info=True)
+                logger.error("[WEBSOCKET:%s] %s", subscription_name, error_msg, exc_info=True)
                 self._set_connection_state(subscription_name, "error", error_msg)
 
             finally:
@@ -794,21 +821,27 @@ class SubscriptionManager:
             if reset_attempts:
                 self.reconnect_attempts[subscription_name] = 0
                 logger.info(
-                    f"[WEBSOCKET:{subscription_name}] Connection lasted {connected_duration:.0f}s "
-                    f"(>= {_STABLE_CONNECTION_SECONDS}s) — reset attempt counter"
+                    "[WEBSOCKET:%s] Connection lasted %.0fs (>= %ss) — reset attempt counter",
+                    subscription_name,
+                    connected_duration,
+                    _STABLE_CONNECTION_SECONDS,
                 )
             else:
                 logger.warning(
-                    f"[WEBSOCKET:{subscription_name}] Connection lasted {connected_duration:.0f}s "
-                    f"(< {_STABLE_CONNECTION_SECONDS}s) — attempt counter climbing toward give-up"
+                    "[WEBSOCKET:%s] Connection lasted %.0fs (< %ss) — attempt counter climbing toward give-up",
+                    subscription_name,
+                    connected_duration,
+                    _STABLE_CONNECTION_SECONDS,
                 )
 
             # Full jitter on the actual sleep decorrelates the ~14 concurrent loops so a
             # shared-backend outage doesn't produce synchronized reconnect bursts (PERF-H2).
             sleep_for = random.uniform(retry_delay * 0.5, retry_delay)  # noqa: S311 — jitter, not crypto
             logger.info(
-                f"[WEBSOCKET:{subscription_name}] Reconnecting in {sleep_for:.1f}s "
-                f"(backoff {retry_delay:.1f}s)..."
+                "[WEBSOCKET:%s] Reconnecting in %.1fs (backoff %.1fs)...",
+                subscription_name,
+                sleep_for,
+                retry_delay,
             )
             self._set_connection_state(subscription_name, "reconnecting")
             await asyncio.sleep(sleep_for)
@@ -827,9 +860,9 @@ class SubscriptionManager:
                 async with self._data_lock:
                     self.resource_data.pop(subscription_name, None)
         logger.info(
-            f"[SUBSCRIPTION:{subscription_name}] Subscription loop ended — "
-            f"removed from active_subscriptions. Final state: "
-            f"{self.connection_states.get(subscription_name, 'unknown')}"
+            "[SUBSCRIPTION:%s] Subscription loop ended — removed from active_subscriptions. Final state: %s",
+            subscription_name,
+            self.connection_states.get(subscription_name, "unknown"),
         )
 
     async def get_resource_data(self, resource_name: str) -> dict[str, Any] | None:
@@ -991,7 +1024,7 @@ class SubscriptionManager:
 
             status[sub_name] = sub_status
 
-        logger.debug(f"[SUBSCRIPTION_MANAGER] Generated status for {len(status)} subscriptions")
+        logger.debug("[SUBSCRIPTION_MANAGER] Generated status for %s subscriptions", len(status))
         return status
 
     async def get_summary(self) -> dict[str, Any]:
@@ -83,6 +83,8 @@ _WS_CLOSE_TIMEOUT: int = 10
 _WS_ACK_TIMEOUT: float = 30.0
 # Deadline for the diagnostics probe's first post-subscribe frame recv().
 _WS_FIRST_FRAME_TIMEOUT: float = 5.0
+# graphql-transport-ws keepalive reply; constant, so encoded once.
+_PONG_FRAME: str = json.dumps({"type": "pong"})
 
 
 class ProtocolError(Exception):
@@ -179,7 +181,7 @@ async def iter_messages(
             msg_type = msg.get("type")
 
             if msg_type == "ping":
-                await ws.send(json.dumps({"type": "pong"}))
+                await ws.send(_PONG_FRAME)
                 continue
 
             if msg_type == expected_data_type and msg.get("id") == sub_id:
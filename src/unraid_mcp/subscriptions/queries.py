@@ -1,5 +1,8 @@
 """GraphQL subscription query strings for snapshot and collect operations."""
 
+from ..core.utils import compact_query
+
+
 # Subscriptions that only emit on state changes (not on a regular interval).
 # When subscribe_once times out for these, it means no recent change — not an error.
 EVENT_DRIVEN_ACTIONS: frozenset[str] = frozenset(
@@ -14,6 +17,7 @@ EVENT_DRIVEN_ACTIONS: frozenset[str] = frozenset(
     }
 )
 
+
 SNAPSHOT_ACTIONS = {
     "cpu": """
         subscription { systemMetricsCpu { id percentTotal cpus { percentTotal percentUser percentSystem percentIdle } } }
@@ -58,6 +62,8 @@ SNAPSHOT_ACTIONS = {
         subscription { systemMetricsNetwork { id name operstate bytesReceived bytesSent packetsReceived packetsSent receiveErrors transmitErrors receiveDropped transmitDropped rxSec txSec utilizationPercent lastUpdated } }
     """,
 }
+# Re-sent on every subscribe frame, so drop the literals' indentation once here.
+SNAPSHOT_ACTIONS = {action: compact_query(q) for action, q in SNAPSHOT_ACTIONS.items()}
 
 COLLECT_ACTIONS = {
     "notification_feed": """
@@ -70,3 +76,4 @@ COLLECT_ACTIONS = {
         subscription PluginInstallUpdates($operationId: ID!) { pluginInstallUpdates(operationId: $operationId) { operationId status output timestamp } }
     """,
 }
+COLLECT_ACTIONS = {action: compact_query(q) for action, q in COLLECT_ACTIONS.items()}
@@ -106,7 +106,7 @@ async def autostart_subscriptions() -> None:
         await subscription_manager.auto_start_all_subscriptions()
         logger.info("[AUTOSTART] Auto-start process completed successfully")
     except Exception as e:
-        logger.error(f"[AUTOSTART] Failed during auto-start process: {e}", exc_info=True)
+        logger.error("[AUTOSTART] Failed during auto-start process: %s", e, exc_info=True)
         raise  # Propagate so ensure_subscriptions_started doesn't mark as started
 
     # Optional log file subscription
@@ -116,21 +116,21 @@ async def autostart_subscriptions() -> None:
         default_path = "/var/log/syslog"
         if await anyio.Path(default_path).exists():
             log_path = default_path
-            logger.info(f"[AUTOSTART] Using default log path: {default_path}")
+            logger.info("[AUTOSTART] Using default log path: %s", default_path)
 
     if log_path:
         try:
-            logger.info(f"[AUTOSTART] Starting log file subscription for: {log_path}")
+            logger.info("[AUTOSTART] Starting log file subscription for: %s", log_path)
             query = subscription_manager.get_subscription_query("logFileSubscription")
             if query:
                 await subscription_manager.start_subscription(
                     "logFileSubscription", query, {"path": log_path}
                 )
-                logger.info(f"[AUTOSTART] Log file subscription started for: {log_path}")
+                logger.info("[AUTOSTART] Log file subscription started for: %s", log_path)
             else:
                 logger.error("[AUTOSTART] logFileSubscription config not found")
         except Exception as e:
-            logger.error(f"[AUTOSTART] Failed to start log file subscription: {e}", exc_info=True)
+            logger.error("[AUTOSTART] Failed to start log file subscription: %s", e, exc_info=True)
     else:
         logger.info("[AUTOSTART] No log file path configured for auto-start")
 
@@ -1,5 +1,6 @@
 """Shared utilities for the subscription system."""
 
+import functools
 import ssl as _ssl
 from typing import Any
 
@@ -41,6 +42,9 @@ def build_ws_url() -> str:
 def build_ws_ssl_context(ws_url: str) -> _ssl.SSLContext | None:
     """Build an SSL context for WebSocket connections when using wss://.
 
+    The context is cached per UNRAID_VERIFY_SSL value, so every snapshot and
+    subscription connection reuses one context instead of reloading the CA store.
+
     Args:
         ws_url: The WebSocket URL to connect to.
 
@@ -49,9 +53,14 @@ def build_ws_ssl_context(ws_url: str) -> _ssl.SSLContext | None:
     """
     if not ws_url.startswith("wss://"):
         return None
-    if isinstance(_settings.UNRAID_VERIFY_SSL, str):
-        return _ssl.create_default_context(cafile=_settings.UNRAID_VERIFY_SSL)
-    if _settings.UNRAID_VERIFY_SSL:
+    return _ssl_context_for(_settings.UNRAID_VERIFY_SSL)
+
+
+@functools.lru_cache(maxsize=4)
+def _ssl_context_for(verify: bool | str) -> _ssl.SSLContext:
+    if isinstance(verify, str):
+        return _ssl.create_default_context(cafile=verify)
+    if verify:
         return _ssl.create_default_context()
     # Explicitly disable verification (equivalent to verify=False)
     ctx = _ssl.SSLContext(_ssl.PROTOCOL_TLS_CLIENT)
@@ -72,6 +81,12 @@ def build_connection_init() -> dict[str, Any]:
     return msg
 
 
+# Connection states that count as a current failure in diagnostics summaries.
+_ERROR_STATES: frozenset[str] = frozenset(
+    {"error", "auth_failed", "timeout", "max_retries_exceeded", "invalid_uri"}
+)
+
+
 def analyze_subscription_status(
     status: dict[str, Any],
 ) -> tuple[int, list[dict[str, Any]]]:
@@ -89,24 +104,23 @@ def analyze_subscription_status(
     Returns:
         Tuple of (error_count, connection_issues_list).
     """
-    _error_states = frozenset(
-        {"error", "auth_failed", "timeout", "max_retries_exceeded", "invalid_uri"}
-    )
     error_count = 0
     connection_issues: list[dict[str, Any]] = []
 
     for sub_name, sub_status in status.items():
         runtime = sub_status.get("runtime", {})
         conn_state = runtime.get("connection_state", "unknown")
-        if conn_state in _error_states:
-            error_count += 1
+        if conn_state not in _ERROR_STATES:
+            continue
+        error_count += 1
         # Gate on current failure state so recovered subscriptions are not reported
-        if runtime.get("last_error") and conn_state in _error_states:
+        last_error = runtime.get("last_error")
+        if last_error:
             connection_issues.append(
                 {
                     "subscription": sub_name,
                     "state": conn_state,
-                    "error": runtime["last_error"],
+                    "error": last_error,
                 }
             )
 
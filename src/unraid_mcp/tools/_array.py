@@ -15,6 +15,7 @@ from ..core.exceptions import ToolError, tool_error_handler
 from ..core.guards import gate_destructive_action
 from ..core.pagination import cap_list
 from ..core.utils import coerce_list, safe_get, validate_subaction
+from ._system import invalidate_system_reads
 
 
 # ===========================================================================
@@ -48,8 +49,8 @@ _ARRAY_MUTATIONS: dict[str, str] = {
     "clear_disk_stats": "mutation ClearDiskStats($id: PrefixedID!) { array { clearArrayDiskStatistics(id: $id) } }",
 }
 
-_ARRAY_SUBACTIONS: set[str] = set(_ARRAY_QUERIES) | set(_ARRAY_MUTATIONS)
-_ARRAY_DESTRUCTIVE: set[str] = {"remove_disk", "clear_disk_stats", "stop_array"}
+_ARRAY_SUBACTIONS: frozenset[str] = frozenset(set(_ARRAY_QUERIES) | set(_ARRAY_MUTATIONS))
+_ARRAY_DESTRUCTIVE: frozenset[str] = frozenset({"remove_disk", "clear_disk_stats", "stop_array"})
 
 # Maps each non-list subaction to the GraphQL key chain for its meaningful result
 # subtree, so the handler projects to that subtree under `data` instead of echoing
@@ -95,8 +96,12 @@ async def _handle_array(
         },
     )
 
-    with tool_error_handler("array", subaction, logger):
-        logger.info(f"Executing unraid action=array subaction={subaction}")
+    # Array mutations change the md* fields of the memoised system/variables.
+    with (
+        tool_error_handler("array", subaction, logger),
+        invalidate_system_reads(subaction in _ARRAY_MUTATIONS),
+    ):
+        logger.info("Executing unraid action=array subaction=%s", subaction)
 
         if subaction in _ARRAY_QUERIES:
             data = await _client.make_graphql_request(_ARRAY_QUERIES[subaction])
@@ -13,8 +13,9 @@ from ..config.logging import logger
 from ..core import client as _client
 from ..core.exceptions import ToolError, tool_error_handler
 from ..core.guards import gate_destructive_action
-from ..core.utils import mutation_success, validate_subaction
+from ..core.utils import compact_query, mutation_success, validate_subaction
 from ..core.validation import validate_input_mapping
+from ._system import invalidate_system_reads
 
 
 # ===========================================================================
@@ -34,6 +35,7 @@ _CONNECT_QUERIES: dict[str, str] = {
         }
     """,
 }
+_CONNECT_QUERIES = {name: compact_query(q) for name, q in _CONNECT_QUERIES.items()}
 
 _CONNECT_MUTATIONS: dict[str, str] = {
     "update_api_settings": "mutation UpdateApiSettings($input: ConnectSettingsInput!) { updateApiSettings(input: $input) { accessType forwardType port } }",
@@ -43,16 +45,30 @@ _CONNECT_MUTATIONS: dict[str, str] = {
     "enable_dynamic_remote_access": "mutation EnableDynamicRemoteAccess($input: EnableDynamicRemoteAccessInput!) { enableDynamicRemoteAccess(input: $input) }",
 }
 
-_CONNECT_SUBACTIONS: set[str] = set(_CONNECT_QUERIES) | set(_CONNECT_MUTATIONS)
+_CONNECT_SUBACTIONS: frozenset[str] = frozenset(set(_CONNECT_QUERIES) | set(_CONNECT_MUTATIONS))
 # Every Connect mutation changes the server's remote-access / cloud security
 # posture (signing in/out, registering with the cloud, or changing internet
 # reachability), so all are gated behind explicit confirmation.
-_CONNECT_DESTRUCTIVE: set[str] = {
-    "sign_in",
-    "sign_out",
-    "update_api_settings",
-    "setup_remote_access",
-    "enable_dynamic_remote_access",
+_CONNECT_DESTRUCTIVE: frozenset[str] = frozenset(
+    {
+        "sign_in",
+        "sign_out",
+        "update_api_settings",
+        "setup_remote_access",
+        "enable_dynamic_remote_access",
+    }
+)
+_CONNECT_CONFIRM_DESCRIPTIONS: dict[str, str] = {
+    "sign_in": "Sign this server in to Unraid Connect. This registers the server "
+    "with the cloud service and enables remote management.",
+    "sign_out": "Sign this server out of Unraid Connect. Remote access via "
+    "Connect will stop working until you sign back in.",
+    "update_api_settings": "Change the Unraid Connect remote-access configuration "
+    "(access type / forward type / port). This affects internet reachability.",
+    "setup_remote_access": "Reconfigure Unraid Connect remote access. This can "
+    "expose the server to the internet (UPnP/port forwarding).",
+    "enable_dynamic_remote_access": "Toggle dynamic remote access for Unraid "
+    "Connect, changing how/whether the server is reachable remotely.",
 }
 
 # Mutations whose input is supplied via the shared `connect_input` dict.
@@ -112,22 +128,16 @@ async def _handle_connect(
         subaction,
         _CONNECT_DESTRUCTIVE,
         confirm,
-        {
-            "sign_in": "Sign this server in to Unraid Connect. This registers the server "
-            "with the cloud service and enables remote management.",
-            "sign_out": "Sign this server out of Unraid Connect. Remote access via "
-            "Connect will stop working until you sign back in.",
-            "update_api_settings": "Change the Unraid Connect remote-access configuration "
-            "(access type / forward type / port). This affects internet reachability.",
-            "setup_remote_access": "Reconfigure Unraid Connect remote access. This can "
-            "expose the server to the internet (UPnP/port forwarding).",
-            "enable_dynamic_remote_access": "Toggle dynamic remote access for Unraid "
-            "Connect, changing how/whether the server is reachable remotely.",
-        },
+        _CONNECT_CONFIRM_DESCRIPTIONS,
     )
 
-    with tool_error_handler("connect", subaction, logger):
-        logger.info(f"Executing unraid action=connect subaction={subaction}")
+    # Sign-in/out and remote-access changes move the owner, servers and network
+    # reads the system memo holds.
+    with (
+        tool_error_handler("connect", subaction, logger),
+        invalidate_system_reads(subaction in _CONNECT_MUTATIONS),
+    ):
+        logger.info("Executing unraid action=connect subaction=%s", subaction)
 
         if subaction in _CONNECT_QUERY_OUTPUTS:
             response_key = _CONNECT_QUERY_OUTPUTS[subaction]
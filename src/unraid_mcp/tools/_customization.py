@@ -18,8 +18,9 @@ from typing import Any
 from ..config.logging import logger
 from ..core import client as _client
 from ..core.exceptions import ToolError, tool_error_handler
-from ..core.utils import safe_get, validate_subaction
+from ..core.utils import compact_query, safe_get, validate_subaction
 from ..core.validation import validate_str_param
+from ._system import invalidate_system_reads
 
 
 # ===========================================================================
@@ -52,13 +53,16 @@ _CUSTOMIZATION_QUERIES: dict[str, str] = {
         }
     """,
 }
+_CUSTOMIZATION_QUERIES = {name: compact_query(q) for name, q in _CUSTOMIZATION_QUERIES.items()}
 
 _CUSTOMIZATION_MUTATIONS: dict[str, str] = {
     "set_theme": "mutation SetTheme($theme: ThemeName!) { customization { setTheme(theme: $theme) { name showBannerImage showBannerGradient showHeaderDescription } } }",
     "set_locale": "mutation SetLocale($locale: String!) { customization { setLocale(locale: $locale) } }",
 }
 
-_CUSTOMIZATION_SUBACTIONS: set[str] = set(_CUSTOMIZATION_QUERIES) | set(_CUSTOMIZATION_MUTATIONS)
+_CUSTOMIZATION_SUBACTIONS: frozenset[str] = frozenset(
+    set(_CUSTOMIZATION_QUERIES) | set(_CUSTOMIZATION_MUTATIONS)
+)
 
 
 def _required_customization_root(data: dict[str, Any]) -> dict[str, Any]:
@@ -80,8 +84,12 @@ async def _handle_customization(
 ) -> dict[str, Any]:
     validate_subaction(subaction, _CUSTOMIZATION_SUBACTIONS, "customization")
 
-    with tool_error_handler("customization", subaction, logger):
-        logger.info(f"Executing unraid action=customization subaction={subaction}")
+    # The locale is stored in vars, which system/variables memoises.
+    with (
+        tool_error_handler("customization", subaction, logger),
+        invalidate_system_reads(subaction in _CUSTOMIZATION_MUTATIONS),
+    ):
+        logger.info("Executing unraid action=customization subaction=%s", subaction)
 
         if subaction == "details":
             data = await _client.make_graphql_request(_CUSTOMIZATION_QUERIES["details"])
@@ -93,7 +101,7 @@ async def _handle_customization(
                 return {"isFreshInstall": data.get("isFreshInstall")}
             if subaction == "sso_enabled":
                 return {"isSSOEnabled": data.get("isSSOEnabled")}
-            return dict(data)
+            return data
 
         if subaction == "set_theme":
             if not theme_name:
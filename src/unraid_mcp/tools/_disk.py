@@ -1,11 +1,12 @@
 """Disk domain handler for the Unraid MCP tool.
 
-Covers: shares, disks, disk_details, log_files, logs, flash_backup* (6 subactions).
+Covers: shares, disks, overview, disk_details, log_files, logs, flash_backup* (7 subactions).
 """
 
 import posixpath
 from typing import Any
 
+import httpx
 from fastmcp import Context
 
 from ..config.logging import logger
@@ -15,6 +16,7 @@ from ..core.exceptions import ToolError, tool_error_handler
 from ..core.guards import gate_destructive_action
 from ..core.pagination import cap_list
 from ..core.utils import (
+    coerce_list,
     count_log_matches,
     filter_log_lines,
     format_bytes,
@@ -37,19 +39,62 @@ _DISK_QUERIES: dict[str, str] = {
     "disks": "query ListPhysicalDisks { disks { id device name } }",
     "disk_details": "query GetDiskDetails($id: PrefixedID!) { disk(id: $id) { id device name serialNum size temperature } }",
     "log_files": "query ListLogFiles { logFiles { name path size modifiedAt } }",
-    "logs": "query GetLogContent($path: String!, $lines: Int) { logFile(path: $path, lines: $lines) { path content totalLines startLine } }",
+    "logs": "query GetLogContent($path: String!, $lines: Int, $startLine: Int) { logFile(path: $path, lines: $lines, startLine: $startLine) { path content totalLines startLine } }",
 }
 
+
+def _root_selection(query: str) -> str:
+    """Return the root selection set of a variable-free query, without its braces."""
+    return query[query.index("{") + 1 : query.rindex("}")].strip()
+
+
+# One round trip for the three variable-free listings a storage dashboard
+# needs. Built from the single-subaction queries so the selections cannot drift.
+_DISK_OVERVIEW_SECTIONS = ("shares", "disks", "log_files")
+_DISK_QUERIES["overview"] = (
+    "query GetDiskOverview { "
+    + " ".join(_root_selection(_DISK_QUERIES[name]) for name in _DISK_OVERVIEW_SECTIONS)
+    + " }"
+)
+
 _DISK_MUTATIONS: dict[str, str] = {
     "flash_backup": "mutation InitiateFlashBackup($input: InitiateFlashBackupInput!) { initiateFlashBackup(input: $input) { status jobId } }",
 }
 
-_DISK_SUBACTIONS: set[str] = set(_DISK_QUERIES) | set(_DISK_MUTATIONS)
-_DISK_DESTRUCTIVE: set[str] = {"flash_backup"}
+_DISK_SUBACTIONS: frozenset[str] = frozenset(set(_DISK_QUERIES) | set(_DISK_MUTATIONS))
+_DISK_DESTRUCTIVE: frozenset[str] = frozenset({"flash_backup"})
 _ALLOWED_LOG_PREFIXES = ("/var/log/", "/boot/logs/")
+
+# Plain list reads differ only in their result field and response key, so they
+# share one table probe instead of a branch each (mirrors _KEY_LIST_READS).
+_DISK_LIST_READS: dict[str, tuple[str, str]] = {
+    "disks": ("disks", "disks"),
+    "log_files": ("logFiles", "log_files"),
+}
+# Subactions that touch physical disks can spin them up; give them the longer
+# DISK_TIMEOUT. Everything else uses the client default.
+_DISK_TIMEOUTS: dict[str, httpx.Timeout] = {
+    "disks": DISK_TIMEOUT,
+    "disk_details": DISK_TIMEOUT,
+    "overview": DISK_TIMEOUT,
+}
 _MAX_TAIL_LINES = 10_000
 
 
+def _log_content_byte_budget() -> int:
+    """Byte budget for disk/logs content.
+
+    A few long lines can push even a short tail past the response-size backstop,
+    which discards the whole response, so trim to whole lines under half the cap
+    (same margin as the live collectors).
+    """
+    # Local import to read the current value; a module-level name would be
+    # captured at import time and miss a settings reload (see core/client.py).
+    from ..config import settings as _settings
+
+    return max(1, _settings.UNRAID_MCP_MAX_RESPONSE_BYTES // 2)
+
+
 def _path_within_base(normalized: str, base: str) -> bool:
     """Boundary-correct containment check: ``normalized`` is ``base`` or under it.
 
@@ -106,12 +151,62 @@ def _validate_path(
     if exact_or_prefix:
         allowed = any(_path_within_base(normalized, p) for p in allowed_prefixes)
     else:
-        allowed = any(normalized.startswith(p) for p in allowed_prefixes)
+        allowed = normalized.startswith(allowed_prefixes)
     if not allowed:
         raise ToolError(f"{label} must start with one of: {', '.join(allowed_prefixes)}")
     return normalized
 
 
+def _line_count(text: str) -> int:
+    """Number of lines in ``text``, not counting a trailing newline as a new line."""
+    if not text:
+        return 0
+    return text.count("\n") + (0 if text.endswith("\n") else 1)
+
+
+def _cap_log_content(content: str, budget: int, *, keep_head: bool) -> str:
+    """Trim ``content`` to whole lines that fit in ``budget`` UTF-8 bytes.
+
+    Keeps the newest lines when tailing, or the first lines when reading forward
+    from a start line. A single line longer than the budget is cut at the byte
+    boundary instead. Returns ``content`` unchanged when it already fits.
+    """
+    encoded = content.encode()
+    if len(encoded) <= budget:
+        return content
+    if keep_head:
+        chunk = encoded[:budget]
+        cut = chunk.rfind(b"\n")
+        if cut > 0:
+            chunk = chunk[:cut]
+    else:
+        chunk = encoded[-budget:]
+        cut = chunk.find(b"\n")
+        if 0 <= cut < len(chunk) - 1:
+            chunk = chunk[cut + 1 :]
+    return chunk.decode(errors="ignore")
+
+
+def _shape_shares(data: dict[str, Any], limit: int | None) -> dict[str, Any]:
+    shares = coerce_list(data.get("shares"))
+    # `id` is no longer selected (see _DISK_QUERIES["shares"]); synthesize
+    # a stable id from `name` so downstream consumers expecting an `id`
+    # key still get one. `name` is the stable share identifier.
+    for share in shares:
+        if isinstance(share, dict) and not share.get("id"):
+            share["id"] = share.get("name")
+    # Cap AFTER id synthesis so synthesized ids are stable for the
+    # rows that are actually returned.
+    capped, meta = cap_list(shares, limit)
+    return {"shares": capped, "page": meta}
+
+
+def _shape_list_read(data: dict[str, Any], subaction: str, limit: int | None) -> dict[str, Any]:
+    field, result_key = _DISK_LIST_READS[subaction]
+    capped, page = cap_list(coerce_list(data.get(field)), limit)
+    return {result_key: capped, "page": page}
+
+
 async def _handle_disk(
     subaction: str,
     disk_id: str | None,
@@ -126,6 +221,7 @@ async def _handle_disk(
     level: str | None = None,
     context: int = 2,
     limit: int | None = None,
+    start_line: int | None = None,
 ) -> dict[str, Any]:
     validate_subaction(subaction, _DISK_SUBACTIONS, "disk")
 
@@ -140,7 +236,7 @@ async def _handle_disk(
     )
 
     with tool_error_handler("disk", subaction, logger):
-        logger.info(f"Executing unraid action=disk subaction={subaction}")
+        logger.info("Executing unraid action=disk subaction=%s", subaction)
         if subaction == "disk_details" and not disk_id:
             raise ToolError("disk_id is required for disk/disk_details")
 
@@ -149,6 +245,8 @@ async def _handle_disk(
                 raise ToolError(
                     f"tail_lines must be between 1 and {_MAX_TAIL_LINES}, got {tail_lines}"
                 )
+            if start_line is not None and start_line < 1:
+                raise ToolError(f"start_line must be 1 or greater, got {start_line}")
             if not log_path:
                 raise ToolError("log_path is required for disk/logs")
             log_path = _validate_path(log_path, _ALLOWED_LOG_PREFIXES, "log_path")
@@ -186,12 +284,14 @@ async def _handle_disk(
                 raise ToolError("Failed to start flash backup: no confirmation from server")
             return {"success": True, "subaction": "flash_backup", "data": backup}
 
-        custom_timeout = DISK_TIMEOUT if subaction in ("disks", "disk_details") else None
+        custom_timeout = _DISK_TIMEOUTS.get(subaction)
         variables: dict[str, Any] | None = None
         if subaction == "disk_details":
             variables = {"id": disk_id}
         elif subaction == "logs":
             variables = {"path": log_path, "lines": tail_lines}
+            if start_line is not None:
+                variables["startLine"] = start_line
 
         # Guard the lookup so an unhandled subaction raises the clean guard below
         # instead of a raw KeyError (#5).
@@ -200,21 +300,18 @@ async def _handle_disk(
             raise ToolError(f"Unhandled disk subaction '{subaction}' — this is a bug")
         data = await _client.make_graphql_request(query, variables, custom_timeout=custom_timeout)
 
+        if subaction in _DISK_LIST_READS:
+            return _shape_list_read(data, subaction, limit)
         if subaction == "shares":
-            shares = data.get("shares", []) or []
-            # `id` is no longer selected (see _DISK_QUERIES["shares"]); synthesize
-            # a stable id from `name` so downstream consumers expecting an `id`
-            # key still get one. `name` is the stable share identifier.
-            for share in shares:
-                if isinstance(share, dict) and not share.get("id"):
-                    share["id"] = share.get("name")
-            # Cap AFTER id synthesis so synthesized ids are stable for the
-            # rows that are actually returned.
-            capped, meta = cap_list(shares, limit)
-            return {"shares": capped, "page": meta}
-        if subaction == "disks":
-            capped, meta = cap_list(data.get("disks", []), limit)
-            return {"disks": capped, "page": meta}
+            return _shape_shares(data, limit)
+        if subaction == "overview":
+            return {
+                "shares": _shape_shares(data, limit),
+                **{
+                    result_key: _shape_list_read(data, name, limit)
+                    for name, (_, result_key) in _DISK_LIST_READS.items()
+                },
+            }
         if subaction == "disk_details":
             raw = data.get("disk", {})
             if not raw:
@@ -232,9 +329,6 @@ async def _handle_disk(
                 },
                 "details": raw,
             }
-        if subaction == "log_files":
-            capped, page = cap_list(data.get("logFiles", []), limit)
-            return {"log_files": capped, "page": page}
         if subaction == "logs":
             result = data.get("logFile")
             if not result:
@@ -247,6 +341,27 @@ async def _handle_disk(
                 out["matchedLines"] = count_log_matches(lines, level=level)
                 out["returnedLines"] = sum(1 for line in filtered if line != "---")
                 out["filter"] = {"level": level, "context": context}
+            content = out.get("content")
+            if isinstance(content, str):
+                reading_forward = start_line is not None
+                kept = _cap_log_content(
+                    content, _log_content_byte_budget(), keep_head=reading_forward
+                )
+                if len(kept) < len(content):
+                    kept_lines = _line_count(kept)
+                    out["content"] = kept
+                    out["truncated"] = True
+                    omitted = _line_count(content) - kept_lines
+                    out["omittedLines"] = omitted
+                    if "returnedLines" in out:
+                        out["returnedLines"] = sum(1 for line in kept.split("\n") if line != "---")
+                    # Line numbers only map back to the file when unfiltered.
+                    first = out.get("startLine")
+                    if omitted and level is None and isinstance(first, int):
+                        # Forward reads continue after the kept lines; tails
+                        # kept the newest lines, so the omitted ones start at
+                        # the original first line and can be read forward.
+                        out["nextStartLine"] = first + kept_lines if reading_forward else first
             return out
 
         # Distinct from the guard above the query lookup: this catches a subaction
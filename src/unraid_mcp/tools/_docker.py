@@ -9,8 +9,10 @@ move_items_to_position, update_view_preferences (25 subactions, plus a deprecate
 `logs` stub that returns an informative ToolError — not counted).
 """
 
-import re
-from collections.abc import Sequence
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
 from typing import Any, TypedDict
 
 from fastmcp import Context
@@ -20,7 +22,7 @@ from ..core import client as _client
 from ..core.exceptions import ToolError, tool_error_handler
 from ..core.guards import gate_destructive_action
 from ..core.pagination import cap_list
-from ..core.utils import mutation_success, safe_get, validate_subaction
+from ..core.utils import coerce_list, mutation_success, safe_get, validate_subaction
 from ..core.validation import validate_input_mapping, validate_input_mapping_list
 
 
@@ -36,7 +38,7 @@ _DOCKER_QUERIES: dict[str, str] = {
     "details": "query GetContainerDetails($id: PrefixedID!) { docker { container(id: $id) { id names image imageId command created ports { ip privatePort publicPort type } sizeRootFs labels state status hostConfig { networkMode } networkSettings mounts autoStart } } }",
     # The "ports" subaction still needs every running container's bindings, so
     # it keeps a list-based query (trimmed to just ports + state + names).
-    "ports": "query GetContainerPorts { docker { containers { id names state ports { ip privatePort publicPort type } } } }",
+    "ports": "query GetContainerPorts { docker { containers { names state ports { ip privatePort publicPort type } } } }",
     "networks": "query GetDockerNetworks { docker { networks { id name driver scope } } }",
     "network_details": "query GetDockerNetwork { docker { networks { id name driver scope enableIPv6 internal attachable containers options labels } } }",
 }
@@ -44,6 +46,8 @@ _DOCKER_QUERIES: dict[str, str] = {
 # Internal query used only for container ID resolution — not a public subaction.
 _DOCKER_RESOLVE_QUERY = "query ResolveContainerID { docker { containers { id names } } }"
 
+# restart maps to the API's own restart mutation: a single round trip, so there is
+# no client-side stop→start pair to pipeline or fuse into one document.
 _DOCKER_MUTATIONS: dict[str, str] = {
     "start": "mutation StartContainer($id: PrefixedID!) { docker { start(id: $id) { id names state status } } }",
     "stop": "mutation StopContainer($id: PrefixedID!) { docker { stop(id: $id) { id names state status } } }",
@@ -152,7 +156,7 @@ _DOCKER_ORGANIZER: dict[str, _OrganizerSpec] = {
 # recognised subaction so validation passes and the informative ToolError below
 # is returned rather than a generic "Invalid action" message.
 # "ports" has a dedicated list query and aggregates host port bindings client-side.
-_DOCKER_SUBACTIONS: set[str] = (
+_DOCKER_SUBACTIONS: frozenset[str] = frozenset(
     set(_DOCKER_QUERIES)
     | set(_DOCKER_MUTATIONS)
     | set(_DOCKER_BULK_MUTATIONS)
@@ -160,12 +164,43 @@ _DOCKER_SUBACTIONS: set[str] = (
     | set(_DOCKER_ORGANIZER)
     | {"logs"}
 )
-_DOCKER_NEEDS_CONTAINER_ID = {"start", "stop", "details", "restart", "unpause", "update_container"}
+_DOCKER_NEEDS_CONTAINER_ID: frozenset[str] = frozenset(
+    {"start", "stop", "details", "restart", "unpause", "update_container"}
+)
 # remove_container deletes the container (and optionally its image); reset_template_mappings
 # wipes user template path overrides; delete_entries removes organizer entries.
-_DOCKER_DESTRUCTIVE: set[str] = {"remove_container", "reset_template_mappings", "delete_entries"}
-_DOCKER_ID_PATTERN = re.compile(r"^[a-f0-9]{64}(:[a-z0-9]+)?$", re.IGNORECASE)
-_DOCKER_SHORT_ID_PATTERN = re.compile(r"^[a-f0-9]{12,63}$", re.IGNORECASE)
+_DOCKER_DESTRUCTIVE: frozenset[str] = frozenset(
+    {"remove_container", "reset_template_mappings", "delete_entries"}
+)
+# Docker IDs are fixed-shape hex strings, so membership checks against a char set
+# are cheaper than running the regex engine on every container call.
+_HEX_DIGITS: frozenset[str] = frozenset("0123456789abcdefABCDEF")
+_DOCKER_ID_LENGTH = 64
+_DOCKER_SHORT_ID_MIN_LENGTH = 12
+
+
+def _is_hex(value: str) -> bool:
+    # issuperset walks the string in C; an all() generator pays a frame per char.
+    return _HEX_DIGITS.issuperset(value)
+
+
+def _is_full_docker_id(value: str) -> bool:
+    """Return True for a 64-hex-char container ID with an optional ``:suffix``.
+
+    The suffix (e.g. ``:local``) must be non-empty ASCII alphanumerics.
+    """
+    if len(value) < _DOCKER_ID_LENGTH or not _is_hex(value[:_DOCKER_ID_LENGTH]):
+        return False
+    suffix = value[_DOCKER_ID_LENGTH:]
+    if not suffix:
+        return True
+    tail = suffix[1:]
+    return suffix[0] == ":" and tail.isascii() and tail.isalnum()
+
+
+def _is_short_docker_id(value: str) -> bool:
+    """Return True for a 12-63 char hex prefix of a container ID."""
+    return _DOCKER_SHORT_ID_MIN_LENGTH <= len(value) < _DOCKER_ID_LENGTH and _is_hex(value)
 
 
 def _container_names(c: dict[str, Any]) -> list[str]:
@@ -176,25 +211,124 @@ def _container_names(c: dict[str, Any]) -> list[str]:
     Filtering here keeps every name-matching path (``.lower()``, ``startswith``,
     ``', '.join(...)``) from raising on a ``None``.
     """
-    return [n for n in (c.get("names") or []) if isinstance(n, str)]
+    return [n for n in (c.get("names") or ()) if isinstance(n, str)]
 
 
-def _find_container(
-    identifier: str, containers: list[dict[str, Any]], *, strict: bool = False
-) -> dict[str, Any] | None:
+@dataclass(frozen=True, slots=True)
+class _ContainerIndex:
+    """Lookup tables over one container list, built once and reused per identifier.
+
+    ``by_key`` maps every container id and exact name to its container (first
+    occurrence wins, matching the old linear scan's order). ``lowered`` pairs each
+    container with its pre-lowercased names so the fuzzy substring pass doesn't
+    re-lowercase every name for every identifier resolved against the list.
+    ``sorted_names``/``sorted_owners`` hold every lowered name in sorted order with
+    the position of its container in ``lowered``, so the prefix pass is a bisect.
+    ``id_heads`` pairs each container with its lowered id minus the ``:suffix``, for
+    short-ID prefix matching.
+    """
+
+    containers: list[dict[str, Any]]
+    by_key: dict[str, dict[str, Any]]
+    lowered: tuple[tuple[dict[str, Any], tuple[str, ...]], ...]
+    names: tuple[str, ...]
+    sorted_names: tuple[str, ...]
+    sorted_owners: tuple[int, ...]
+    id_heads: tuple[tuple[dict[str, Any], str], ...]
+
+
+def _build_container_index(containers: list[dict[str, Any]]) -> _ContainerIndex:
+    by_key: dict[str, dict[str, Any]] = {}
+    lowered: list[tuple[dict[str, Any], tuple[str, ...]]] = []
+    id_heads: list[tuple[dict[str, Any], str]] = []
+    all_names: list[str] = []
     for c in containers:
-        if c.get("id") == identifier or identifier in _container_names(c):
-            return c
-    if strict:
+        names = _container_names(c)
+        cid = c.get("id")
+        if isinstance(cid, str):
+            by_key.setdefault(cid, c)
+        id_heads.append((c, cid.lower().split(":")[0] if isinstance(cid, str) else ""))
+        for n in names:
+            by_key.setdefault(n, c)
+        lowered.append((c, tuple(n.lower() for n in names)))
+        all_names.extend(names)
+    by_name = sorted((n, pos) for pos, (_, names) in enumerate(lowered) for n in names)
+    return _ContainerIndex(
+        containers,
+        by_key,
+        tuple(lowered),
+        tuple(all_names),
+        tuple(n for n, _ in by_name),
+        tuple(pos for _, pos in by_name),
+        tuple(id_heads),
+    )
+
+
+def _prefix_matches(index: _ContainerIndex, prefix: str) -> list[dict[str, Any]]:
+    """Containers with a name starting with ``prefix`` (lowered), in list order."""
+    owners: set[int] = set()
+    names = index.sorted_names
+    for i in range(bisect_left(names, prefix), len(names)):
+        if not names[i].startswith(prefix):
+            break
+        owners.add(index.sorted_owners[i])
+    return [index.lowered[pos][0] for pos in sorted(owners)]
+
+
+# Recently fetched container index, shared by docker/list and name resolution.
+# Resolving a name costs a full container-list round-trip, and agents tend to
+# touch the same containers in bursts (`list` then `details <name>`, or
+# `stop plex` then `start plex`), so the last index is reused for a few seconds.
+# Start/stop/restart don't change ids or names; the subactions that recreate or
+# delete containers (_DOCKER_RECREATES) drop the index and resolve against a
+# fresh list instead.
+_CONTAINER_INDEX_TTL_SECONDS = 5.0
+_container_index_cache: tuple[float, _ContainerIndex] | None = None
+_DOCKER_RECREATES = frozenset(
+    {"remove_container", "update_container", "update_containers", "update_all_containers"}
+)
+
+
+def _remember_container_index(index: _ContainerIndex) -> None:
+    global _container_index_cache
+    _container_index_cache = (time.monotonic(), index)
+
+
+def _recent_container_index() -> _ContainerIndex | None:
+    cached = _container_index_cache
+    if cached is None or time.monotonic() - cached[0] > _CONTAINER_INDEX_TTL_SECONDS:
         return None
+    return cached[1]
+
+
+def _forget_container_index() -> None:
+    global _container_index_cache
+    _container_index_cache = None
+
+
+def _find_container(
+    identifier: str,
+    containers: list[dict[str, Any]] | _ContainerIndex,
+    *,
+    strict: bool = False,
+) -> dict[str, Any] | None:
+    index = (
+        containers
+        if isinstance(containers, _ContainerIndex)
+        else _build_container_index(containers)
+    )
+    exact = index.by_key.get(identifier)
+    # A canonical 64-hex ID either hits the id table or matches nothing; don't
+    # lowercase and scan every name just to confirm the miss.
+    if exact is not None or strict or _is_full_docker_id(identifier):
+        return exact
     id_lower = identifier.lower()
-    # Collect prefix matches first, then fall back to substring matches.
-    # _container_names() filters out null/non-string names so .lower() is safe.
-    prefix_matches = [
-        c for c in containers if any(n.lower().startswith(id_lower) for n in _container_names(c))
-    ]
-    candidates = prefix_matches or [
-        c for c in containers if any(id_lower in n.lower() for n in _container_names(c))
+    # Collect prefix matches first (a bisect over the sorted names), then fall
+    # back to a linear substring pass.
+    # _container_names() filtered out null/non-string names, so the pre-lowered
+    # tuples only ever hold strings.
+    candidates = _prefix_matches(index, id_lower) or [
+        c for c, lowered in index.lowered if any(id_lower in n for n in lowered)
     ]
     if not candidates:
         return None
@@ -207,46 +341,199 @@ def _find_container(
     )
 
 
-async def _resolve_container_id(
-    container_id: str,
-    *,
-    strict: bool = False,
-    containers: list[dict[str, Any]] | None = None,
-) -> str:
-    if _DOCKER_ID_PATTERN.match(container_id):
-        return container_id
-    # Callers resolving several ids can pass a pre-fetched container list to avoid
-    # re-fetching the full list once per id (see docker/update_containers).
-    if containers is None:
-        data = await _client.make_graphql_request(_DOCKER_RESOLVE_QUERY)
-        containers = safe_get(data, "docker", "containers", default=[])
-    if _DOCKER_SHORT_ID_PATTERN.match(container_id):
+def _match_container_id(container_id: str, index: _ContainerIndex, *, strict: bool) -> str | None:
+    """Resolve ``container_id`` against one index; None when nothing matches."""
+    if _is_short_docker_id(container_id):
         id_lower = container_id.lower()
-        matches = [
-            c for c in containers if (c.get("id") or "").lower().split(":")[0].startswith(id_lower)
-        ]
+        matches = [c for c, head in index.id_heads if head.startswith(id_lower)]
         if len(matches) == 1:
             return str(matches[0].get("id", ""))
         if len(matches) > 1:
             raise ToolError(
                 f"Short ID prefix '{container_id}' is ambiguous. Matches: {', '.join(str(c.get('id', '')) for c in matches[:5])}."
             )
-    resolved = _find_container(container_id, containers, strict=strict)
-    if resolved:
-        return str(resolved.get("id", ""))
-    names: list[str] = []
-    for c in containers:
-        names.extend(_container_names(c))
+    resolved = _find_container(container_id, index, strict=strict)
+    return str(resolved.get("id", "")) if resolved else None
+
+
+def _match_cached_container_id(container_id: str) -> str | None:
+    """Resolve against the recent index, accepting only exact or short-ID hits.
+
+    Prefix/substring matching against a possibly stale list could settle on the
+    wrong container (``plex`` -> a cached ``plexpy`` after a ``plex`` container
+    was created), and an ambiguity there may be resolved since, so anything other
+    than an exact id/name hit or a unique short-ID prefix goes to a fresh fetch.
+    """
+    recent = _recent_container_index()
+    if recent is None:
+        return None
+    try:
+        return _match_container_id(container_id, recent, strict=True)
+    except ToolError:
+        return None
+
+
+async def _resolve_container_id(
+    container_id: str,
+    *,
+    strict: bool = False,
+    containers: list[dict[str, Any]] | _ContainerIndex | None = None,
+    use_cache: bool = True,
+) -> str:
+    resolved_id, _ = await _resolve_container(
+        container_id, strict=strict, containers=containers, use_cache=use_cache
+    )
+    return resolved_id
+
+
+async def _resolve_container(
+    container_id: str,
+    *,
+    strict: bool = False,
+    containers: list[dict[str, Any]] | _ContainerIndex | None = None,
+    use_cache: bool = True,
+) -> tuple[str, bool]:
+    """Resolve ``container_id`` to a full id, and say whether the recent index answered.
+
+    Mutations retry against a fresh list only when the id came from the index,
+    since only then can it be stale.
+    """
+    if _is_full_docker_id(container_id):
+        return container_id, False
+    # Callers resolving several ids can pass a pre-built index (or a pre-fetched
+    # container list) to avoid re-fetching and re-indexing once per id (see
+    # docker/update_containers). Otherwise try a recent index first; a miss there
+    # may just mean the container appeared since, so it falls through to a fetch.
+    if containers is None and use_cache:
+        cached_id = _match_cached_container_id(container_id)
+        if cached_id is not None:
+            return cached_id, True
+    if containers is None:
+        data = await _client.make_graphql_request(_DOCKER_RESOLVE_QUERY)
+        containers = _build_container_index(coerce_list(safe_get(data, "docker", "containers")))
+        if use_cache:
+            _remember_container_index(containers)
+    index = (
+        containers
+        if isinstance(containers, _ContainerIndex)
+        else _build_container_index(containers)
+    )
+    resolved_id = _match_container_id(container_id, index, strict=strict)
+    if resolved_id is not None:
+        return resolved_id, False
     msg = (
         f"Container '{container_id}' not found by exact match. Mutations require exact name or full ID."
         if strict
         else f"Container '{container_id}' not found."
     )
-    if names:
-        msg += f" Available: {', '.join(names[:10])}"
+    if index.names:
+        msg += f" Available: {', '.join(index.names[:10])}"
     raise ToolError(msg)
 
 
+# Read-only subactions share one signature and dispatch through a table built at
+# import, mirroring the tool-level _ACTION_DISPATCH, instead of walking a chain
+# of string comparisons. Mutations keep their own branches below because each
+# takes a different set of inputs.
+async def _docker_list(
+    container_id: str | None, network_id: str | None, limit: int | None
+) -> dict[str, Any]:
+    data = await _client.make_graphql_request(_DOCKER_QUERIES["list"])
+    containers = coerce_list(safe_get(data, "docker", "containers"))
+    _remember_container_index(_build_container_index(containers))
+    capped, meta = cap_list(containers, limit)
+    return {"containers": capped, "page": meta}
+
+
+async def _docker_details(
+    container_id: str | None, network_id: str | None, limit: int | None
+) -> dict[str, Any]:
+    # Resolution and the details fetch can't share one aliased document:
+    # container(id:) needs the id that resolution produces, and GraphQL
+    # variables can't be bound from another field in the same request.
+    # Fetching details for every container would fold it into a single
+    # round-trip, but only by bringing back the heavy fields the by-id
+    # query exists to avoid. Full IDs and a recent index skip resolution.
+    actual_id = await _resolve_container_id(container_id or "")
+    data = await _client.make_graphql_request(_DOCKER_QUERIES["details"], {"id": actual_id})
+    container = safe_get(data, "docker", "container", default=None)
+    if container:
+        return container
+    raise ToolError(f"Container '{container_id}' not found in details response.")
+
+
+async def _docker_ports(
+    container_id: str | None, network_id: str | None, limit: int | None
+) -> dict[str, Any]:
+    data = await _client.make_graphql_request(_DOCKER_QUERIES["ports"])
+    containers = safe_get(data, "docker", "containers", default=[])
+    bindings: list[dict[str, Any]] = []
+    for container in containers:
+        # Case-insensitive state check — matches the defensive pattern in _health.py
+        # since Docker state values appear in both upper- and lower-case across the API.
+        if (container.get("state") or "").upper() != "RUNNING":
+            continue
+        names = _container_names(container)
+        container_name = names[0].lstrip("/") if names else "<unnamed>"
+        for port in container.get("ports") or ():
+            public_port = port.get("publicPort")
+            if public_port is None:
+                continue
+            bindings.append(
+                {
+                    "host_port": public_port,
+                    "host_ip": port.get("ip") or "0.0.0.0",  # noqa: S104 — Docker reports "0.0.0.0" for any-interface bindings
+                    "container": container_name,
+                    "container_port": port.get("privatePort"),
+                    "protocol": port.get("type"),
+                }
+            )
+    bindings.sort(key=lambda b: (b["host_port"], b.get("protocol") or ""))
+    capped, page = cap_list(bindings, limit)
+    return {"bindings": capped, "count": len(capped), "page": page}
+
+
+async def _docker_networks(
+    container_id: str | None, network_id: str | None, limit: int | None
+) -> dict[str, Any]:
+    data = await _client.make_graphql_request(_DOCKER_QUERIES["networks"])
+    networks = safe_get(data, "docker", "networks", default=[])
+    capped, page = cap_list(networks, limit)
+    return {"networks": capped, "page": page}
+
+
+async def _docker_network_details(
+    container_id: str | None, network_id: str | None, limit: int | None
+) -> dict[str, Any]:
+    data = await _client.make_graphql_request(_DOCKER_QUERIES["network_details"])
+    for net in safe_get(data, "docker", "networks", default=[]):
+        if net.get("id") == network_id or net.get("name") == network_id:
+            return net
+    raise ToolError(f"Network '{network_id}' not found.")
+
+
+async def _docker_logs(
+    container_id: str | None, network_id: str | None, limit: int | None
+) -> dict[str, Any]:
+    raise ToolError(
+        "Container logs are not available via the Unraid GraphQL API. "
+        "Use the Unraid terminal or SSH to run: "
+        f"`docker logs {container_id or '<container_id>'} --tail 100`"
+    )
+
+
+_DockerReadHandler = Callable[[str | None, str | None, int | None], Awaitable[dict[str, Any]]]
+
+_DOCKER_READ_HANDLERS: dict[str, _DockerReadHandler] = {
+    "list": _docker_list,
+    "details": _docker_details,
+    "ports": _docker_ports,
+    "networks": _docker_networks,
+    "network_details": _docker_network_details,
+    "logs": _docker_logs,
+}
+
+
 async def _handle_docker(
     subaction: str,
     container_id: str | None,
@@ -282,69 +569,14 @@ async def _handle_docker(
     )
 
     with tool_error_handler("docker", subaction, logger):
-        logger.info(f"Executing unraid action=docker subaction={subaction}")
-
-        if subaction == "list":
-            data = await _client.make_graphql_request(_DOCKER_QUERIES["list"])
-            containers = safe_get(data, "docker", "containers", default=[])
-            capped, meta = cap_list(containers, limit)
-            return {"containers": capped, "page": meta}
-
-        if subaction == "details":
-            actual_id = await _resolve_container_id(container_id or "")
-            data = await _client.make_graphql_request(_DOCKER_QUERIES["details"], {"id": actual_id})
-            container = safe_get(data, "docker", "container", default=None)
-            if container:
-                return container
-            raise ToolError(f"Container '{container_id}' not found in details response.")
-
-        if subaction == "ports":
-            data = await _client.make_graphql_request(_DOCKER_QUERIES["ports"])
-            containers = safe_get(data, "docker", "containers", default=[])
-            bindings: list[dict[str, Any]] = []
-            for container in containers:
-                # Case-insensitive state check — matches the defensive pattern in _health.py
-                # since Docker state values appear in both upper- and lower-case across the API.
-                if (container.get("state") or "").upper() != "RUNNING":
-                    continue
-                names = _container_names(container)
-                container_name = names[0].lstrip("/") if names else "<unnamed>"
-                for port in container.get("ports") or []:
-                    public_port = port.get("publicPort")
-                    if public_port is None:
-                        continue
-                    bindings.append(
-                        {
-                            "host_port": public_port,
-                            "host_ip": port.get("ip") or "0.0.0.0",  # noqa: S104 — Docker reports "0.0.0.0" for any-interface bindings
-                            "container": container_name,
-                            "container_port": port.get("privatePort"),
-                            "protocol": port.get("type"),
-                        }
-                    )
-            bindings.sort(key=lambda b: (b["host_port"], b.get("protocol") or ""))
-            capped, page = cap_list(bindings, limit)
-            return {"bindings": capped, "count": len(capped), "page": page}
-
-        if subaction == "networks":
-            data = await _client.make_graphql_request(_DOCKER_QUERIES["networks"])
-            networks = safe_get(data, "docker", "networks", default=[])
-            capped, page = cap_list(networks, limit)
-            return {"networks": capped, "page": page}
-
-        if subaction == "network_details":
-            data = await _client.make_graphql_request(_DOCKER_QUERIES["network_details"])
-            for net in safe_get(data, "docker", "networks", default=[]):
-                if net.get("id") == network_id or net.get("name") == network_id:
-                    return dict(net)
-            raise ToolError(f"Network '{network_id}' not found.")
-
-        if subaction == "logs":
-            raise ToolError(
-                "Container logs are not available via the Unraid GraphQL API. "
-                "Use the Unraid terminal or SSH to run: "
-                f"`docker logs {container_id or '<container_id>'} --tail 100`"
-            )
+        logger.info("Executing unraid action=docker subaction=%s", subaction)
+
+        if subaction in _DOCKER_RECREATES:
+            _forget_container_index()
+
+        read_handler = _DOCKER_READ_HANDLERS.get(subaction)
+        if read_handler is not None:
+            return await read_handler(container_id, network_id, limit)
 
         # Root-level no-arg mutations (refresh digests / template sync + reset).
         if subaction in _DOCKER_ROOT_MUTATIONS:
@@ -398,7 +630,9 @@ async def _handle_docker(
 
         # Bulk / image-update lifecycle mutations.
         if subaction == "remove_container":
-            actual_id = await _resolve_container_id(container_id or "", strict=True)
+            actual_id = await _resolve_container_id(
+                container_id or "", strict=True, use_cache=False
+            )
             data = await _client.make_graphql_request(
                 _DOCKER_BULK_MUTATIONS["remove_container"],
                 {"id": actual_id, "withImage": with_image},
@@ -413,15 +647,16 @@ async def _handle_docker(
         if subaction == "update_containers":
             if not container_ids:
                 raise ToolError("container_ids is required for docker/update_containers")
-            # Resolve every id against a single container-list fetch rather than
+            # Resolve every id against a single container-list fetch and index rather than
             # re-fetching the full list once per id.
-            containers: list[dict[str, Any]] = []
-            if any(not _DOCKER_ID_PATTERN.match(c) for c in container_ids):
+            index = _build_container_index([])
+            if any(not _is_full_docker_id(c) for c in container_ids):
                 resolve_data = await _client.make_graphql_request(_DOCKER_RESOLVE_QUERY)
-                containers = safe_get(resolve_data, "docker", "containers", default=[])
+                index = _build_container_index(
+                    safe_get(resolve_data, "docker", "containers", default=[])
+                )
             resolved = [
-                await _resolve_container_id(c, strict=True, containers=containers)
-                for c in container_ids
+                await _resolve_container_id(c, strict=True, containers=index) for c in container_ids
             ]
             data = await _client.make_graphql_request(
                 _DOCKER_BULK_MUTATIONS["update_containers"], {"ids": resolved}
@@ -462,12 +697,32 @@ async def _handle_docker(
         # Single-id namespaced lifecycle mutations: start, stop, unpause, update_container.
         if subaction not in _DOCKER_MUTATIONS:
             raise ToolError(f"Unhandled docker subaction '{subaction}' — this is a bug")
-        actual_id = await _resolve_container_id(container_id or "", strict=True)
-        data = await _client.make_graphql_request(
-            _DOCKER_MUTATIONS[subaction],
-            {"id": actual_id},
-            operation_context={"operation": subaction},
+        identifier = container_id or ""
+        actual_id, from_cache = await _resolve_container(
+            identifier, strict=True, use_cache=subaction not in _DOCKER_RECREATES
         )
+        try:
+            data = await _client.make_graphql_request(
+                _DOCKER_MUTATIONS[subaction],
+                {"id": actual_id},
+                operation_context={"operation": subaction},
+            )
+        except ToolError:
+            # A cached index can be stale if the container was recreated outside this
+            # server. Re-resolve against a fresh list and retry once, but only when that
+            # yields a different id — otherwise the failure is real and is re-raised.
+            if not from_cache:
+                raise
+            _forget_container_index()
+            fresh_id = await _resolve_container_id(identifier, strict=True, use_cache=False)
+            if fresh_id == actual_id:
+                raise
+            actual_id = fresh_id
+            data = await _client.make_graphql_request(
+                _DOCKER_MUTATIONS[subaction],
+                {"id": actual_id},
+                operation_context={"operation": subaction},
+            )
         if data.get("idempotent_success"):
             return {
                 "success": True,
@@ -475,7 +730,7 @@ async def _handle_docker(
                 "idempotent": True,
                 "message": f"Container already in desired state for '{subaction}'",
             }
-        container = (data.get("docker") or {}).get(_DOCKER_LIFECYCLE_RESULT_FIELD[subaction])
+        container = safe_get(data, "docker", _DOCKER_LIFECYCLE_RESULT_FIELD[subaction])
         return {
             "success": mutation_success(container, boolean=False),
             "subaction": subaction,
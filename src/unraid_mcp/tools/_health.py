@@ -1,8 +1,9 @@
 """Health domain implementation for the consolidated Unraid MCP tool."""
 
-import datetime
 import time
+from collections import Counter
 from collections.abc import Callable
+from datetime import UTC, datetime
 from typing import Any
 
 import httpx
@@ -22,16 +23,17 @@ from ._system import _SYSTEM_QUERIES
 # HEALTH
 # ===========================================================================
 
-_HEALTH_SUBACTIONS: set[str] = {"check", "test_connection", "diagnose", "setup"}
+_HEALTH_SUBACTIONS: frozenset[str] = frozenset({"check", "test_connection", "diagnose", "setup"})
 _HEALTH_QUERIES: dict[str, str] = {
     "comprehensive_health": (
         "query ComprehensiveHealthCheck {"
         # machineId intentionally omitted — it's a stable hardware fingerprint
-        # (CWE-200) and the health summary doesn't need it.
-        " info { time versions { core { unraid } } os { uptime } }"
+        # (CWE-200) and the health summary doesn't need it. Likewise only the
+        # fields the summary reads are selected: containers are just counted by state.
+        " info { versions { core { unraid } } os { uptime } }"
         " array { state }"
         " notifications { overview { unread { alert warning total } } }"
-        " docker { containers { id state status } }"
+        " docker { containers { state } }"
         " }"
     ),
 }
@@ -40,6 +42,10 @@ _SEVERITY = {"healthy": 0, "warning": 1, "degraded": 2, "unhealthy": 3}
 _STATUS_FROM_SEVERITY: dict[int, str] = {v: k for k, v in _SEVERITY.items()}
 
 
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
 async def _comprehensive_health_check() -> dict[str, Any]:
     from ..config.settings import (
         UNRAID_API_URL,
@@ -50,7 +56,7 @@ async def _comprehensive_health_check() -> dict[str, Any]:
     )
     from ..core.utils import safe_display_url
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     health_severity = 0
     issues: list[str] = []
 
@@ -60,11 +66,11 @@ async def _comprehensive_health_check() -> dict[str, Any]:
 
     try:
         data = await _client.make_graphql_request(_HEALTH_QUERIES["comprehensive_health"])
-        api_latency = round((time.time() - start_time) * 1000, 2)
+        api_latency = round((time.perf_counter() - start_time) * 1000, 2)
 
         health_info: dict[str, Any] = {
             "status": "healthy",
-            "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+            "timestamp": _now_iso(),
             "api_latency_ms": api_latency,
             "server": {
                 "name": "Unraid MCP Server",
@@ -80,7 +86,7 @@ async def _comprehensive_health_check() -> dict[str, Any]:
             health_info["issues"] = ["No response from Unraid API"]
             return health_info
 
-        info = data.get("info") or {}
+        info = data.get("info")
         if info:
             health_info["unraid_system"] = {
                 "status": "connected",
@@ -93,7 +99,7 @@ async def _comprehensive_health_check() -> dict[str, Any]:
             _escalate("degraded")
             issues.append("Unable to retrieve system info")
 
-        array_info = data.get("array") or {}
+        array_info = data.get("array")
         if array_info:
             state = array_info.get("state", "unknown")
             health_info["array_status"] = {
@@ -107,9 +113,9 @@ async def _comprehensive_health_check() -> dict[str, Any]:
             _escalate("warning")
             issues.append("Unable to retrieve array status")
 
-        notifications = data.get("notifications") or {}
-        if notifications and notifications.get("overview"):
-            unread = notifications["overview"].get("unread") or {}
+        overview = safe_get(data, "notifications", "overview")
+        if overview:
+            unread = overview.get("unread") or {}
             alerts = unread.get("alert", 0)
             health_info["notifications"] = {
                 "unread_total": unread.get("total", 0),
@@ -120,17 +126,13 @@ async def _comprehensive_health_check() -> dict[str, Any]:
                 _escalate("warning")
                 issues.append(f"{alerts} unread alert(s)")
 
-        docker = data.get("docker") or {}
-        if docker and docker.get("containers"):
-            containers = docker["containers"]
+        containers = safe_get(data, "docker", "containers")
+        if containers:
+            states = Counter((c.get("state") or "").upper() for c in containers)
             health_info["docker_services"] = {
                 "total": len(containers),
-                "running": len(
-                    [c for c in containers if (c.get("state") or "").upper() == "RUNNING"]
-                ),
-                "stopped": len(
-                    [c for c in containers if (c.get("state") or "").upper() == "EXITED"]
-                ),
+                "running": states["RUNNING"],
+                "stopped": states["EXITED"],
             }
 
         if api_latency > 10000:
@@ -145,17 +147,17 @@ async def _comprehensive_health_check() -> dict[str, Any]:
             health_info["issues"] = issues
         health_info["performance"] = {
             "api_response_time_ms": api_latency,
-            "check_duration_ms": round((time.time() - start_time) * 1000, 2),
+            "check_duration_ms": round((time.perf_counter() - start_time) * 1000, 2),
         }
         return health_info
 
     except CredentialsNotConfiguredError:
         raise  # Let tool_error_handler convert to setup instructions
     except (httpx.ConnectError, httpx.TimeoutException, httpx.NetworkError) as e:
-        logger.error(f"Health check failed: {e}", exc_info=True)
+        logger.exception("Health check failed: %s", e)
         return {
             "status": "unhealthy",
-            "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+            "timestamp": _now_iso(),
             "error": str(e),
         }
     except _client.ToolError as e:
@@ -164,10 +166,10 @@ async def _comprehensive_health_check() -> dict[str, Any]:
         # rather than propagating an unhandled ToolError to the caller.
         cause = e.__cause__
         if isinstance(cause, (httpx.ConnectError, httpx.TimeoutException, httpx.NetworkError)):
-            logger.error(f"Health check failed (wrapped): {cause}", exc_info=True)
+            logger.exception("Health check failed (wrapped): %s", cause)
             return {
                 "status": "unhealthy",
-                "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+                "timestamp": _now_iso(),
                 "error": str(cause),
             }
         raise
@@ -233,9 +235,9 @@ async def _handle_health(
     with tool_error_handler("health", subaction, logger):
         logger.info("Executing unraid action=health subaction=%s", subaction)
         if subaction == "test_connection":
-            start = time.time()
+            start = time.perf_counter()
             data = await _client.make_graphql_request(_SYSTEM_QUERIES["online"])
-            latency = round((time.time() - start) * 1000, 2)
+            latency = round((time.perf_counter() - start) * 1000, 2)
             return {"status": "connected", "online": data.get("online"), "latency_ms": latency}
         if subaction == "check":
             return await _comprehensive_health_check()
@@ -248,7 +250,7 @@ async def _handle_health(
             status = await subscription_manager.get_subscription_status()
             error_count, connection_issues = analyze_subscription_status(status)
             return {
-                "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+                "timestamp": _now_iso(),
                 "environment": {
                     "auto_start_enabled": subscription_manager.auto_start_enabled,
                     "max_reconnect_attempts": subscription_manager.max_reconnect_attempts,
@@ -5,12 +5,14 @@ preview_permissions, auth_actions, creation_form_schema, create, update, delete*
 add_role, remove_role (13 subactions).
 """
 
+import copy
 from typing import Any
 
 from fastmcp import Context
 
 from ..config.logging import logger
 from ..core import client as _client
+from ..core.cache import TTLCache
 from ..core.exceptions import ToolError, tool_error_handler
 from ..core.guards import gate_destructive_action
 from ..core.pagination import cap_list
@@ -41,8 +43,22 @@ _KEY_MUTATIONS: dict[str, str] = {
     "remove_role": "mutation RemoveRole($input: RemoveRoleFromApiKeyInput!) { apiKey { removeRole(input: $input) } }",
 }
 
-_KEY_SUBACTIONS: set[str] = set(_KEY_QUERIES) | set(_KEY_MUTATIONS)
-_KEY_DESTRUCTIVE: set[str] = {"delete"}
+_KEY_SUBACTIONS: frozenset[str] = frozenset(set(_KEY_QUERIES) | set(_KEY_MUTATIONS))
+_KEY_DESTRUCTIVE: frozenset[str] = frozenset({"delete"})
+
+# Variable-free list reads differ only in their result field and response key,
+# so they dispatch through one table probe instead of a branch each.
+_KEY_LIST_READS: dict[str, tuple[str, str]] = {
+    "possible_roles": ("apiKeyPossibleRoles", "roles"),
+    "possible_permissions": ("apiKeyPossiblePermissions", "permissions"),
+    "auth_actions": ("getAvailableAuthActions", "actions"),
+}
+
+# Short-lived memo for list/get so back-to-back reads from an agent skip the
+# round trip. Any key mutation made through this tool drops it once the
+# mutation returns; changes made elsewhere (e.g. the web UI) show up once the
+# TTL lapses.
+_key_cache = TTLCache(ttl=5.0)
 
 
 async def _handle_key(
@@ -66,28 +82,27 @@ async def _handle_key(
         {"delete": f"Delete API key **{key_id}**. Any clients using this key will lose access."},
     )
 
-    with tool_error_handler("key", subaction, logger):
-        logger.info(f"Executing unraid action=key subaction={subaction}")
-
+    with (
+        tool_error_handler("key", subaction, logger),
+        _key_cache.cleared_after(subaction in _KEY_MUTATIONS),
+    ):
+        logger.info("Executing unraid action=key subaction=%s", subaction)
         if subaction == "list":
-            data = await _client.make_graphql_request(_KEY_QUERIES["list"])
+            data = _key_cache.get(("list", None))
+            if data is None:
+                generation = _key_cache.generation
+                data = await _client.make_graphql_request(_KEY_QUERIES["list"])
+                _key_cache.set(("list", None), data, generation=generation)
+            # Copied: the rows belong to the memoised payload.
             capped, page = cap_list(coerce_list(data.get("apiKeys")), limit)
-            return {"keys": capped, "page": page}
-
-        if subaction == "possible_roles":
-            data = await _client.make_graphql_request(_KEY_QUERIES["possible_roles"])
-            capped, page = cap_list(coerce_list(data.get("apiKeyPossibleRoles")), limit)
-            return {"roles": capped, "page": page}
-
-        if subaction == "possible_permissions":
-            data = await _client.make_graphql_request(_KEY_QUERIES["possible_permissions"])
-            capped, page = cap_list(coerce_list(data.get("apiKeyPossiblePermissions")), limit)
-            return {"permissions": capped, "page": page}
+            return {"keys": copy.deepcopy(capped), "page": page}
 
-        if subaction == "auth_actions":
-            data = await _client.make_graphql_request(_KEY_QUERIES["auth_actions"])
-            capped, page = cap_list(coerce_list(data.get("getAvailableAuthActions")), limit)
-            return {"actions": capped, "page": page}
+        list_read = _KEY_LIST_READS.get(subaction)
+        if list_read is not None:
+            field, result_key = list_read
+            data = await _client.make_graphql_request(_KEY_QUERIES[subaction])
+            capped, page = cap_list(coerce_list(data.get(field)), limit)
+            return {result_key: capped, "page": page}
 
         if subaction == "creation_form_schema":
             data = await _client.make_graphql_request(_KEY_QUERIES["creation_form_schema"])
@@ -127,8 +142,13 @@ async def _handle_key(
         if subaction == "get":
             if not key_id:
                 raise ToolError("key_id is required for key/get")
-            data = await _client.make_graphql_request(_KEY_QUERIES["get"], {"id": key_id})
-            return dict(data.get("apiKey") or {})
+            data = _key_cache.get(("get", key_id))
+            if data is None:
+                generation = _key_cache.generation
+                data = await _client.make_graphql_request(_KEY_QUERIES["get"], {"id": key_id})
+                if data.get("apiKey"):
+                    _key_cache.set(("get", key_id), data, generation=generation)
+            return copy.deepcopy(data.get("apiKey") or {})
 
         if subaction == "create":
             if not name:
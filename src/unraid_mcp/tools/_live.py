@@ -158,7 +158,7 @@ async def _handle_live(
         path = _validate_path(path, _ALLOWED_LOG_PREFIXES, "path")
 
     with tool_error_handler("live", subaction, logger):
-        logger.info(f"Executing unraid action=live subaction={subaction} timeout={timeout}")
+        logger.info("Executing unraid action=live subaction=%s timeout=%s", subaction, timeout)
 
         if subaction in SNAPSHOT_ACTIONS:
             # Warm-cache fast path: when the persistent SubscriptionManager is
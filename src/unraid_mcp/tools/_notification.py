@@ -1,15 +1,18 @@
 """Notification domain handler for the Unraid MCP tool.
 
-Covers: overview, list, create, notify_if_unique, archive, mark_unread, recalculate,
-archive_all, archive_many, unarchive_many, unarchive_all, delete*, delete_archived* (13 subactions).
+Covers: overview, list, dashboard, create, notify_if_unique, archive, mark_unread, recalculate,
+archive_all, archive_many, unarchive_many, unarchive_all, delete*, delete_archived* (14 subactions).
 """
 
+import copy
+from functools import lru_cache
 from typing import Any
 
 from fastmcp import Context
 
 from ..config.logging import logger
 from ..core import client as _client
+from ..core.cache import TTLCache
 from ..core.exceptions import ToolError, tool_error_handler
 from ..core.guards import gate_destructive_action
 from ..core.pagination import cap_list
@@ -23,6 +26,7 @@ from ..core.utils import coerce_list, safe_get, validate_subaction
 _NOTIFICATION_QUERIES: dict[str, str] = {
     "overview": "query GetNotificationsOverview { notifications { overview { unread { info warning alert total } archive { info warning alert total } } } }",
     "list": "query ListNotifications($filter: NotificationFilter!) { notifications { list(filter: $filter) { id title subject description importance link type timestamp formattedTimestamp } } }",
+    "dashboard": "query GetNotificationsDashboard($filter: NotificationFilter!) { notifications { overview { unread { info warning alert total } archive { info warning alert total } } list(filter: $filter) { id title subject description importance link type timestamp formattedTimestamp } warningsAndAlerts { id title subject description importance link type timestamp formattedTimestamp } } }",
 }
 
 _NOTIFICATION_MUTATIONS: dict[str, str] = {
@@ -39,8 +43,10 @@ _NOTIFICATION_MUTATIONS: dict[str, str] = {
     "notify_if_unique": "mutation NotifyIfUnique($input: NotificationData!) { notifyIfUnique(input: $input) { id title importance } }",
 }
 
-_NOTIFICATION_SUBACTIONS: set[str] = set(_NOTIFICATION_QUERIES) | set(_NOTIFICATION_MUTATIONS)
-_NOTIFICATION_DESTRUCTIVE: set[str] = {"delete", "delete_archived"}
+_NOTIFICATION_SUBACTIONS: frozenset[str] = frozenset(
+    set(_NOTIFICATION_QUERIES) | set(_NOTIFICATION_MUTATIONS)
+)
+_NOTIFICATION_DESTRUCTIVE: frozenset[str] = frozenset({"delete", "delete_archived"})
 
 # Maps each mutation subaction to the top-level GraphQL result field it returns,
 # so the handler can project to that subtree instead of echoing the whole `data`
@@ -58,12 +64,64 @@ _NOTIFICATION_RESULT_FIELD: dict[str, str] = {
     "unarchive_all": "unarchiveAll",
     "recalculate": "recalculateOverview",
 }
+# Bulk mutation used when archive/mark_unread is given notification_ids.
+_NOTIFICATION_BULK_FORM: dict[str, str] = {
+    "archive": "archive_many",
+    "mark_unread": "unarchive_many",
+}
 _VALID_IMPORTANCE = frozenset({"ALERT", "WARNING", "INFO"})
 _VALID_LIST_TYPES = frozenset({"UNREAD", "ARCHIVE"})
 # Upper clamp on the server-side `limit` so e.g. limit=5000 can't dump thousands
 # of rows into the agent's context. The good default (20) is set by the caller.
 _MAX_NOTIFICATION_LIMIT = 200
 
+# deleteNotification takes a single id, so a multi-id delete aliases one field
+# per id into a shared document instead of paying a round trip each. Mutation
+# fields run in order, so only the last alias needs the full counts.
+_DELETE_BATCH_SIZE = 20
+
+
+@lru_cache(maxsize=_DELETE_BATCH_SIZE)
+def _delete_many_document(count: int) -> str:
+    params = " ".join(f"$id{i}: PrefixedID!" for i in range(count))
+    fields = [
+        f"d{i}: deleteNotification(id: $id{i}, type: $type) {{ unread {{ total }} }}"
+        for i in range(count)
+    ]
+    fields[-1] = fields[-1].replace(
+        "{ unread { total } }",
+        "{ unread { info warning alert total } archive { info warning alert total } }",
+    )
+    return (
+        f"mutation DeleteNotifications({params} $type: NotificationType!) {{ {' '.join(fields)} }}"
+    )
+
+
+# Short-lived memo for overview and first-page list reads, keyed on the
+# subaction plus its filter. Deeper pages are not cached so paging through a
+# large backlog doesn't fill the memo. Every notification mutation made through
+# this tool drops it once the mutation returns; notifications raised by the
+# server show up once the TTL lapses.
+_notification_cache = TTLCache(ttl=5.0)
+
+
+def _normalize_enum(value: str, valid: frozenset[str], field: str) -> str:
+    """Upper-case an enum input once, rejecting it before any request is sent."""
+    normalized = value.upper()
+    if normalized not in valid:
+        raise ToolError(f"Invalid {field} '{value}'. Must be one of: {sorted(valid)}")
+    return normalized
+
+
+def _fetch_limit(limit: int) -> int:
+    """Server-side fetch ceiling for list reads.
+
+    limit<=0 means "as many as the clamp allows", otherwise the caller value is
+    clamped down to the max so the upstream API is never asked for thousands of
+    rows.
+    """
+    return _MAX_NOTIFICATION_LIMIT if limit <= 0 else min(limit, _MAX_NOTIFICATION_LIMIT)
+
 
 async def _handle_notification(
     subaction: str,
@@ -88,54 +146,93 @@ async def _handle_notification(
         _NOTIFICATION_DESTRUCTIVE,
         confirm,
         {
-            "delete": f"Delete notification **{notification_id}** permanently. This cannot be undone.",
+            "delete": (
+                f"Delete {len(notification_ids)} notifications permanently. This cannot be undone."
+                if notification_ids and not notification_id
+                else f"Delete notification **{notification_id}** permanently. This cannot be undone."
+            ),
             "delete_archived": "Delete ALL archived notifications permanently. This cannot be undone.",
         },
     )
 
-    if list_type.upper() not in _VALID_LIST_TYPES:
-        raise ToolError(
-            f"Invalid list_type '{list_type}'. Must be one of: {sorted(_VALID_LIST_TYPES)}"
-        )
-    if importance is not None and importance.upper() not in _VALID_IMPORTANCE:
-        raise ToolError(
-            f"Invalid importance '{importance}'. Must be one of: {sorted(_VALID_IMPORTANCE)}"
-        )
-    if notification_type is not None and notification_type.upper() not in _VALID_LIST_TYPES:
-        raise ToolError(
-            f"Invalid notification_type '{notification_type}'. Must be one of: {sorted(_VALID_LIST_TYPES)}"
+    list_type = _normalize_enum(list_type, _VALID_LIST_TYPES, "list_type")
+    if importance is not None:
+        importance = _normalize_enum(importance, _VALID_IMPORTANCE, "importance")
+    if notification_type is not None:
+        notification_type = _normalize_enum(
+            notification_type, _VALID_LIST_TYPES, "notification_type"
         )
 
-    with tool_error_handler("notification", subaction, logger):
-        logger.info(f"Executing unraid action=notification subaction={subaction}")
+    with (
+        tool_error_handler("notification", subaction, logger),
+        _notification_cache.cleared_after(subaction in _NOTIFICATION_MUTATIONS),
+    ):
+        logger.info("Executing unraid action=notification subaction=%s", subaction)
 
         if subaction == "overview":
-            data = await _client.make_graphql_request(_NOTIFICATION_QUERIES["overview"])
-            return dict(safe_get(data, "notifications", "overview", default={}))
+            data = _notification_cache.get(("overview",))
+            if data is None:
+                generation = _notification_cache.generation
+                data = await _client.make_graphql_request(_NOTIFICATION_QUERIES["overview"])
+                _notification_cache.set(("overview",), data, generation=generation)
+            # Copied: the payload stays in the memo for later reads.
+            return copy.deepcopy(safe_get(data, "notifications", "overview") or {})
 
-        if subaction == "list":
-            # Server-side fetch ceiling: limit<=0 means "as many as the clamp
-            # allows", otherwise clamp the caller value down to the max so the
-            # upstream API is never asked for thousands of rows.
-            effective_limit = (
-                _MAX_NOTIFICATION_LIMIT if limit <= 0 else min(limit, _MAX_NOTIFICATION_LIMIT)
-            )
+        if subaction == "dashboard":
+            # overview + first unread page + warnings/alerts in one document. The
+            # payload also answers overview and that list page, so it seeds
+            # their cache entries for the follow-up reads.
             filter_vars: dict[str, Any] = {
-                "type": list_type.upper(),
-                "offset": offset,
-                "limit": effective_limit,
+                "type": "UNREAD",
+                "offset": 0,
+                "limit": _fetch_limit(limit),
             }
-            if importance:
-                filter_vars["importance"] = importance.upper()
+            generation = _notification_cache.generation
             data = await _client.make_graphql_request(
-                _NOTIFICATION_QUERIES["list"], {"filter": filter_vars}
+                _NOTIFICATION_QUERIES["dashboard"], {"filter": filter_vars}
+            )
+            _notification_cache.set(("overview",), data, generation=generation)
+            _notification_cache.set(
+                ("list", *sorted(filter_vars.items())), data, generation=generation
             )
+            unread, unread_page = cap_list(
+                coerce_list(safe_get(data, "notifications", "list")), limit
+            )
+            warnings, warnings_page = cap_list(
+                coerce_list(safe_get(data, "notifications", "warningsAndAlerts")), limit
+            )
+            # Copied: the payload now seeds the memo for later reads.
+            return copy.deepcopy(
+                {
+                    "overview": safe_get(data, "notifications", "overview") or {},
+                    "unread": {"notifications": unread, "page": unread_page},
+                    "warnings_and_alerts": {"notifications": warnings, "page": warnings_page},
+                }
+            )
+
+        if subaction == "list":
+            filter_vars = {
+                "type": list_type,
+                "offset": offset,
+                "limit": _fetch_limit(limit),
+            }
+            if importance:
+                filter_vars["importance"] = importance
+            cache_key = ("list", *sorted(filter_vars.items()))
+            data = _notification_cache.get(cache_key) if offset == 0 else None
+            if data is None:
+                generation = _notification_cache.generation
+                data = await _client.make_graphql_request(
+                    _NOTIFICATION_QUERIES["list"], {"filter": filter_vars}
+                )
+                if offset == 0:
+                    _notification_cache.set(cache_key, data, generation=generation)
             # Bound the *returned* list to the tool `limit` (default 20) via
             # cap_list so the response can't blow past the 40 KB response cap —
             # a 200-row payload is ~114 KB and would be silently truncated.
             rows = coerce_list(safe_get(data, "notifications", "list", default=[]))
             capped, page = cap_list(rows, limit)
-            return {"notifications": capped, "page": page}
+            return {"notifications": copy.deepcopy(capped), "page": page}
 
         if subaction == "create":
             if title is None or subject is None or description is None or importance is None:
@@ -155,7 +252,7 @@ async def _handle_notification(
                         "title": title,
                         "subject": subject,
                         "description": description,
-                        "importance": importance.upper(),
+                        "importance": importance,
                     }
                 },
             )
@@ -184,7 +281,7 @@ async def _handle_notification(
                         "title": title,
                         "subject": subject,
                         "description": description,
-                        "importance": importance.upper(),
+                        "importance": importance,
                     }
                 },
             )
@@ -197,6 +294,11 @@ async def _handle_notification(
                 }
             return {"success": True, "duplicate": False, "notification": notif}
 
+        if subaction in ("archive", "mark_unread") and notification_ids and not notification_id:
+            # A list of ids goes out as the matching bulk mutation, one request
+            # for the whole list, and reports the bulk subaction it ran.
+            subaction = _NOTIFICATION_BULK_FORM[subaction]
+
         if subaction in ("archive", "mark_unread"):
             if not notification_id:
                 raise ToolError(f"notification_id is required for notification/{subaction}")
@@ -207,61 +309,69 @@ async def _handle_notification(
             return {"success": True, "subaction": subaction, "data": result}
 
         if subaction == "delete":
-            if not notification_id or not notification_type:
-                raise ToolError("delete requires notification_id and notification_type")
+            if not (notification_id or notification_ids) or not notification_type:
+                raise ToolError(
+                    "delete requires notification_id (or notification_ids) and notification_type"
+                )
+            if notification_ids and not notification_id:
+                ids = list(dict.fromkeys(notification_ids))
+                result = None
+                deleted = 0
+                indeterminate_ids: list[str] = []
+                errors: list[str] = []
+                for start in range(0, len(ids), _DELETE_BATCH_SIZE):
+                    batch = ids[start : start + _DELETE_BATCH_SIZE]
+                    batch_vars: dict[str, Any] = {f"id{i}": nid for i, nid in enumerate(batch)}
+                    batch_vars["type"] = notification_type
+                    # deleteNotification is non-null, so one bad id nulls the whole
+                    # batch's data: the aliases before it may already have been
+                    # deleted, but the response can't say which. A failed batch's
+                    # ids are reported as indeterminate (not failed) and the rest
+                    # still run; re-listing shows what is left.
+                    try:
+                        data = await _client.make_graphql_request(
+                            _delete_many_document(len(batch)), batch_vars
+                        )
+                    except ToolError as exc:
+                        indeterminate_ids.extend(batch)
+                        errors.append(str(exc))
+                        continue
+                    batch_result = safe_get(data, f"d{len(batch) - 1}")
+                    if batch_result is None:
+                        indeterminate_ids.extend(batch)
+                        errors.append("no result returned for batch")
+                        continue
+                    deleted += len(batch)
+                    result = batch_result
+                response: dict[str, Any] = {
+                    "success": not indeterminate_ids,
+                    "subaction": "delete",
+                    "deleted": deleted,
+                    "data": result,
+                }
+                if indeterminate_ids:
+                    response["indeterminate_ids"] = indeterminate_ids
+                    response["error"] = errors[0]
+                return response
             data = await _client.make_graphql_request(
                 _NOTIFICATION_MUTATIONS["delete"],
-                {"id": notification_id, "type": notification_type.upper()},
+                {"id": notification_id, "type": notification_type},
             )
             result = safe_get(data, _NOTIFICATION_RESULT_FIELD["delete"])
             return {"success": True, "subaction": "delete", "data": result}
 
-        if subaction == "delete_archived":
-            data = await _client.make_graphql_request(_NOTIFICATION_MUTATIONS["delete_archived"])
-            result = safe_get(data, _NOTIFICATION_RESULT_FIELD["delete_archived"])
-            return {"success": True, "subaction": "delete_archived", "data": result}
-
-        if subaction == "archive_all":
-            variables: dict[str, Any] | None = (
-                {"importance": importance.upper()} if importance else None
-            )
-            data = await _client.make_graphql_request(
-                _NOTIFICATION_MUTATIONS["archive_all"], variables
-            )
-            result = safe_get(data, _NOTIFICATION_RESULT_FIELD["archive_all"])
-            return {"success": True, "subaction": "archive_all", "data": result}
-
-        if subaction == "archive_many":
+        # The bulk mutations differ only in their variables; each pair shares
+        # one branch and projects to its own result field.
+        if subaction in ("archive_many", "unarchive_many"):
             if not notification_ids:
-                raise ToolError("notification_ids is required for notification/archive_many")
-            data = await _client.make_graphql_request(
-                _NOTIFICATION_MUTATIONS["archive_many"], {"ids": notification_ids}
-            )
-            result = safe_get(data, _NOTIFICATION_RESULT_FIELD["archive_many"])
-            return {"success": True, "subaction": "archive_many", "data": result}
-
-        if subaction == "unarchive_many":
-            if not notification_ids:
-                raise ToolError("notification_ids is required for notification/unarchive_many")
-            data = await _client.make_graphql_request(
-                _NOTIFICATION_MUTATIONS["unarchive_many"], {"ids": notification_ids}
-            )
-            result = safe_get(data, _NOTIFICATION_RESULT_FIELD["unarchive_many"])
-            return {"success": True, "subaction": "unarchive_many", "data": result}
-
-        if subaction == "unarchive_all":
-            variables: dict[str, Any] | None = (
-                {"importance": importance.upper()} if importance else None
-            )
-            data = await _client.make_graphql_request(
-                _NOTIFICATION_MUTATIONS["unarchive_all"], variables
-            )
-            result = safe_get(data, _NOTIFICATION_RESULT_FIELD["unarchive_all"])
-            return {"success": True, "subaction": "unarchive_all", "data": result}
-
-        if subaction == "recalculate":
-            data = await _client.make_graphql_request(_NOTIFICATION_MUTATIONS["recalculate"])
-            result = safe_get(data, _NOTIFICATION_RESULT_FIELD["recalculate"])
-            return {"success": True, "subaction": "recalculate", "data": result}
-
-        raise ToolError(f"Unhandled notification subaction '{subaction}' — this is a bug")
+                raise ToolError(f"notification_ids is required for notification/{subaction}")
+            variables: dict[str, Any] | None = {"ids": notification_ids}
+        elif subaction in ("archive_all", "unarchive_all"):
+            variables = {"importance": importance} if importance else None
+        elif subaction in ("delete_archived", "recalculate"):
+            variables = None
+        else:
+            raise ToolError(f"Unhandled notification subaction '{subaction}' — this is a bug")
+        data = await _client.make_graphql_request(_NOTIFICATION_MUTATIONS[subaction], variables)
+        result = safe_get(data, _NOTIFICATION_RESULT_FIELD[subaction])
+        return {"success": True, "subaction": subaction, "data": result}
@@ -27,7 +27,7 @@ _OIDC_QUERIES: dict[str, str] = {
     "validate_session": "query ValidateOidcSession($token: String!) { validateOidcSession(token: $token) { valid username } }",
 }
 
-_OIDC_SUBACTIONS: set[str] = set(_OIDC_QUERIES)
+_OIDC_SUBACTIONS: frozenset[str] = frozenset(_OIDC_QUERIES)
 
 
 async def _handle_oidc(
@@ -47,7 +47,7 @@ async def _handle_oidc(
         variables = {"token": token}
 
     with tool_error_handler("oidc", subaction, logger):
-        logger.info(f"Executing unraid action=oidc subaction={subaction}")
+        logger.info("Executing unraid action=oidc subaction=%s", subaction)
         # Guard the lookup so an unhandled subaction raises the clean guard below
         # instead of a KeyError masked as "likely a bug" (#5).
         query = _OIDC_QUERIES.get(subaction)
@@ -63,9 +63,9 @@ async def _handle_oidc(
             result = data.get("oidcProvider")
             if result is None:
                 raise ToolError(f"OIDC provider '{provider_id}' not found")
-            return dict(result)
+            return result
         if subaction == "configuration":
-            return dict(data.get("oidcConfiguration") or {})
+            return data.get("oidcConfiguration") or {}
         if subaction == "public_providers":
             capped, page = cap_list(data.get("publicOidcProviders", []), limit)
             return {"providers": capped, "page": page}
@@ -75,6 +75,6 @@ async def _handle_oidc(
                 raise ToolError(
                     "Session validation returned no data — the OIDC endpoint may be unavailable"
                 )
-            return dict(result)
+            return result
 
         raise ToolError(f"Unhandled oidc subaction '{subaction}' — this is a bug")
@@ -20,6 +20,7 @@ from ..core.exceptions import ToolError, tool_error_handler
 from ..core.guards import gate_destructive_action
 from ..core.utils import mutation_success, validate_subaction
 from ..core.validation import validate_input_mapping
+from ._system import invalidate_system_reads
 
 
 # ===========================================================================
@@ -70,12 +71,18 @@ _ONBOARDING_RESULT_FIELD: dict[str, str] = {
     "create_internal_boot_pool": "createInternalBootPool",
 }
 
-_ONBOARDING_SUBACTIONS: set[str] = (
+_ONBOARDING_SUBACTIONS: frozenset[str] = frozenset(
     set(_ONBOARDING_QUERIES) | set(_ONBOARDING_SIMPLE_MUTATIONS) | set(_ONBOARDING_INPUT_MUTATIONS)
 )
 # reset wipes onboarding/setup state; create_internal_boot_pool formats devices and
 # can reboot the server.
-_ONBOARDING_DESTRUCTIVE: set[str] = {"reset", "create_internal_boot_pool"}
+_ONBOARDING_DESTRUCTIVE: frozenset[str] = frozenset({"reset", "create_internal_boot_pool"})
+_ONBOARDING_CONFIRM_DESCRIPTIONS: dict[str, str] = {
+    "reset": "Reset the server's onboarding/setup state. The first-boot setup "
+    "flow will be re-triggered.",
+    "create_internal_boot_pool": "Create an internal boot pool. This FORMATS the "
+    "specified devices and may REBOOT the server.",
+}
 
 
 def _is_unknown_drive_warnings_field_error(exc: ToolError) -> bool:
@@ -96,16 +103,15 @@ async def _handle_onboarding(
         subaction,
         _ONBOARDING_DESTRUCTIVE,
         confirm,
-        {
-            "reset": "Reset the server's onboarding/setup state. The first-boot setup "
-            "flow will be re-triggered.",
-            "create_internal_boot_pool": "Create an internal boot pool. This FORMATS the "
-            "specified devices and may REBOOT the server.",
-        },
+        _ONBOARDING_CONFIRM_DESCRIPTIONS,
     )
 
-    with tool_error_handler("onboarding", subaction, logger):
-        logger.info(f"Executing unraid action=onboarding subaction={subaction}")
+    # Setup state and boot-pool changes feed vars and flash in the system memo.
+    with (
+        tool_error_handler("onboarding", subaction, logger),
+        invalidate_system_reads(subaction not in _ONBOARDING_QUERIES),
+    ):
+        logger.info("Executing unraid action=onboarding subaction=%s", subaction)
 
         if subaction == "internal_boot_context":
             try:
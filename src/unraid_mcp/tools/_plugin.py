@@ -17,6 +17,7 @@ from ..core.exceptions import ToolError, tool_error_handler
 from ..core.guards import gate_destructive_action
 from ..core.pagination import cap_list
 from ..core.utils import coerce_list, mutation_success, validate_subaction
+from ._system import invalidate_system_reads
 
 
 # ===========================================================================
@@ -39,10 +40,10 @@ _PLUGIN_MUTATIONS: dict[str, str] = {
     "install_language": "mutation InstallLanguage($input: InstallPluginInput!) { unraidPlugins { installLanguage(input: $input) { id url name status createdAt } } }",
 }
 
-_PLUGIN_SUBACTIONS: set[str] = set(_PLUGIN_QUERIES) | set(_PLUGIN_MUTATIONS)
+_PLUGIN_SUBACTIONS: frozenset[str] = frozenset(set(_PLUGIN_QUERIES) | set(_PLUGIN_MUTATIONS))
 # install / install_language fetch and run a .plg from a caller-supplied URL as
 # root — gated like remove.
-_PLUGIN_DESTRUCTIVE: set[str] = {"remove", "install", "install_language"}
+_PLUGIN_DESTRUCTIVE: frozenset[str] = frozenset({"remove", "install", "install_language"})
 
 
 def _validate_plugin_url(url: str) -> str:
@@ -134,8 +135,12 @@ async def _handle_plugin(
         },
     )
 
-    with tool_error_handler("plugin", subaction, logger):
-        logger.info(f"Executing unraid action=plugin subaction={subaction}")
+    # Plugin installs can rewrite vars and flash-backed config the system memo holds.
+    with (
+        tool_error_handler("plugin", subaction, logger),
+        invalidate_system_reads(subaction in _PLUGIN_MUTATIONS),
+    ):
+        logger.info("Executing unraid action=plugin subaction=%s", subaction)
 
         if subaction == "list":
             data = await _client.make_graphql_request(_PLUGIN_QUERIES["list"])
@@ -12,7 +12,7 @@ from ..core import client as _client
 from ..core.exceptions import ToolError, tool_error_handler
 from ..core.guards import gate_destructive_action
 from ..core.pagination import cap_list
-from ..core.utils import safe_get, validate_subaction
+from ..core.utils import coerce_list, safe_get, validate_subaction
 from ..core.validation import DANGEROUS_KEY_PATTERN, validate_scalar_mapping
 
 
@@ -32,8 +32,8 @@ _RCLONE_MUTATIONS: dict[str, str] = {
     "delete_remote": "mutation DeleteRCloneRemote($input: DeleteRCloneRemoteInput!) { rclone { deleteRCloneRemote(input: $input) } }",
 }
 
-_RCLONE_SUBACTIONS: set[str] = set(_RCLONE_QUERIES) | set(_RCLONE_MUTATIONS)
-_RCLONE_DESTRUCTIVE: set[str] = {"delete_remote"}
+_RCLONE_SUBACTIONS: frozenset[str] = frozenset(set(_RCLONE_QUERIES) | set(_RCLONE_MUTATIONS))
+_RCLONE_DESTRUCTIVE: frozenset[str] = frozenset({"delete_remote"})
 _MAX_CONFIG_KEYS = 50
 _MAX_NAME_LENGTH = 128
 
@@ -66,12 +66,11 @@ async def _handle_rclone(
     )
 
     with tool_error_handler("rclone", subaction, logger):
-        logger.info(f"Executing unraid action=rclone subaction={subaction}")
+        logger.info("Executing unraid action=rclone subaction=%s", subaction)
 
         if subaction == "list_remotes":
             data = await _client.make_graphql_request(_RCLONE_QUERIES["list_remotes"])
-            remotes = safe_get(data, "rclone", "remotes", default=[])
-            remotes = list(remotes) if isinstance(remotes, list) else []
+            remotes = coerce_list(safe_get(data, "rclone", "remotes"))
             capped, page = cap_list(remotes, limit)
             # Full per-remote config (parameters/config) is intentionally dropped
             # here; a per-remote detail subaction could expose it if ever needed.
@@ -92,7 +91,7 @@ async def _handle_rclone(
             form = safe_get(data, "rclone", "configForm", default={})
             if not form:
                 raise ToolError("No RClone config form data received")
-            return dict(form)
+            return form
 
         if subaction == "create_remote":
             if name is None or provider_type is None or config_data is None:
@@ -19,6 +19,7 @@ from ..core.validation import (
     validate_scalar_mapping,
     validate_str_param,
 )
+from ._system import invalidate_system_reads
 
 
 # ===========================================================================
@@ -53,10 +54,20 @@ _SETTING_MUTATIONS: dict[str, str] = {
     "update_server_identity": "mutation UpdateServerIdentity($name: String!, $comment: String, $sysModel: String) { updateServerIdentity(name: $name, comment: $comment, sysModel: $sysModel) { id name comment } }",
 }
 
-_SETTING_SUBACTIONS: set[str] = set(_SETTING_MUTATIONS)
+_SETTING_SUBACTIONS: frozenset[str] = frozenset(_SETTING_MUTATIONS)
 # update_ssh can lock out remote shell access; update_system_time can invalidate
 # TLS certificates and disrupt time-sensitive services.
-_SETTING_DESTRUCTIVE: set[str] = {"configure_ups", "update_ssh", "update_system_time"}
+_SETTING_DESTRUCTIVE: frozenset[str] = frozenset(
+    {"configure_ups", "update_ssh", "update_system_time"}
+)
+_SETTING_CONFIRM_DESCRIPTIONS: dict[str, str] = {
+    "configure_ups": "Configure UPS monitoring. This will overwrite the current "
+    "UPS daemon settings.",
+    "update_ssh": "Update the server's SSH daemon settings. Disabling SSH or "
+    "changing the port can cut off remote shell access.",
+    "update_system_time": "Update the server's system time / NTP configuration. "
+    "Clock changes can invalidate TLS certificates and break time-sensitive services.",
+}
 
 # Response field per config mutation. update_temperature returns a bare Boolean;
 # update_ssh (Vars) and update_system_time (SystemTime) return objects.
@@ -85,18 +96,13 @@ async def _handle_setting(
         subaction,
         _SETTING_DESTRUCTIVE,
         confirm,
-        {
-            "configure_ups": "Configure UPS monitoring. This will overwrite the current "
-            "UPS daemon settings.",
-            "update_ssh": "Update the server's SSH daemon settings. Disabling SSH or "
-            "changing the port can cut off remote shell access.",
-            "update_system_time": "Update the server's system time / NTP configuration. "
-            "Clock changes can invalidate TLS certificates and break time-sensitive services.",
-        },
+        _SETTING_CONFIRM_DESCRIPTIONS,
     )
 
-    with tool_error_handler("setting", subaction, logger):
-        logger.info(f"Executing unraid action=setting subaction={subaction}")
+    # Every setting mutation can change what the memoised system reads (vars,
+    # UPS config, server identity) report, so drop them once it returns.
+    with tool_error_handler("setting", subaction, logger), invalidate_system_reads():
+        logger.info("Executing unraid action=setting subaction=%s", subaction)
 
         if subaction == "update":
             if settings_input is None:
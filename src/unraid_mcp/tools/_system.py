@@ -3,47 +3,56 @@
 Covers: overview, array, network, registration, variables, metrics, network_metrics, services,
 display, display_details, config, online, owner, settings, server,
 server_details, servers, network_access_urls, flash, ups_devices, ups_device,
-ups_config, server_time, timezones, network_interfaces (25 subactions).
+ups_config, server_time, timezones, network_interfaces, snapshot (26 subactions).
 """
 
+import asyncio
+import copy
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from typing import Any
 
 from ..config.logging import logger
 from ..core import client as _client
+from ..core.cache import TTLCache
 from ..core.exceptions import ToolError, tool_error_handler
 from ..core.pagination import cap_list
-from ..core.utils import format_kb, safe_get, validate_subaction
+from ..core.utils import coerce_list, compact_query, format_kb, safe_get, validate_subaction
 
 
 # ===========================================================================
 # SYSTEM (info)
 # ===========================================================================
 
+# overview and array return computed summaries, not the raw objects, so each
+# query selects only the fields its summary reads. The disk slots need nothing
+# beyond what _analyze_disk_health classifies on.
+_ARRAY_DISK_HEALTH_FIELDS = "status warning critical"
+
 _SYSTEM_QUERIES: dict[str, str] = {
     "overview": """
         query GetSystemInfo {
           info {
-            os { platform distro release codename kernel arch hostname logofile serial build uptime }
-            cpu { manufacturer brand vendor family model stepping revision voltage speed speedmin speedmax threads cores processors socket cache }
-            memory { layout { bank type clockSpeed formFactor manufacturer partNum serialNum } }
-            baseboard { manufacturer model version serial assetTag }
-            system { manufacturer model version serial uuid sku }
-            versions { core { unraid api kernel } packages { openssl node npm pm2 git nginx php docker } }
+            os { platform distro release arch hostname uptime }
+            cpu { manufacturer brand threads cores }
+            memory { layout { bank type clockSpeed manufacturer partNum } }
+            baseboard { manufacturer model version }
+            system { manufacturer model version }
+            versions { core { unraid api kernel } }
             machineId time
           }
         }
     """,
-    "array": """
-        query GetArrayStatus {
-          array {
-            id state
-            capacity { kilobytes { free used total } disks { free used total } }
-            boot { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
-            parities { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
-            disks { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
-            caches { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
-          }
-        }
+    "array": f"""
+        query GetArrayStatus {{
+          array {{
+            state
+            capacity {{ kilobytes {{ free used total }} }}
+            parities {{ {_ARRAY_DISK_HEALTH_FIELDS} }}
+            disks {{ {_ARRAY_DISK_HEALTH_FIELDS} }}
+            caches {{ {_ARRAY_DISK_HEALTH_FIELDS} }}
+          }}
+        }}
     """,
     # Uses the vars root field — returns only the network-access subset
     # (port, portssl, localTld, useSsl) alongside servers for URL construction.
@@ -114,6 +123,27 @@ _SYSTEM_QUERIES: dict[str, str] = {
           online
         }
     """,
+    # One document for the calls an agent usually makes back to back when it
+    # wants a picture of the box (overview, array, metrics, online). Each part
+    # selects what its existing summary reads, so the shaping is reused as-is.
+    "snapshot": f"""
+        query GetSystemSnapshot {{
+          info {{
+            os {{ platform distro release arch hostname uptime }}
+            cpu {{ manufacturer brand threads cores }}
+            versions {{ core {{ unraid api kernel }} }}
+          }}
+          array {{
+            state
+            capacity {{ kilobytes {{ free used total }} }}
+            parities {{ {_ARRAY_DISK_HEALTH_FIELDS} }}
+            disks {{ {_ARRAY_DISK_HEALTH_FIELDS} }}
+            caches {{ {_ARRAY_DISK_HEALTH_FIELDS} }}
+          }}
+          metrics {{ cpu {{ percentTotal }} memory {{ total used free available percentTotal }} }}
+          online
+        }}
+    """,
     "servers": "query GetServers { servers { id name status wanip lanip localurl remoteurl } }",
     "network_access_urls": """
         query GetNetworkAccessUrls {
@@ -176,8 +206,10 @@ _SYSTEM_QUERIES: dict[str, str] = {
         }
     """,
 }
+# Several documents above are indented multi-line literals; send them compacted.
+_SYSTEM_QUERIES = {name: compact_query(q) for name, q in _SYSTEM_QUERIES.items()}
 
-_SYSTEM_SUBACTIONS: set[str] = set(_SYSTEM_QUERIES)
+_SYSTEM_SUBACTIONS: frozenset[str] = frozenset(_SYSTEM_QUERIES)
 
 # Subactions whose response is a single object echoed back under a stable key.
 # Hoisted to module scope so the dispatch table isn't rebuilt on every call.
@@ -224,6 +256,17 @@ def _required_direct_root(data: dict[str, Any], subaction: str) -> dict[str, Any
     return root
 
 
+# Disk status -> health bucket. DISK_OK is None: those disks are split into
+# healthy/warning/critical by their temperature flags instead.
+_DISK_STATUS_BUCKETS: dict[str, str | None] = {
+    "DISK_OK": None,
+    "DISK_DSBL": "failed",
+    "DISK_INVALID": "failed",
+    "DISK_NP": "missing",
+    "DISK_NEW": "new",
+}
+
+
 def _analyze_disk_health(disks: list[dict[str, Any]]) -> dict[str, int]:
     counts = {
         "healthy": 0,
@@ -235,199 +278,363 @@ def _analyze_disk_health(disks: list[dict[str, Any]]) -> dict[str, int]:
         "unknown": 0,
     }
     for disk in disks:
-        status = disk.get("status", "").upper()
-        warning = disk.get("warning")
-        critical = disk.get("critical")
-        if status == "DISK_OK":
-            counts["critical" if critical else "warning" if warning else "healthy"] += 1
-        elif status in ("DISK_DSBL", "DISK_INVALID"):
-            counts["failed"] += 1
-        elif status == "DISK_NP":
-            counts["missing"] += 1
-        elif status == "DISK_NEW":
-            counts["new"] += 1
-        else:
-            counts["unknown"] += 1
+        status = disk.get("status") or ""
+        # The API reports statuses upper-case; only normalise on a miss.
+        if status not in _DISK_STATUS_BUCKETS:
+            status = status.upper()
+        bucket = _DISK_STATUS_BUCKETS.get(status, "unknown")
+        if bucket is None:
+            if disk.get("critical"):
+                bucket = "critical"
+            elif disk.get("warning"):
+                bucket = "warning"
+            else:
+                bucket = "healthy"
+        counts[bucket] += 1
     return counts
 
 
+# Each subaction shapes its response from the query result in its own function,
+# dispatched through a table built at import (mirroring docker's read handlers)
+# instead of a chain of string comparisons. Every handler takes the same
+# (data, device_id, limit) arguments and ignores the ones it does not need.
+_SystemHandler = Callable[[dict[str, Any], str | None, int], dict[str, Any]]
+
+
+# Bound once; overview renders one line per DIMM.
+_format_memory_bank = "Bank {}: {}, {}MHz, {}, {}".format
+
+
+def _system_overview(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+    raw = data.get("info") or {}
+    if not raw:
+        raise ToolError("No system info returned from Unraid API")
+    summary: dict[str, Any] = {}
+    if raw.get("os"):
+        os_info = raw["os"]
+        summary["os"] = (
+            f"{os_info.get('distro')} {os_info.get('release')} ({os_info.get('platform')}, {os_info.get('arch')})"
+        )
+        summary["hostname"] = os_info.get("hostname")
+        summary["uptime"] = os_info.get("uptime")
+    if raw.get("cpu"):
+        cpu = raw["cpu"]
+        summary["cpu"] = (
+            f"{cpu.get('manufacturer')} {cpu.get('brand')} ({cpu.get('cores')} cores, {cpu.get('threads')} threads)"
+        )
+    if raw.get("memory") and raw["memory"].get("layout"):
+        summary["memory_layout_details"] = [
+            _format_memory_bank(
+                stick.get("bank"),
+                stick.get("type"),
+                stick.get("clockSpeed"),
+                stick.get("manufacturer"),
+                stick.get("partNum"),
+            )
+            for stick in raw["memory"]["layout"]
+        ]
+    # Fold the genuinely-useful scalar fields that only appear in the raw
+    # object into the summary rather than echoing the entire raw payload.
+    if raw.get("baseboard"):
+        bb = raw["baseboard"]
+        summary["baseboard"] = f"{bb.get('manufacturer')} {bb.get('model')} ({bb.get('version')})"
+    if raw.get("system"):
+        sysinfo = raw["system"]
+        summary["system"] = (
+            f"{sysinfo.get('manufacturer')} {sysinfo.get('model')} ({sysinfo.get('version')})"
+        )
+    if raw.get("versions") and raw["versions"].get("core"):
+        summary["versions"] = raw["versions"]["core"]
+    if raw.get("machineId"):
+        summary["machine_id"] = raw["machineId"]
+    if raw.get("time"):
+        summary["time"] = raw["time"]
+    return {"summary": summary}
+
+
+# Array disk lists and the health_summary label each one is reported under.
+_ARRAY_HEALTH_SECTIONS: tuple[tuple[str, str], ...] = (
+    ("parities", "parity_health"),
+    ("disks", "data_health"),
+    ("caches", "cache_health"),
+)
+
+
+def _system_array(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+    raw = data.get("array") or {}
+    if not raw:
+        raise ToolError("No array information returned from Unraid API")
+    summary: dict[str, Any] = {"state": raw.get("state")}
+    if raw.get("capacity") and raw["capacity"].get("kilobytes"):
+        kb = raw["capacity"]["kilobytes"]
+        summary["capacity_total"] = format_kb(kb.get("total"))
+        summary["capacity_used"] = format_kb(kb.get("used"))
+        summary["capacity_free"] = format_kb(kb.get("free"))
+    summary["num_parity_disks"] = len(raw.get("parities", []))
+    summary["num_data_disks"] = len(raw.get("disks", []))
+    summary["num_cache_pools"] = len(raw.get("caches", []))
+    health: dict[str, Any] = {}
+    # Totals are accumulated as each disk list is classified rather than by
+    # re-walking the finished health dicts once per bucket.
+    total_failed = total_critical = total_missing = total_warning = 0
+    for key, label in _ARRAY_HEALTH_SECTIONS:
+        if raw.get(key):
+            counts = _analyze_disk_health(raw[key])
+            health[label] = counts
+            total_failed += counts["failed"]
+            total_critical += counts["critical"]
+            total_missing += counts["missing"]
+            total_warning += counts["warning"]
+    summary["overall_health"] = (
+        "CRITICAL"
+        if total_failed or total_critical
+        else "DEGRADED"
+        if total_missing
+        else "WARNING"
+        if total_warning
+        else "HEALTHY"
+    )
+    summary["health_summary"] = health
+    return {"summary": summary}
+
+
+def _system_display(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+    return safe_get(data, "info", "display") or {}
+
+
+def _system_online(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+    return {"online": data.get("online")}
+
+
+def _system_settings(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+    settings = data.get("settings") or {}
+    if not settings or not settings.get("unified"):
+        raise ToolError("No settings data returned or unexpected structure")
+    values = settings["unified"].get("values") or {}
+    return values if isinstance(values, dict) else {"raw": values}
+
+
+def _system_network_metrics(
+    data: dict[str, Any], device_id: str | None, limit: int
+) -> dict[str, Any]:
+    network = safe_get(data, "metrics", "network", default=None)
+    if not isinstance(network, list):
+        raise ToolError(
+            "Unraid API returned no metrics.network payload for "
+            "system/network_metrics. Check API version, permissions, and server logs."
+        )
+    capped, meta = cap_list(network, limit)
+    return {"network": capped, "page": meta}
+
+
+def _system_server(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+    info = data.get("info") or {}
+    summary: dict[str, Any] = {}
+    if info.get("os"):
+        summary["hostname"] = info["os"].get("hostname")
+        summary["uptime"] = info["os"].get("uptime")
+    if info.get("versions") and info["versions"].get("core"):
+        summary["unraid_version"] = info["versions"]["core"].get("unraid")
+    summary["machine_id"] = info.get("machineId")
+    summary["time"] = info.get("time")
+    array = data.get("array") or {}
+    summary["array_state"] = array.get("state")
+    summary["online"] = data.get("online")
+    return summary
+
+
+def _system_network(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+    servers_data = data.get("servers") or []
+    vars_data = data.get("vars") or {}
+    access_urls = []
+    for srv in servers_data:
+        if srv.get("lanip"):
+            access_urls.append({"type": "LAN", "ipv4": srv["lanip"], "url": srv.get("localurl")})
+        if srv.get("wanip"):
+            access_urls.append({"type": "WAN", "ipv4": srv["wanip"], "url": srv.get("remoteurl")})
+    return {
+        "accessUrls": access_urls,
+        "httpPort": vars_data.get("port"),
+        "httpsPort": vars_data.get("portssl"),
+        "localTld": vars_data.get("localTld"),
+        "useSsl": vars_data.get("useSsl"),
+    }
+
+
+def _system_snapshot(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+    return {
+        "overview": _system_overview(data, device_id, limit)["summary"],
+        "array": _system_array(data, device_id, limit)["summary"],
+        "metrics": data.get("metrics") or {},
+        "online": data.get("online"),
+    }
+
+
+def _system_ups_device(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+    result = data.get("upsDeviceById")
+    if result is None:
+        raise ToolError(f"UPS device '{device_id}' not found")
+    return result
+
+
+def _direct_root_handler(subaction: str) -> _SystemHandler:
+    root_name = _SYSTEM_DIRECT_ROOTS[subaction]
+
+    def handler(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+        return {root_name: _required_direct_root(data, subaction)}
+
+    return handler
+
+
+def _simple_key_handler(subaction: str) -> _SystemHandler:
+    response_key = _SYSTEM_SIMPLE_KEYS[subaction]
+
+    def handler(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+        result = data.get(response_key)
+        if result is None:
+            if subaction == "registration":
+                raise ToolError(
+                    "No registration data returned — server may be unlicensed or API unavailable"
+                )
+            logger.warning("system/%s returned null from API", subaction)
+            return {}
+        return result
+
+    return handler
+
+
+def _list_handler(subaction: str) -> _SystemHandler:
+    response_key, output_key = _SYSTEM_LIST_ACTIONS[subaction]
+
+    def handler(data: dict[str, Any], device_id: str | None, limit: int) -> dict[str, Any]:
+        items = coerce_list(data.get(response_key))
+        # timezones returns 400+ unbounded IANA entries, and network_interfaces
+        # can grow on VLAN-heavy hosts. Cap both and surface truncation meta so
+        # callers can widen the window when needed.
+        capped, meta = cap_list(items, limit)
+        return {output_key: capped, "page": meta}
+
+    return handler
+
+
+_SYSTEM_HANDLERS: dict[str, _SystemHandler] = {
+    "overview": _system_overview,
+    "array": _system_array,
+    "display": _system_display,
+    "online": _system_online,
+    "settings": _system_settings,
+    "network_metrics": _system_network_metrics,
+    "server": _system_server,
+    "network": _system_network,
+    "snapshot": _system_snapshot,
+    "ups_device": _system_ups_device,
+    **{name: _direct_root_handler(name) for name in _SYSTEM_DIRECT_ROOTS},
+    **{name: _simple_key_handler(name) for name in _SYSTEM_SIMPLE_KEYS},
+    **{name: _list_handler(name) for name in _SYSTEM_LIST_ACTIONS},
+}
+
+
+# Short-lived memo of raw query results for subactions whose data moves on a
+# scale of minutes to hours. Agents tend to re-ask for the registration or the
+# owner within one conversation, and each repeat would otherwise be a full
+# GraphQL round-trip. Live figures (metrics, array, online, UPS devices) are
+# never cached, and neither is overview: it reports uptime and the server
+# clock, which a memoised copy would serve stale.
+# Mutations in other domains that can change these roots drop the whole memo
+# through invalidate_system_reads() once they return.
+# Every cached subaction takes no arguments, so the subaction alone is the key.
+_SYSTEM_CACHE_TTLS: dict[str, float] = {
+    "network": 120.0,
+    "registration": 600.0,
+    "owner": 600.0,
+    "flash": 600.0,
+    "ups_config": 300.0,
+    "servers": 60.0,
+    "variables": 120.0,
+}
+# Every store passes its subaction's TTL; the constructor default is unused.
+_system_cache = TTLCache(ttl=min(_SYSTEM_CACHE_TTLS.values()))
+# One lock per cached subaction so concurrent misses share a single request.
+# Python 3.12+ asyncio.Lock() is safe at module level (see core/client.py).
+_system_cache_locks: dict[str, asyncio.Lock] = {name: asyncio.Lock() for name in _SYSTEM_CACHE_TTLS}
+
+
+def invalidate_system_reads(active: bool = True) -> AbstractContextManager[None]:
+    """Drop the system read memo when the wrapped block exits, if ``active``.
+
+    For mutation handlers outside this module (setting, connect, array, plugin,
+    onboarding, customization) whose writes can change vars, servers, owner,
+    registration, flash or UPS config.
+    """
+    return _system_cache.cleared_after(active)
+
+
+# In-flight requests for the uncached (live) subactions. Identical reads that
+# arrive while one is outstanding, e.g. parallel tool calls from an agent,
+# await the same request instead of issuing their own. Each caller still
+# shapes the shared payload with its own limit.
+_system_inflight: dict[tuple[str, str | None], asyncio.Future[dict[str, Any]]] = {}
+
+
+async def _coalesced_system_request(
+    subaction: str, query: str, device_id: str | None
+) -> dict[str, Any]:
+    key = (subaction, device_id)
+    pending = _system_inflight.get(key)
+    if pending is None:
+        variables = {"id": device_id} if subaction == "ups_device" else None
+        pending = asyncio.ensure_future(_client.make_graphql_request(query, variables))
+        _system_inflight[key] = pending
+        pending.add_done_callback(lambda _: _system_inflight.pop(key, None))
+    # Shielded so one cancelled caller doesn't cancel the request under the others.
+    return await asyncio.shield(pending)
+
+
+async def _run_system_query(
+    subaction: str, query: str, handler: _SystemHandler, device_id: str | None, limit: int
+) -> dict[str, Any]:
+    lock = _system_cache_locks.get(subaction)
+    if lock is None:
+        data = await _coalesced_system_request(subaction, query, device_id)
+        return handler(data, device_id, limit)
+    async with lock:
+        data = _system_cache.get(subaction)
+        if data is not None:
+            return handler(data, device_id, limit)
+        # A mutation that clears the memo while this request is out makes its
+        # payload suspect; the generation check drops it instead of storing.
+        generation = _system_cache.generation
+        data = await _client.make_graphql_request(query, None)
+        # Shape first: a payload the handler rejects (or a null the handler
+        # turns into {}) is never memoised.
+        result = handler(data, device_id, limit)
+        if result:
+            _system_cache.set(
+                subaction, data, ttl=_SYSTEM_CACHE_TTLS[subaction], generation=generation
+            )
+        return result
+
+
 async def _handle_system(subaction: str, device_id: str | None, limit: int = 20) -> dict[str, Any]:
     validate_subaction(subaction, _SYSTEM_SUBACTIONS, "system")
 
     if subaction == "ups_device" and not device_id:
         raise ToolError("device_id is required for system/ups_device")
 
-    # Guard the lookup so an in-set-but-unhandled subaction raises a clean error
+    # Guard the lookups so an in-set-but-unhandled subaction raises a clean error
     # instead of a raw KeyError (#5). Every real system subaction is a query.
     query = _SYSTEM_QUERIES.get(subaction)
-    if query is None:
+    handler = _SYSTEM_HANDLERS.get(subaction)
+    if query is None or handler is None:
         raise ToolError(f"Unhandled system subaction '{subaction}' — this is a bug")
-    variables: dict[str, Any] | None = {"id": device_id} if subaction == "ups_device" else None
 
-    with tool_error_handler("system", subaction, logger):
-        logger.info(f"Executing unraid action=system subaction={subaction}")
-        data = await _client.make_graphql_request(query, variables)
-
-        if subaction == "overview":
-            raw = data.get("info") or {}
-            if not raw:
-                raise ToolError("No system info returned from Unraid API")
-            summary: dict[str, Any] = {}
-            if raw.get("os"):
-                os_info = raw["os"]
-                summary["os"] = (
-                    f"{os_info.get('distro')} {os_info.get('release')} ({os_info.get('platform')}, {os_info.get('arch')})"
-                )
-                summary["hostname"] = os_info.get("hostname")
-                summary["uptime"] = os_info.get("uptime")
-            if raw.get("cpu"):
-                cpu = raw["cpu"]
-                summary["cpu"] = (
-                    f"{cpu.get('manufacturer')} {cpu.get('brand')} ({cpu.get('cores')} cores, {cpu.get('threads')} threads)"
-                )
-            if raw.get("memory") and raw["memory"].get("layout"):
-                summary["memory_layout_details"] = [
-                    f"Bank {s.get('bank')}: {s.get('type')}, {s.get('clockSpeed')}MHz, {s.get('manufacturer')}, {s.get('partNum')}"
-                    for s in raw["memory"]["layout"]
-                ]
-            # Fold the genuinely-useful scalar fields that only appear in the raw
-            # object into the summary rather than echoing the entire raw payload.
-            if raw.get("baseboard"):
-                bb = raw["baseboard"]
-                summary["baseboard"] = (
-                    f"{bb.get('manufacturer')} {bb.get('model')} ({bb.get('version')})"
-                )
-            if raw.get("system"):
-                sysinfo = raw["system"]
-                summary["system"] = (
-                    f"{sysinfo.get('manufacturer')} {sysinfo.get('model')} ({sysinfo.get('version')})"
-                )
-            if raw.get("versions") and raw["versions"].get("core"):
-                summary["versions"] = raw["versions"]["core"]
-            if raw.get("machineId"):
-                summary["machine_id"] = raw["machineId"]
-            if raw.get("time"):
-                summary["time"] = raw["time"]
-            return {"summary": summary}
-
-        if subaction == "array":
-            raw = data.get("array") or {}
-            if not raw:
-                raise ToolError("No array information returned from Unraid API")
-            summary = {"state": raw.get("state")}
-            if raw.get("capacity") and raw["capacity"].get("kilobytes"):
-                kb = raw["capacity"]["kilobytes"]
-                summary["capacity_total"] = format_kb(kb.get("total"))
-                summary["capacity_used"] = format_kb(kb.get("used"))
-                summary["capacity_free"] = format_kb(kb.get("free"))
-            summary["num_parity_disks"] = len(raw.get("parities", []))
-            summary["num_data_disks"] = len(raw.get("disks", []))
-            summary["num_cache_pools"] = len(raw.get("caches", []))
-            health: dict[str, Any] = {}
-            for key, label in [
-                ("parities", "parity_health"),
-                ("disks", "data_health"),
-                ("caches", "cache_health"),
-            ]:
-                if raw.get(key):
-                    health[label] = _analyze_disk_health(raw[key])
-            total_failed = sum(h.get("failed", 0) for h in health.values())
-            total_critical = sum(h.get("critical", 0) for h in health.values())
-            total_missing = sum(h.get("missing", 0) for h in health.values())
-            total_warning = sum(h.get("warning", 0) for h in health.values())
-            summary["overall_health"] = (
-                "CRITICAL"
-                if total_failed or total_critical
-                else "DEGRADED"
-                if total_missing
-                else "WARNING"
-                if total_warning
-                else "HEALTHY"
-            )
-            summary["health_summary"] = health
-            return {"summary": summary}
-
-        if subaction == "display":
-            return dict(safe_get(data, "info", "display", default={}))
-        if subaction in _SYSTEM_DIRECT_ROOTS:
-            root_name = _SYSTEM_DIRECT_ROOTS[subaction]
-            return {root_name: _required_direct_root(data, subaction)}
-        if subaction == "online":
-            return {"online": data.get("online")}
-        if subaction == "settings":
-            settings = data.get("settings") or {}
-            if not settings or not settings.get("unified"):
-                raise ToolError("No settings data returned or unexpected structure")
-            values = settings["unified"].get("values") or {}
-            return dict(values) if isinstance(values, dict) else {"raw": values}
-        if subaction == "network_metrics":
-            network = safe_get(data, "metrics", "network", default=None)
-            if not isinstance(network, list):
-                raise ToolError(
-                    "Unraid API returned no metrics.network payload for "
-                    "system/network_metrics. Check API version, permissions, and server logs."
-                )
-            capped, meta = cap_list(network, limit)
-            return {"network": capped, "page": meta}
-        if subaction == "server":
-            info = data.get("info") or {}
-            summary: dict[str, Any] = {}
-            if info.get("os"):
-                summary["hostname"] = info["os"].get("hostname")
-                summary["uptime"] = info["os"].get("uptime")
-            if info.get("versions") and info["versions"].get("core"):
-                summary["unraid_version"] = info["versions"]["core"].get("unraid")
-            summary["machine_id"] = info.get("machineId")
-            summary["time"] = info.get("time")
-            array = data.get("array") or {}
-            summary["array_state"] = array.get("state")
-            summary["online"] = data.get("online")
-            return summary
-        if subaction == "network":
-            servers_data = data.get("servers") or []
-            vars_data = data.get("vars") or {}
-            access_urls = []
-            for srv in servers_data:
-                if srv.get("lanip"):
-                    access_urls.append(
-                        {"type": "LAN", "ipv4": srv["lanip"], "url": srv.get("localurl")}
-                    )
-                if srv.get("wanip"):
-                    access_urls.append(
-                        {"type": "WAN", "ipv4": srv["wanip"], "url": srv.get("remoteurl")}
-                    )
-            return {
-                "accessUrls": access_urls,
-                "httpPort": vars_data.get("port"),
-                "httpsPort": vars_data.get("portssl"),
-                "localTld": vars_data.get("localTld"),
-                "useSsl": vars_data.get("useSsl"),
-            }
-        if subaction == "ups_device":
-            result = data.get("upsDeviceById")
-            if result is None:
-                raise ToolError(f"UPS device '{device_id}' not found")
-            return dict(result)
-
-        if subaction in _SYSTEM_SIMPLE_KEYS:
-            result = data.get(_SYSTEM_SIMPLE_KEYS[subaction])
-            if result is None:
-                if subaction == "registration":
-                    raise ToolError(
-                        "No registration data returned — server may be unlicensed or API unavailable"
-                    )
-                logger.warning("system/%s returned null from API", subaction)
-                return {}
-            return dict(result)
-
-        if subaction in _SYSTEM_LIST_ACTIONS:
-            response_key, output_key = _SYSTEM_LIST_ACTIONS[subaction]
-            raw_items = data.get(response_key) or []
-            items = list(raw_items) if isinstance(raw_items, list) else []
-            # timezones returns 400+ unbounded IANA entries, and network_interfaces
-            # can grow on VLAN-heavy hosts. Cap both and surface truncation meta so
-            # callers can widen the window when needed.
-            capped, meta = cap_list(items, limit)
-            return {output_key: capped, "page": meta}
+    # Handlers return parts of the raw payload, which is either memoised or shared
+    # with coalesced callers, so hand each caller its own copy to mutate.
+    data = _system_cache.get(subaction)
+    if data is not None:
+        logger.debug("Serving unraid action=system subaction=%s from cache", subaction)
+        return copy.deepcopy(handler(data, device_id, limit))
 
-        raise ToolError(f"Unhandled system subaction '{subaction}' — this is a bug")
+    with tool_error_handler("system", subaction, logger):
+        logger.info("Executing unraid action=system subaction=%s", subaction)
+        return copy.deepcopy(await _run_system_query(subaction, query, handler, device_id, limit))
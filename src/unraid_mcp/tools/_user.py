@@ -19,7 +19,7 @@ _USER_QUERIES: dict[str, str] = {
     "me": "query GetMe { me { id name description roles } }",
 }
 
-_USER_SUBACTIONS: set[str] = set(_USER_QUERIES)
+_USER_SUBACTIONS: frozenset[str] = frozenset(_USER_QUERIES)
 
 
 async def _handle_user(subaction: str) -> dict[str, Any]:
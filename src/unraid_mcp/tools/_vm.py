@@ -37,8 +37,8 @@ _VM_MUTATIONS: dict[str, str] = {
     "reset": "mutation ResetVM($id: PrefixedID!) { vm { reset(id: $id) } }",
 }
 
-_VM_SUBACTIONS: set[str] = set(_VM_QUERIES) | set(_VM_MUTATIONS) | {"details"}
-_VM_DESTRUCTIVE: set[str] = {"force_stop", "reset"}
+_VM_SUBACTIONS: frozenset[str] = frozenset(set(_VM_QUERIES) | set(_VM_MUTATIONS) | {"details"})
+_VM_DESTRUCTIVE: frozenset[str] = frozenset({"force_stop", "reset"})
 _VM_MUTATION_FIELDS: dict[str, str] = {"force_stop": "forceStop"}
 
 
@@ -61,7 +61,7 @@ async def _handle_vm(
     )
 
     with tool_error_handler("vm", subaction, logger):
-        logger.info(f"Executing unraid action=vm subaction={subaction}")
+        logger.info("Executing unraid action=vm subaction=%s", subaction)
 
         if subaction == "list":
             data = await _client.make_graphql_request(_VM_QUERIES["list"])
@@ -84,7 +84,7 @@ async def _handle_vm(
                 vms = [vms]
             for vm in vms:
                 if vm.get("uuid") == vm_id or vm.get("id") == vm_id or vm.get("name") == vm_id:
-                    return dict(vm)
+                    return vm
             available = [f"{v.get('name')} (UUID: {v.get('uuid')})" for v in vms]
             raise ToolError(f"VM '{vm_id}' not found. Available: {', '.join(available)}")
 
@@ -4,13 +4,13 @@ Provides the `unraid` tool with 19 actions, each routing to domain-specific
 subactions via the action + subaction pattern.
 
 Actions:
-  system       - Server info, metrics, network, UPS (25 subactions)
+  system       - Server info, metrics, network, UPS (26 subactions)
   health       - Health checks, connection test, diagnostics, setup (4 subactions)
   array        - Parity checks, array state, disk operations (14 subactions)
-  disk         - Shares, physical disks, log files (6 subactions)
+  disk         - Shares, physical disks, log files (7 subactions)
   docker       - Container lifecycle, updates, organizer, networks (26 subactions)
   vm           - Virtual machine lifecycle (9 subactions)
-  notification - System notifications CRUD (13 subactions)
+  notification - System notifications CRUD (14 subactions)
   key          - API key & permission management (13 subactions)
   plugin       - Plugin management and async installs (8 subactions)
   rclone       - Cloud storage remote management (4 subactions)
@@ -25,8 +25,9 @@ Actions:
   help         - Return the full Markdown action/subaction reference (no subaction)
 """
 
+import sys
 from collections.abc import Awaitable, Callable
-from typing import Any, Literal, get_args
+from typing import Any, Literal
 
 from fastmcp import Context, FastMCP
 from pydantic import BaseModel, Field
@@ -153,13 +154,13 @@ Single entry point for all operations. Use `action` + `subaction` to select an o
 
 | Action | Subactions | Notes |
 |--------|-----------|-------|
-| `system` | `overview`, `array`, `network`, `registration`, `variables`, `metrics`, `network_metrics`, `services`, `display`, `display_details`, `config`, `online`, `owner`, `settings`, `server`, `server_details`, `servers`, `network_access_urls`, `flash`, `ups_devices`, `ups_device`, `ups_config`, `server_time`, `timezones`, `network_interfaces` | |
+| `system` | `overview`, `array`, `network`, `registration`, `variables`, `metrics`, `network_metrics`, `services`, `display`, `display_details`, `config`, `online`, `owner`, `settings`, `server`, `server_details`, `servers`, `network_access_urls`, `flash`, `ups_devices`, `ups_device`, `ups_config`, `server_time`, `timezones`, `network_interfaces`, `snapshot` | |
 | `health` | `check`, `test_connection`, `diagnose`, `setup` | |
 | `array` | `parity_status`, `parity_history`, `assignable_disks`, `parity_start`, `parity_pause`, `parity_resume`, `parity_cancel`, `start_array`, `stop_array`*, `add_disk`, `remove_disk`*, `mount_disk`, `unmount_disk`, `clear_disk_stats`* | |
-| `disk` | `shares`, `disks`, `disk_details`, `log_files`, `logs`, `flash_backup`* | |
+| `disk` | `shares`, `disks`, `overview`, `disk_details`, `log_files`, `logs`, `flash_backup`* | |
 | `docker` | `list`, `details`, `logs`, `ports`, `start`, `stop`, `restart`, `unpause`, `networks`, `network_details`, `remove_container`*, `update_container`, `update_containers`, `update_all_containers`, `update_autostart`, `refresh_digests`, `sync_template_paths`, `reset_template_mappings`*, `create_folder`, `create_folder_with_items`, `rename_folder`, `set_folder_children`, `delete_entries`*, `move_entries_to_folder`, `move_items_to_position`, `update_view_preferences` | organizer ops use `organizer_input` |
 | `vm` | `list`, `details`, `start`, `stop`, `pause`, `resume`, `force_stop`*, `reboot`, `reset`* | |
-| `notification` | `overview`, `list`, `create`, `notify_if_unique`, `archive`, `mark_unread`, `recalculate`, `archive_all`, `archive_many`, `unarchive_many`, `unarchive_all`, `delete`*, `delete_archived`* | |
+| `notification` | `overview`, `list`, `dashboard`, `create`, `notify_if_unique`, `archive`, `mark_unread`, `recalculate`, `archive_all`, `archive_many`, `unarchive_many`, `unarchive_all`, `delete`*, `delete_archived`* | |
 | `key` | `list`, `get`, `possible_roles`, `possible_permissions`, `permissions_for_roles`, `preview_permissions`, `auth_actions`, `creation_form_schema`, `create`, `update`, `delete`*, `add_role`, `remove_role` | |
 | `plugin` | `list`, `installed_unraid`, `install_operations`, `install_operation`, `add`, `remove`*, `install`*, `install_language`* | install runs a .plg as root |
 | `rclone` | `list_remotes`, `config_form`, `create_remote`, `delete_remote`* | |
@@ -325,6 +326,9 @@ class UnraidInput(BaseModel):
     # disk
     log_path: str | None = Field(default=None, description="Log file path (disk/logs).")
     tail_lines: int = Field(default=100, description="Number of trailing log lines (disk/logs).")
+    start_line: int | None = Field(
+        default=None, description="1-indexed line to read forward from (disk/logs)."
+    )
     remote_name: str | None = Field(
         default=None, description="Rclone remote name (disk/flash_backup)."
     )
@@ -471,6 +475,11 @@ class UnraidInput(BaseModel):
     )
 
 
+# Field names snapshotted once: the tool body filters its ~60 locals against this
+# on every call, and `UnraidInput.model_fields` is a metaclass property lookup.
+_INPUT_FIELDS: frozenset[str] = frozenset(UnraidInput.model_fields)
+
+
 # ===========================================================================
 # DISPATCH REGISTRY
 # ===========================================================================
@@ -511,6 +520,7 @@ async def _dispatch_disk(inp: UnraidInput, ctx: Context | None) -> dict[str, Any
         disk_id=inp.disk_id,
         log_path=inp.log_path,
         tail_lines=inp.tail_lines,
+        start_line=inp.start_line,
         remote_name=inp.remote_name,
         source_path=inp.source_path,
         destination_path=inp.destination_path,
@@ -689,22 +699,22 @@ _ACTION_DISPATCH: dict[str, _ActionHandler] = {
 }
 
 _OPERATION_REGISTRY: dict[str, frozenset[str]] = {
-    "system": frozenset(_SYSTEM_SUBACTIONS),
-    "health": frozenset(_HEALTH_SUBACTIONS),
-    "array": frozenset(_ARRAY_SUBACTIONS),
-    "disk": frozenset(_DISK_SUBACTIONS),
-    "docker": frozenset(_DOCKER_SUBACTIONS),
-    "vm": frozenset(_VM_SUBACTIONS),
-    "notification": frozenset(_NOTIFICATION_SUBACTIONS),
-    "key": frozenset(_KEY_SUBACTIONS),
-    "plugin": frozenset(_PLUGIN_SUBACTIONS),
-    "rclone": frozenset(_RCLONE_SUBACTIONS),
-    "setting": frozenset(_SETTING_SUBACTIONS),
-    "connect": frozenset(_CONNECT_SUBACTIONS),
-    "onboarding": frozenset(_ONBOARDING_SUBACTIONS),
-    "customization": frozenset(_CUSTOMIZATION_SUBACTIONS),
-    "oidc": frozenset(_OIDC_SUBACTIONS),
-    "user": frozenset(_USER_SUBACTIONS),
+    "system": _SYSTEM_SUBACTIONS,
+    "health": _HEALTH_SUBACTIONS,
+    "array": _ARRAY_SUBACTIONS,
+    "disk": _DISK_SUBACTIONS,
+    "docker": _DOCKER_SUBACTIONS,
+    "vm": _VM_SUBACTIONS,
+    "notification": _NOTIFICATION_SUBACTIONS,
+    "key": _KEY_SUBACTIONS,
+    "plugin": _PLUGIN_SUBACTIONS,
+    "rclone": _RCLONE_SUBACTIONS,
+    "setting": _SETTING_SUBACTIONS,
+    "connect": _CONNECT_SUBACTIONS,
+    "onboarding": _ONBOARDING_SUBACTIONS,
+    "customization": _CUSTOMIZATION_SUBACTIONS,
+    "oidc": _OIDC_SUBACTIONS,
+    "user": _USER_SUBACTIONS,
     "live": frozenset(
         {
             "cpu",
@@ -729,6 +739,8 @@ _OPERATION_REGISTRY: dict[str, frozenset[str]] = {
     "subscriptions": frozenset({"diagnose", "test_query"}),
     "help": frozenset(),
 }
+# Rendered once: an agent guessing action names can hit the error path repeatedly.
+_VALID_ACTIONS_HINT = str(sorted(_OPERATION_REGISTRY))
 
 
 def register_unraid_tool(
@@ -762,6 +774,7 @@ def register_unraid_tool(
         # disk
         log_path: str | None = None,
         tail_lines: int = 100,
+        start_line: int | None = None,
         remote_name: str | None = None,
         source_path: str | None = None,
         destination_path: str | None = None,
@@ -842,7 +855,7 @@ def register_unraid_tool(
         │                 │ owner, settings,                                                     │
         │                 │ server, server_details, servers, network_access_urls, flash,         │
         │                 │ ups_devices, ups_device, ups_config, server_time, timezones,         │
-        │                 │ network_interfaces                                                   │
+        │                 │ network_interfaces, snapshot                                         │
         ├─────────────────┼──────────────────────────────────────────────────────────────────────┤
         │ health          │ check, test_connection, diagnose, setup                              │
         ├─────────────────┼──────────────────────────────────────────────────────────────────────┤
@@ -851,7 +864,8 @@ def register_unraid_tool(
         │                 │ start_array, stop_array*, add_disk, remove_disk*, mount_disk,        │
         │                 │ unmount_disk, clear_disk_stats*                                      │
         ├─────────────────┼──────────────────────────────────────────────────────────────────────┤
-        │ disk            │ shares, disks, disk_details, log_files, logs, flash_backup*          │
+        │ disk            │ shares, disks, overview, disk_details, log_files, logs,              │
+        │                 │ flash_backup*                                                        │
         ├─────────────────┼──────────────────────────────────────────────────────────────────────┤
         │ docker          │ list, details, logs, ports, start, stop, restart, unpause,           │
         │                 │ networks, network_details, remove_container*, update_container,      │
@@ -864,9 +878,9 @@ def register_unraid_tool(
         │ vm              │ list, details, start, stop, pause, resume,                           │
         │                 │ force_stop*, reboot, reset*                                          │
         ├─────────────────┼──────────────────────────────────────────────────────────────────────┤
-        │ notification    │ overview, list, create, notify_if_unique, archive, mark_unread,      │
-        │                 │ recalculate, archive_all, archive_many, unarchive_many,              │
-        │                 │ unarchive_all, delete*, delete_archived*                             │
+        │ notification    │ overview, list, dashboard, create, notify_if_unique, archive,        │
+        │                 │ mark_unread, recalculate, archive_all, archive_many,                 │
+        │                 │ unarchive_many, unarchive_all, delete*, delete_archived*             │
         ├─────────────────┼──────────────────────────────────────────────────────────────────────┤
         │ key             │ list, get, possible_roles, possible_permissions,                     │
         │                 │ permissions_for_roles, preview_permissions, auth_actions,            │
@@ -923,30 +937,33 @@ def register_unraid_tool(
                 raise ToolError("help does not accept a subaction")
             return _HELP_TEXT
 
+        allowed_subactions = _OPERATION_REGISTRY.get(action)
+        if allowed_subactions is None:
+            raise ToolError(f"Invalid action '{action}'. Must be one of: {_VALID_ACTIONS_HINT}")
+        validate_subaction(subaction, allowed_subactions, action)
+        # Every valid subaction is an identifier-like literal that CPython already
+        # interns, so interning the caller's copy lets the `subaction == "..."`
+        # branches in the domain handlers match on identity. Done only after
+        # validation so arbitrary input never lands in the intern table.
+        subaction = sys.intern(subaction)
+
         # Pack the flat keyword args into the structured input model. The tool
         # signature stays flat (so the MCP input schema is unchanged), but the
         # rest of the routing operates on the validated model. Build the model
         # straight from the bound parameters instead of restating all ~60 names by
-        # hand (#4): at this point locals() holds exactly the tool parameters, so
+        # hand (#4): at this point locals() holds the tool parameters, so
         # we drop `ctx` (not a model field) and pass the rest. `extra="forbid"`
         # still catches any signature/model drift, and a contract test asserts the
         # two field sets stay identical. (locals() is captured into a variable
-        # first because a comprehension has its own scope.)
+        # first because a comprehension has its own scope; the _INPUT_FIELDS filter
+        # also drops the validation locals above.)
         _params = locals()
-        inp = UnraidInput(**{k: v for k, v in _params.items() if k in UnraidInput.model_fields})
+        inp = UnraidInput(**{k: v for k, v in _params.items() if k in _INPUT_FIELDS})
 
-        allowed_subactions = _OPERATION_REGISTRY.get(action)
-        if allowed_subactions is None:
-            raise ToolError(
-                f"Invalid action '{action}'. Must be one of: {sorted(_OPERATION_REGISTRY)}"
-            )
-        validate_subaction(subaction, set(allowed_subactions), action)
-
-        handler = dispatch.get(action)
-        if handler is None:
-            raise ToolError(
-                f"Invalid action '{action}'. Must be one of: {sorted(get_args(UNRAID_ACTIONS))}"
-            )
-        return await handler(inp, ctx)
+        # `action` already passed the _OPERATION_REGISTRY check above, and every
+        # registry key except the inline `help` has an adapter (pinned by
+        # test_operation_registry_covers_every_action_and_subactions_are_nonempty),
+        # so index directly rather than re-checking membership on every call.
+        return await dispatch[action](inp, ctx)
 
     logger.info("Unraid tool registered successfully")
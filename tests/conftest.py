@@ -46,6 +46,33 @@ def mock_graphql_request() -> Generator[AsyncMock, None, None]:
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def _reset_docker_container_index() -> Generator[None, None, None]:
+    """Drop the short-lived docker/list index so it can't leak between tests.
+
+    A `list` in one test would otherwise let a `details` in the next test skip its
+    resolve query and consume the wrong mocked response.
+    """
+    from unraid_mcp.tools import _docker
+
+    _docker._forget_container_index()
+    yield
+    _docker._forget_container_index()
+
+
+@pytest.fixture(autouse=True)
+def _reset_read_caches() -> Generator[None, None, None]:
+    """Drop memoised system, key and notification reads between tests."""
+    from unraid_mcp.tools import _key, _notification, _system
+
+    caches = (_system._system_cache, _key._key_cache, _notification._notification_cache)
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
 def make_tool_fn(
     module_path: str,
     register_fn_name: str,
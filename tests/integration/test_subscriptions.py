@@ -1126,3 +1126,10 @@ class TestSSLContext:
         ):
             build_ws_ssl_context("wss://test.local/graphql")
             mock_ctx.assert_called_once_with(cafile="/path/to/ca-bundle.crt")
+
+    def test_context_is_reused_across_connections(self) -> None:
+        from unraid_mcp.subscriptions.utils import build_ws_ssl_context
+
+        with patch("unraid_mcp.config.settings.UNRAID_VERIFY_SSL", False):
+            first = build_ws_ssl_context("wss://test.local/graphql")
+            assert build_ws_ssl_context("wss://other.local/graphql") is first
@@ -342,6 +342,7 @@ class TestNotificationsEnumFuzzing:
         valid_subactions = {
             "overview",
             "list",
+            "dashboard",
             "create",
             "archive",
             "mark_unread",
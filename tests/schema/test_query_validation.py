@@ -174,9 +174,16 @@ class TestInfoQueries:
             "server_time",
             "timezones",
             "network_interfaces",
+            "snapshot",
         }
         assert set(QUERIES.keys()) == expected_actions
 
+    def test_snapshot_query(self, schema: GraphQLSchema) -> None:
+        from unraid_mcp.tools._system import _SYSTEM_QUERIES as QUERIES
+
+        errors = _validate_operation(schema, QUERIES["snapshot"])
+        assert not errors, f"snapshot query validation failed: {errors}"
+
     def test_network_interfaces_query(self, schema: GraphQLSchema) -> None:
         from unraid_mcp.tools._system import _SYSTEM_QUERIES as QUERIES
 
@@ -351,10 +358,16 @@ class TestStorageQueries:
         errors = _validate_operation(schema, QUERIES["logs"])
         assert not errors, f"logs query validation failed: {errors}"
 
+    def test_overview_query(self, schema: GraphQLSchema) -> None:
+        from unraid_mcp.tools._disk import _DISK_QUERIES as QUERIES
+
+        errors = _validate_operation(schema, QUERIES["overview"])
+        assert not errors, f"overview query validation failed: {errors}"
+
     def test_all_storage_queries_covered(self, schema: GraphQLSchema) -> None:
         from unraid_mcp.tools._disk import _DISK_QUERIES as QUERIES
 
-        expected = {"shares", "disks", "disk_details", "log_files", "logs"}
+        expected = {"shares", "disks", "overview", "disk_details", "log_files", "logs"}
         assert set(QUERIES.keys()) == expected
 
 
@@ -579,7 +592,13 @@ class TestNotificationQueries:
     def test_all_notification_queries_covered(self, schema: GraphQLSchema) -> None:
         from unraid_mcp.tools._notification import _NOTIFICATION_QUERIES as QUERIES
 
-        assert set(QUERIES.keys()) == {"overview", "list"}
+        assert set(QUERIES.keys()) == {"overview", "list", "dashboard"}
+
+    def test_dashboard_query(self, schema: GraphQLSchema) -> None:
+        from unraid_mcp.tools._notification import _NOTIFICATION_QUERIES as QUERIES
+
+        errors = _validate_operation(schema, QUERIES["dashboard"])
+        assert not errors, f"dashboard query validation failed: {errors}"
 
 
 class TestNotificationMutations:
@@ -609,6 +628,13 @@ class TestNotificationMutations:
         errors = _validate_operation(schema, MUTATIONS["delete"])
         assert not errors, f"delete mutation validation failed: {errors}"
 
+    def test_delete_many_mutation(self, schema: GraphQLSchema) -> None:
+        from unraid_mcp.tools._notification import _delete_many_document
+
+        for count in (1, 3):
+            errors = _validate_operation(schema, _delete_many_document(count))
+            assert not errors, f"delete_many({count}) mutation validation failed: {errors}"
+
     def test_delete_archived_mutation(self, schema: GraphQLSchema) -> None:
         from unraid_mcp.tools._notification import _NOTIFICATION_MUTATIONS as MUTATIONS
 
@@ -842,23 +868,9 @@ class TestHealthQueries:
         assert not errors, f"test_connection query validation failed: {errors}"
 
     def test_comprehensive_check_query(self, schema: GraphQLSchema) -> None:
-        query = """
-        query ComprehensiveHealthCheck {
-          info {
-            time
-            versions { core { unraid } }
-            os { uptime }
-          }
-          array { state }
-          notifications {
-            overview { unread { alert warning total } }
-          }
-          docker {
-            containers { id state status }
-          }
-        }
-        """
-        errors = _validate_operation(schema, query)
+        from unraid_mcp.tools._health import _HEALTH_QUERIES as QUERIES
+
+        errors = _validate_operation(schema, QUERIES["comprehensive_health"])
         assert not errors, f"comprehensive check query validation failed: {errors}"
 
 
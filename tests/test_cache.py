@@ -0,0 +1,245 @@
+"""Tests for the shared read memo and the domains that use it."""
+
+from collections.abc import Callable, Generator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from conftest import make_tool_fn
+
+from unraid_mcp.core.cache import TTLCache
+
+
+@pytest.fixture
+def _mock_graphql() -> Generator[AsyncMock, None, None]:
+    with patch("unraid_mcp.core.client.make_graphql_request", new_callable=AsyncMock) as mock:
+        yield mock
+
+
+def _make_tool() -> Callable[..., Any]:
+    return make_tool_fn("unraid_mcp.tools.unraid", "register_unraid_tool", "unraid")
+
+
+class TestTTLCache:
+    def test_get_returns_stored_value(self) -> None:
+        cache = TTLCache(ttl=5.0)
+        cache.set("k", {"v": 1})
+        assert cache.get("k") == {"v": 1}
+        assert cache.get("missing") is None
+
+    def test_entry_expires_after_ttl(self) -> None:
+        cache = TTLCache(ttl=5.0)
+        with patch("unraid_mcp.core.cache.time.monotonic", return_value=1000.0):
+            cache.set("k", 1)
+            cache.set("long", 2, ttl=60.0)
+        with patch("unraid_mcp.core.cache.time.monotonic", return_value=1005.0):
+            assert cache.get("k") is None
+            assert cache.get("long") == 2
+        assert len(cache) == 1
+
+    def test_oldest_entry_is_evicted_at_maxsize(self) -> None:
+        cache = TTLCache(ttl=5.0, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        cache.set("c", 4)
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (3, 4)
+        assert len(cache) == 2
+
+    def test_default_maxsize_bounds_the_memo(self) -> None:
+        cache = TTLCache(ttl=5.0)
+        for i in range(1000):
+            cache.set(("get", f"k:{i}"), i)
+        assert len(cache) == 256
+
+    def test_store_from_before_a_clear_is_dropped(self) -> None:
+        cache = TTLCache(ttl=5.0)
+        generation = cache.generation
+        cache.clear()
+        cache.set("k", "stale", generation=generation)
+        assert cache.get("k") is None
+        cache.set("k", "fresh", generation=cache.generation)
+        assert cache.get("k") == "fresh"
+
+    def test_cleared_after_clears_on_error(self) -> None:
+        cache = TTLCache(ttl=5.0)
+        cache.set("k", 1)
+        with pytest.raises(RuntimeError), cache.cleared_after():
+            assert cache.get("k") == 1
+            raise RuntimeError("boom")
+        assert cache.get("k") is None
+
+    def test_cleared_after_inactive_keeps_entries(self) -> None:
+        cache = TTLCache(ttl=5.0)
+        cache.set("k", 1)
+        with cache.cleared_after(False):
+            pass
+        assert cache.get("k") == 1
+
+
+# Per domain: a cached read, the mutation that must drop it, and the payloads
+# for read -> mutation -> read.
+_DOMAIN_CASES = [
+    pytest.param(
+        {"action": "system", "subaction": "ups_config"},
+        {
+            "action": "setting",
+            "subaction": "configure_ups",
+            "ups_config": {"upsName": "new"},
+            "confirm": True,
+        },
+        [
+            {"upsConfiguration": {"upsName": "old"}},
+            {"configureUps": True},
+            {"upsConfiguration": {"upsName": "new"}},
+        ],
+        {"upsName": "new"},
+        id="system",
+    ),
+    pytest.param(
+        {"action": "key", "subaction": "list"},
+        {"action": "key", "subaction": "create", "name": "new"},
+        [
+            {"apiKeys": []},
+            {"apiKey": {"create": {"id": "k:2", "name": "new", "key": "s", "roles": []}}},
+            {"apiKeys": [{"id": "k:2", "name": "new"}]},
+        ],
+        {"keys": [{"id": "k:2", "name": "new"}]},
+        id="key",
+    ),
+    pytest.param(
+        {"action": "notification", "subaction": "overview"},
+        {"action": "notification", "subaction": "archive", "notification_id": "n:1"},
+        [
+            {"notifications": {"overview": {"unread": {"total": 1}}}},
+            {"archiveNotification": {"id": "n:1"}},
+            {"notifications": {"overview": {"unread": {"total": 0}}}},
+        ],
+        {"unread": {"total": 0}},
+        id="notification",
+    ),
+]
+
+
+class TestDomainReadCaches:
+    @pytest.mark.parametrize(("read", "mutation", "payloads", "expected"), _DOMAIN_CASES)
+    async def test_repeat_read_is_served_from_cache(
+        self,
+        _mock_graphql: AsyncMock,
+        read: dict[str, Any],
+        mutation: dict[str, Any],
+        payloads: list[dict[str, Any]],
+        expected: dict[str, Any],
+    ) -> None:
+        _mock_graphql.return_value = payloads[0]
+        tool_fn = _make_tool()
+        first = await tool_fn(**read)
+        assert await tool_fn(**read) == first
+        assert _mock_graphql.await_count == 1
+
+    @pytest.mark.parametrize(("read", "mutation", "payloads", "expected"), _DOMAIN_CASES)
+    async def test_mutation_drops_cache(
+        self,
+        _mock_graphql: AsyncMock,
+        read: dict[str, Any],
+        mutation: dict[str, Any],
+        payloads: list[dict[str, Any]],
+        expected: dict[str, Any],
+    ) -> None:
+        _mock_graphql.side_effect = payloads
+        tool_fn = _make_tool()
+        await tool_fn(**read)
+        await tool_fn(**mutation)
+        result = await tool_fn(**read)
+        assert {k: result[k] for k in expected} == expected
+        assert _mock_graphql.await_count == 3
+
+    @pytest.mark.parametrize(("read", "mutation", "payloads", "expected"), _DOMAIN_CASES)
+    async def test_read_during_mutation_is_not_cached(
+        self,
+        _mock_graphql: AsyncMock,
+        read: dict[str, Any],
+        mutation: dict[str, Any],
+        payloads: list[dict[str, Any]],
+        expected: dict[str, Any],
+    ) -> None:
+        tool_fn = _make_tool()
+
+        async def read_mid_mutation(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            # The first request is the mutation; a read lands before it returns.
+            if _mock_graphql.await_count == 1:
+                await tool_fn(**read)
+                return payloads[1]
+            return payloads[0] if _mock_graphql.await_count == 2 else payloads[2]
+
+        _mock_graphql.side_effect = read_mid_mutation
+        await tool_fn(**mutation)
+        result = await tool_fn(**read)
+        assert {k: result[k] for k in expected} == expected
+        assert _mock_graphql.await_count == 3
+
+
+# Per memoised read: the read, the re-read it feeds, the payload, the path to a
+# value nested in the first result, and the re-read field that must be unchanged.
+_MEMOISED_READS = [
+    pytest.param(
+        {"action": "key", "subaction": "list"},
+        {"action": "key", "subaction": "list"},
+        {"apiKeys": [{"id": "k:1", "name": "a"}]},
+        ("keys", 0, "name"),
+        "keys",
+        [{"id": "k:1", "name": "a"}],
+        id="key-list",
+    ),
+    pytest.param(
+        {"action": "key", "subaction": "get", "key_id": "k:1"},
+        {"action": "key", "subaction": "get", "key_id": "k:1"},
+        {"apiKey": {"id": "k:1", "roles": ["ADMIN"]}},
+        ("roles", 0),
+        "roles",
+        ["ADMIN"],
+        id="key-get",
+    ),
+    pytest.param(
+        {"action": "notification", "subaction": "list"},
+        {"action": "notification", "subaction": "list"},
+        {"notifications": {"list": [{"id": "n:1", "title": "t"}]}},
+        ("notifications", 0, "title"),
+        "notifications",
+        [{"id": "n:1", "title": "t"}],
+        id="notification-list",
+    ),
+    pytest.param(
+        {"action": "notification", "subaction": "dashboard"},
+        {"action": "notification", "subaction": "overview"},
+        {"notifications": {"overview": {"unread": {"total": 1}}, "list": []}},
+        ("overview", "unread", "total"),
+        "unread",
+        {"total": 1},
+        id="notification-dashboard",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("read", "reread", "payload", "path", "field", "expected"), _MEMOISED_READS
+)
+async def test_mutating_a_result_leaves_the_memo_intact(
+    _mock_graphql: AsyncMock,
+    read: dict[str, Any],
+    reread: dict[str, Any],
+    payload: dict[str, Any],
+    path: tuple[str | int, ...],
+    field: str,
+    expected: Any,
+) -> None:
+    _mock_graphql.return_value = payload
+    tool_fn = _make_tool()
+    target = await tool_fn(**read)
+    for step in path[:-1]:
+        target = target[step]
+    target[path[-1]] = "changed"
+    result = await tool_fn(**reread)
+    assert result[field] == expected
+    assert _mock_graphql.await_count == 1
@@ -407,7 +407,41 @@ class TestMakeGraphQLRequestSuccess:
         assert result == {"container": {"name": "plex"}}
         # Verify variables were passed in the payload
         call_kwargs = mock_client.post.call_args
-        assert call_kwargs.kwargs["json"]["variables"] == {"id": "abc123"}
+        assert json.loads(call_kwargs.kwargs["content"])["variables"] == {"id": "abc123"}
+
+    async def test_query_with_variables_matches_one_shot_encoding(self) -> None:
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.json.return_value = {"data": {}}
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+
+        query = "query ($id: PrefixedID!) { upsDeviceById(id: $id) { id } }"
+        variables = {"id": "ups:1", "note": 'caf\u00e9 "quoted"'}
+        with patch("unraid_mcp.core.client.get_http_client", return_value=mock_client):
+            await make_graphql_request(query, variables=variables)
+        body = mock_client.post.call_args.kwargs["content"]
+        assert body == json.dumps(
+            {"query": query, "variables": variables},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    async def test_variable_free_query_reuses_encoded_body(self) -> None:
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.json.return_value = {"data": {}}
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+
+        with patch("unraid_mcp.core.client.get_http_client", return_value=mock_client):
+            await make_graphql_request("{ info { os } }")
+            await make_graphql_request("{ info { os } }")
+        first, second = (c.kwargs["content"] for c in mock_client.post.call_args_list)
+        assert first is second
+        assert json.loads(first) == {"query": "{ info { os } }"}
 
     async def test_custom_timeout_passed(self) -> None:
         mock_response = MagicMock()
@@ -1,6 +1,7 @@
 """Tests for docker subactions of the consolidated unraid tool."""
 
 from collections.abc import Generator
+from typing import Any, ClassVar
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -251,6 +252,231 @@ class TestDockerNullNameSafety:
             await tool_fn(action="docker", subaction="start", container_id="ghost")
 
 
+class TestContainerIndex:
+    def test_exact_lookup_prefers_first_occurrence(self) -> None:
+        from unraid_mcp.tools._docker import _build_container_index, _find_container
+
+        containers = [
+            {"id": "c1:local", "names": ["plex"]},
+            {"id": "c2:local", "names": ["plex", "other"]},
+        ]
+        index = _build_container_index(containers)
+        assert _find_container("plex", index) is containers[0]
+        assert _find_container("c2:local", index) is containers[1]
+        assert index.names == ("plex", "plex", "other")
+
+    def test_fuzzy_lookup_uses_prelowered_names(self) -> None:
+        from unraid_mcp.tools._docker import _build_container_index, _find_container
+
+        containers = [{"id": "c1:local", "names": ["Plex-Media"]}]
+        index = _build_container_index(containers)
+        assert _find_container("plex", index) is containers[0]
+        assert _find_container("MEDIA", index) is containers[0]
+        assert _find_container("plex", index, strict=True) is None
+
+    def test_prefix_matches_keep_list_order_and_dedupe(self) -> None:
+        from unraid_mcp.tools._docker import _build_container_index, _prefix_matches
+
+        containers = [
+            {"id": "c1", "names": ["radarr"]},
+            {"id": "c2", "names": ["Plexpy", "plex-stats"]},
+            {"id": "c3", "names": []},
+            {"id": "c4", "names": ["plex"]},
+        ]
+        index = _build_container_index(containers)
+        assert _prefix_matches(index, "plex") == [containers[1], containers[3]]
+        assert _prefix_matches(index, "rad") == [containers[0]]
+        assert _prefix_matches(index, "zzz") == []
+
+    def test_full_id_skips_fuzzy_pass(self) -> None:
+        from unraid_mcp.tools._docker import _build_container_index, _find_container
+
+        full_id = "a" * 64
+        # The name contains the ID as a substring; only an exact ID hit may match.
+        containers = [{"id": "c1:local", "names": [f"backup-{full_id}"]}]
+        index = _build_container_index(containers)
+        assert _find_container(full_id, index) is None
+        containers.append({"id": full_id, "names": ["other"]})
+        assert _find_container(full_id, _build_container_index(containers)) is containers[1]
+
+
+class TestListIndexReuse:
+    _LIST: ClassVar[dict[str, Any]] = {
+        "docker": {"containers": [{"id": "c1:local", "names": ["plex"], "state": "running"}]}
+    }
+    _DETAILS: ClassVar[dict[str, Any]] = {
+        "docker": {"container": {"id": "c1:local", "names": ["plex"]}}
+    }
+
+    async def test_details_after_list_skips_resolve_query(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.side_effect = [self._LIST, self._DETAILS]
+        tool_fn = _make_tool()
+        await tool_fn(action="docker", subaction="list")
+        result = await tool_fn(action="docker", subaction="details", container_id="plex")
+        assert result["id"] == "c1:local"
+        assert _mock_graphql.call_count == 2
+        assert _mock_graphql.call_args.args[1] == {"id": "c1:local"}
+
+    async def test_recreating_mutation_drops_index(self, _mock_graphql: AsyncMock) -> None:
+        from unraid_mcp.tools import _docker
+
+        _mock_graphql.return_value = self._LIST
+        await _make_tool()(action="docker", subaction="list")
+        assert _docker._recent_container_index() is not None
+        _mock_graphql.return_value = {"docker": {"updateAllContainers": []}}
+        await _make_tool()(action="docker", subaction="update_all_containers")
+        assert _docker._recent_container_index() is None
+
+    async def test_repeated_mutations_resolve_once(self, _mock_graphql: AsyncMock) -> None:
+        stopped = {"docker": {"stop": {"id": "c1:local", "names": ["plex"], "state": "exited"}}}
+        started = {"docker": {"start": {"id": "c1:local", "names": ["plex"], "state": "running"}}}
+        _mock_graphql.side_effect = [self._LIST, stopped, started]
+        tool_fn = _make_tool()
+        await tool_fn(action="docker", subaction="stop", container_id="plex")
+        result = await tool_fn(action="docker", subaction="start", container_id="plex")
+        assert result["success"] is True
+        assert _mock_graphql.call_count == 3
+
+    async def test_cache_miss_refetches(self, _mock_graphql: AsyncMock) -> None:
+        fresh = {"docker": {"containers": [{"id": "c2:local", "names": ["sonarr"]}]}}
+        _mock_graphql.side_effect = [self._LIST, fresh, self._DETAILS]
+        tool_fn = _make_tool()
+        await tool_fn(action="docker", subaction="list")
+        await tool_fn(action="docker", subaction="details", container_id="sonarr")
+        assert _mock_graphql.call_args.args[1] == {"id": "c2:local"}
+
+    async def test_fuzzy_match_is_not_served_from_index(self, _mock_graphql: AsyncMock) -> None:
+        cached = {"docker": {"containers": [{"id": "c1:local", "names": ["plexpy"]}]}}
+        fresh = {
+            "docker": {
+                "containers": [
+                    {"id": "c1:local", "names": ["plexpy"]},
+                    {"id": "c2:local", "names": ["plex"]},
+                ]
+            }
+        }
+        _mock_graphql.side_effect = [cached, fresh, self._DETAILS]
+        tool_fn = _make_tool()
+        await tool_fn(action="docker", subaction="list")
+        await tool_fn(action="docker", subaction="details", container_id="plex")
+        assert _mock_graphql.call_count == 3
+        assert _mock_graphql.call_args.args[1] == {"id": "c2:local"}
+
+    async def test_ambiguous_index_match_refetches(self, _mock_graphql: AsyncMock) -> None:
+        cached = {
+            "docker": {
+                "containers": [
+                    {"id": "c1:local", "names": ["plex-a"]},
+                    {"id": "c2:local", "names": ["plex-b"]},
+                ]
+            }
+        }
+        fresh = {"docker": {"containers": [{"id": "c2:local", "names": ["plex-b"]}]}}
+        _mock_graphql.side_effect = [cached, fresh, self._DETAILS]
+        tool_fn = _make_tool()
+        await tool_fn(action="docker", subaction="list")
+        await tool_fn(action="docker", subaction="details", container_id="plex")
+        assert _mock_graphql.call_args.args[1] == {"id": "c2:local"}
+
+    async def test_expired_index_is_ignored(
+        self, _mock_graphql: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from unraid_mcp.tools import _docker
+
+        _mock_graphql.return_value = self._LIST
+        await _make_tool()(action="docker", subaction="list")
+        stamp, index = _docker._container_index_cache
+        monkeypatch.setattr(
+            _docker,
+            "_container_index_cache",
+            (stamp - _docker._CONTAINER_INDEX_TTL_SECONDS - 1, index),
+        )
+        assert _docker._recent_container_index() is None
+
+    async def test_stale_index_mutation_retries_with_fresh_id(
+        self, _mock_graphql: AsyncMock
+    ) -> None:
+        fresh = {"docker": {"containers": [{"id": "c2:local", "names": ["plex"]}]}}
+        started = {"docker": {"start": {"id": "c2:local", "names": ["plex"], "state": "running"}}}
+        _mock_graphql.side_effect = [
+            self._LIST,
+            ToolError("GraphQL API error: No such container"),
+            fresh,
+            started,
+        ]
+        tool_fn = _make_tool()
+        await tool_fn(action="docker", subaction="list")
+        result = await tool_fn(action="docker", subaction="start", container_id="plex")
+        assert result["success"] is True
+        assert _mock_graphql.call_args.args[1] == {"id": "c2:local"}
+
+    async def test_freshly_resolved_mutation_error_is_not_retried(
+        self, _mock_graphql: AsyncMock
+    ) -> None:
+        fresh = {"docker": {"containers": [{"id": "c2:local", "names": ["sonarr"]}]}}
+        _mock_graphql.side_effect = [
+            self._LIST,
+            fresh,
+            ToolError("GraphQL API error: Container not running"),
+        ]
+        tool_fn = _make_tool()
+        await tool_fn(action="docker", subaction="list")
+        with pytest.raises(ToolError, match="Container not running"):
+            await tool_fn(action="docker", subaction="stop", container_id="sonarr")
+        assert _mock_graphql.call_count == 3
+
+    async def test_cached_mutation_error_is_not_retried_for_same_id(
+        self, _mock_graphql: AsyncMock
+    ) -> None:
+        _mock_graphql.side_effect = [
+            self._LIST,
+            ToolError("GraphQL API error: Container not running"),
+            self._LIST,
+        ]
+        tool_fn = _make_tool()
+        await tool_fn(action="docker", subaction="list")
+        with pytest.raises(ToolError, match="Container not running"):
+            await tool_fn(action="docker", subaction="stop", container_id="plex")
+        assert _mock_graphql.call_count == 3
+
+
+class TestDockerIdShape:
+    @pytest.mark.parametrize(
+        "value",
+        ["a" * 64, "A" * 64, "0123456789abcdef" * 4 + ":local", "f" * 64 + ":Local2"],
+    )
+    def test_full_id_accepted(self, value: str) -> None:
+        from unraid_mcp.tools._docker import _is_full_docker_id
+
+        assert _is_full_docker_id(value) is True
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "a" * 63,
+            "g" * 64,
+            "a" * 64 + ":",
+            "a" * 64 + "local",
+            "a" * 64 + ":lo-cal",
+            "a" * 64 + "\n",
+            "plex",
+        ],
+    )
+    def test_full_id_rejected(self, value: str) -> None:
+        from unraid_mcp.tools._docker import _is_full_docker_id
+
+        assert _is_full_docker_id(value) is False
+
+    def test_short_id_bounds(self) -> None:
+        from unraid_mcp.tools._docker import _is_short_docker_id
+
+        assert _is_short_docker_id("abcdef012345") is True
+        assert _is_short_docker_id("a" * 63) is True
+        assert _is_short_docker_id("abcdef01234") is False
+        assert _is_short_docker_id("a" * 64) is False
+        assert _is_short_docker_id("plexmediaserver") is False
+
+
 class TestDockerMutationFailures:
     """Tests for mutation responses that indicate failure or unexpected shapes."""
 
@@ -617,7 +843,7 @@ class TestDockerPortsAggregator:
 # New lifecycle / update / template / organizer subactions
 # ---------------------------------------------------------------------------
 
-_FULL_ID = "a" * 64  # matches _DOCKER_ID_PATTERN so no resolve round-trip
+_FULL_ID = "a" * 64  # a full docker ID, so no resolve round-trip
 
 
 class TestDockerLifecycleAdditions:
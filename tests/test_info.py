@@ -1,5 +1,6 @@
 """Tests for system subactions of the consolidated unraid tool."""
 
+import asyncio
 from collections.abc import Generator
 from unittest.mock import AsyncMock, patch
 
@@ -48,6 +49,17 @@ class TestAnalyzeDiskHealth:
         result = _analyze_disk_health(disks)
         assert result["missing"] == 1
 
+    def test_lowercase_status_is_normalised(self) -> None:
+        disks = [{"status": "disk_ok"}, {"status": "disk_new"}]
+        result = _analyze_disk_health(disks)
+        assert result["healthy"] == 1
+        assert result["new"] == 1
+
+    def test_missing_or_unrecognised_status_counts_as_unknown(self) -> None:
+        disks = [{"status": None}, {}, {"status": "DISK_WRONG"}]
+        result = _analyze_disk_health(disks)
+        assert result["unknown"] == 3
+
     def test_empty_list(self) -> None:
         result = _analyze_disk_health([])
         assert result["healthy"] == 0
@@ -103,6 +115,32 @@ class TestUnraidInfoTool:
         assert result["summary"]["machine_id"] == "mid-1"
         assert result["summary"]["versions"] == {"unraid": "7.2.0"}
 
+    async def test_overview_renders_one_line_per_memory_bank(
+        self, _mock_graphql: AsyncMock
+    ) -> None:
+        _mock_graphql.return_value = {
+            "info": {
+                "memory": {
+                    "layout": [
+                        {
+                            "bank": "BANK 0",
+                            "type": "DDR4",
+                            "clockSpeed": 3200,
+                            "manufacturer": "Kingston",
+                            "partNum": "KSM32",
+                        },
+                        {"bank": "BANK 1"},
+                    ]
+                }
+            }
+        }
+        tool_fn = _make_tool()
+        result = await tool_fn(action="system", subaction="overview")
+        assert result["summary"]["memory_layout_details"] == [
+            "Bank BANK 0: DDR4, 3200MHz, Kingston, KSM32",
+            "Bank BANK 1: None, NoneMHz, None, None",
+        ]
+
     async def test_array_omits_raw_details(self, _mock_graphql: AsyncMock) -> None:
         """array returns the computed summary without the raw disk object echo."""
         _mock_graphql.return_value = {
@@ -120,6 +158,29 @@ class TestUnraidInfoTool:
         assert result["summary"]["state"] == "STARTED"
         assert result["summary"]["overall_health"] == "HEALTHY"
 
+    async def test_snapshot_combines_summaries_in_one_request(
+        self, _mock_graphql: AsyncMock
+    ) -> None:
+        _mock_graphql.return_value = {
+            "info": {"os": {"hostname": "tower", "uptime": "2026-01-01T00:00:00Z"}},
+            "array": {
+                "state": "STARTED",
+                "capacity": {"kilobytes": {"free": 1000, "used": 500, "total": 1500}},
+                "parities": [{"status": "DISK_OK"}],
+                "disks": [{"status": "DISK_DSBL"}],
+                "caches": [],
+            },
+            "metrics": {"cpu": {"percentTotal": 12.5}, "memory": {"percentTotal": 40.0}},
+            "online": True,
+        }
+        tool_fn = _make_tool()
+        result = await tool_fn(action="system", subaction="snapshot")
+        _mock_graphql.assert_called_once()
+        assert result["overview"]["hostname"] == "tower"
+        assert result["array"]["overall_health"] == "CRITICAL"
+        assert result["metrics"]["cpu"]["percentTotal"] == 12.5
+        assert result["online"] is True
+
     async def test_timezones_capped_with_meta(self, _mock_graphql: AsyncMock) -> None:
         """timezones is capped to the limit and surfaces truncation meta."""
         opts = [{"value": f"Zone/{i}", "label": f"Zone {i}"} for i in range(100)]
@@ -337,6 +398,12 @@ class TestUnraidInfoTool:
         result = await tool_fn(action="system", subaction="settings")
         assert result == {"raw": "raw_string"}
 
+    async def test_display_null_returns_empty(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {"info": {"display": None}}
+        tool_fn = _make_tool()
+        result = await tool_fn(action="system", subaction="display")
+        assert result == {}
+
     async def test_servers(self, _mock_graphql: AsyncMock) -> None:
         _mock_graphql.return_value = {
             "servers": [{"id": "s:1", "name": "tower", "status": "online"}]
@@ -481,3 +548,170 @@ async def test_removed_info_subactions_are_invalid(subaction: str) -> None:
     tool_fn = _make_tool()
     with pytest.raises(ToolError, match="Invalid subaction"):
         await tool_fn(action="system", subaction=subaction)
+
+
+# ---------------------------------------------------------------------------
+# Short-lived memo for slow-changing system reads
+# ---------------------------------------------------------------------------
+
+
+class TestSystemReadCache:
+    async def test_live_subactions_are_not_cached(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {"online": True}
+        tool_fn = _make_tool()
+        await tool_fn(action="system", subaction="online")
+        await tool_fn(action="system", subaction="online")
+        assert _mock_graphql.call_count == 2
+
+    async def test_rejected_payload_is_not_cached(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.side_effect = [
+            {"registration": None},
+            {"registration": {"id": "r1", "type": "PRO"}},
+        ]
+        tool_fn = _make_tool()
+        with pytest.raises(ToolError, match="No registration data returned"):
+            await tool_fn(action="system", subaction="registration")
+        result = await tool_fn(action="system", subaction="registration")
+        assert result["type"] == "PRO"
+
+    async def test_mutating_a_result_leaves_the_memo_intact(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {"owner": {"username": "root"}}
+        tool_fn = _make_tool()
+        first = await tool_fn(action="system", subaction="owner")
+        first["username"] = "changed"
+        second = await tool_fn(action="system", subaction="owner")
+        assert second == {"username": "root"}
+        assert _mock_graphql.call_count == 1
+
+    async def test_coalesced_callers_get_independent_results(
+        self, _mock_graphql: AsyncMock
+    ) -> None:
+        release = asyncio.Event()
+
+        async def respond(*args, **kwargs):
+            await release.wait()
+            return {"info": {"versions": {"core": {"unraid": "7.2.0"}}}}
+
+        _mock_graphql.side_effect = respond
+        tool_fn = _make_tool()
+        calls = [
+            asyncio.ensure_future(tool_fn(action="system", subaction="overview")) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        first, second = await asyncio.gather(*calls)
+        first["summary"]["versions"]["unraid"] = "changed"
+        assert second["summary"]["versions"] == {"unraid": "7.2.0"}
+        assert _mock_graphql.call_count == 1
+
+    @pytest.mark.parametrize(
+        ("read", "cached", "mutation", "mutation_result"),
+        [
+            (
+                "owner",
+                {"owner": {"username": "root"}},
+                {"action": "connect", "subaction": "sign_out", "confirm": True},
+                {"connectSignOut": True},
+            ),
+            (
+                "variables",
+                {"vars": {"mdState": "STOPPED"}},
+                {"action": "array", "subaction": "start_array"},
+                {"array": {"setState": {"state": "STARTED"}}},
+            ),
+            (
+                "flash",
+                {"flash": {"id": "f1"}},
+                {"action": "plugin", "subaction": "add", "names": ["p"]},
+                {"addPlugin": True},
+            ),
+            (
+                "variables",
+                {"vars": {"name": "tower"}},
+                {"action": "onboarding", "subaction": "complete"},
+                {"onboarding": {"completeOnboarding": {"completed": True}}},
+            ),
+            (
+                "variables",
+                {"vars": {"name": "tower"}},
+                {"action": "customization", "subaction": "set_locale", "locale": "de_DE"},
+                {"customization": {"setLocale": "de_DE"}},
+            ),
+        ],
+    )
+    async def test_other_domain_mutations_drop_cache(
+        self,
+        _mock_graphql: AsyncMock,
+        read: str,
+        cached: dict,
+        mutation: dict,
+        mutation_result: dict,
+    ) -> None:
+        _mock_graphql.side_effect = [cached, mutation_result, cached]
+        tool_fn = _make_tool()
+        await tool_fn(action="system", subaction=read)
+        await tool_fn(**mutation)
+        await tool_fn(action="system", subaction=read)
+        assert _mock_graphql.call_count == 3
+
+    async def test_read_in_flight_across_a_mutation_is_not_cached(
+        self, _mock_graphql: AsyncMock
+    ) -> None:
+        release = asyncio.Event()
+
+        async def respond(query: str, *args, **kwargs):
+            if "GetOwner" in query:
+                await release.wait()
+                return {"owner": {"username": "old"}}
+            return {"connectSignOut": True}
+
+        _mock_graphql.side_effect = respond
+        tool_fn = _make_tool()
+        read = asyncio.ensure_future(tool_fn(action="system", subaction="owner"))
+        await asyncio.sleep(0)
+        await tool_fn(action="connect", subaction="sign_out", confirm=True)
+        release.set()
+        await read
+        # The pre-mutation payload was dropped, so this read goes back out.
+        await tool_fn(action="system", subaction="owner")
+        assert _mock_graphql.call_count == 3
+
+    async def test_overview_reports_live_uptime_and_time(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.side_effect = [
+            {"info": {"os": {"hostname": "tower", "uptime": "2026-01-01"}, "time": "t1"}},
+            {"info": {"os": {"hostname": "tower", "uptime": "2026-01-01"}, "time": "t2"}},
+        ]
+        tool_fn = _make_tool()
+        first = await tool_fn(action="system", subaction="overview")
+        second = await tool_fn(action="system", subaction="overview")
+        assert first["summary"]["uptime"] == "2026-01-01"
+        assert (first["summary"]["time"], second["summary"]["time"]) == ("t1", "t2")
+
+    async def test_concurrent_misses_share_one_request(self, _mock_graphql: AsyncMock) -> None:
+        async def slow_owner(*args, **kwargs):
+            await asyncio.sleep(0)
+            return {"owner": {"username": "root"}}
+
+        _mock_graphql.side_effect = slow_owner
+        tool_fn = _make_tool()
+        results = await asyncio.gather(
+            *(tool_fn(action="system", subaction="owner") for _ in range(3))
+        )
+        assert all(r == {"username": "root"} for r in results)
+        _mock_graphql.assert_called_once()
+
+    async def test_concurrent_live_reads_share_one_request(self, _mock_graphql: AsyncMock) -> None:
+        async def slow_online(*args, **kwargs):
+            await asyncio.sleep(0)
+            return {"online": True}
+
+        _mock_graphql.side_effect = slow_online
+        tool_fn = _make_tool()
+        results = await asyncio.gather(
+            *(tool_fn(action="system", subaction="online") for _ in range(3))
+        )
+        assert results == [{"online": True}] * 3
+        _mock_graphql.assert_called_once()
+        # Nothing is memoised once the shared request has finished.
+        await tool_fn(action="system", subaction="online")
+        assert _mock_graphql.call_count == 2
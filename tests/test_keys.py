@@ -196,3 +196,12 @@ class TestKeyPermissionIntrospection:
         sent = _mock_graphql.call_args.args[1]
         assert sent["roles"] == ["VIEWER"]
         assert sent["permissions"][0]["resource"] == "DOCKER"
+
+
+class TestKeyReadCache:
+    async def test_missing_key_not_cached(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.side_effect = [{"apiKey": None}, {"apiKey": {"id": "k:1", "name": "new"}}]
+        tool_fn = _make_tool()
+        assert await tool_fn(action="key", subaction="get", key_id="k:1") == {}
+        result = await tool_fn(action="key", subaction="get", key_id="k:1")
+        assert result["name"] == "new"
@@ -0,0 +1,51 @@
+"""Tests for the server entry point's event loop selection."""
+
+import sys
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from unraid_mcp import main as main_mod
+
+
+@pytest.fixture
+def _fake_uvloop() -> types.ModuleType:
+    module = types.ModuleType("uvloop")
+    module.EventLoopPolicy = MagicMock(name="EventLoopPolicy")  # type: ignore[attr-defined]
+    return module
+
+
+def test_uvloop_policy_is_installed_when_available(
+    monkeypatch: pytest.MonkeyPatch, _fake_uvloop: types.ModuleType
+) -> None:
+    monkeypatch.setattr(main_mod, "sys", types.SimpleNamespace(version_info=(3, 13)))
+    with (
+        patch.dict(sys.modules, {"uvloop": _fake_uvloop}),
+        patch.object(main_mod.asyncio, "set_event_loop_policy") as set_policy,
+    ):
+        main_mod._use_uvloop()
+    set_policy.assert_called_once_with(_fake_uvloop.EventLoopPolicy.return_value)
+
+
+def test_missing_uvloop_keeps_stock_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(main_mod, "sys", types.SimpleNamespace(version_info=(3, 13)))
+    # A None entry in sys.modules makes `import uvloop` raise ImportError.
+    with (
+        patch.dict(sys.modules, {"uvloop": None}),
+        patch.object(main_mod.asyncio, "set_event_loop_policy") as set_policy,
+    ):
+        main_mod._use_uvloop()
+    set_policy.assert_not_called()
+
+
+def test_deprecated_policy_api_is_not_called(
+    monkeypatch: pytest.MonkeyPatch, _fake_uvloop: types.ModuleType
+) -> None:
+    monkeypatch.setattr(main_mod, "sys", types.SimpleNamespace(version_info=(3, 14)))
+    with (
+        patch.dict(sys.modules, {"uvloop": _fake_uvloop}),
+        patch.object(main_mod.asyncio, "set_event_loop_policy") as set_policy,
+    ):
+        main_mod._use_uvloop()
+    set_policy.assert_not_called()
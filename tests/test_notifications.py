@@ -66,6 +66,15 @@ class TestNotificationsActions:
         result = await tool_fn(action="notification", subaction="overview")
         assert result["unread"]["total"] == 7
 
+    async def test_mutating_overview_leaves_the_memo_intact(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {"notifications": {"overview": {"unread": {"total": 7}}}}
+        tool_fn = _make_tool()
+        first = await tool_fn(action="notification", subaction="overview")
+        first["unread"]["total"] = 0
+        second = await tool_fn(action="notification", subaction="overview")
+        assert second == {"unread": {"total": 7}}
+        assert _mock_graphql.await_count == 1
+
     async def test_list(self, _mock_graphql: AsyncMock) -> None:
         _mock_graphql.return_value = {
             "notifications": {"list": [{"id": "n:1", "title": "Test", "importance": "INFO"}]}
@@ -197,6 +206,45 @@ class TestNotificationsActions:
             await tool_fn(action="notification", subaction="overview")
 
 
+class TestNotificationReadCache:
+    async def test_dashboard_fetches_once_and_seeds_reads(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {
+            "notifications": {
+                "overview": {"unread": {"total": 2}, "archive": {"total": 0}},
+                "list": [{"id": "n:1"}, {"id": "n:2"}],
+                "warningsAndAlerts": [{"id": "n:2", "importance": "ALERT"}],
+            }
+        }
+        tool_fn = _make_tool()
+        result = await tool_fn(action="notification", subaction="dashboard", limit=1)
+        assert result["overview"]["unread"]["total"] == 2
+        assert result["unread"]["notifications"] == [{"id": "n:1"}]
+        assert result["unread"]["page"]["truncated"] is True
+        assert result["warnings_and_alerts"]["notifications"][0]["id"] == "n:2"
+        assert _mock_graphql.call_args.args[1] == {
+            "filter": {"type": "UNREAD", "offset": 0, "limit": 1}
+        }
+
+        await tool_fn(action="notification", subaction="overview")
+        await tool_fn(action="notification", subaction="list", limit=1)
+        assert _mock_graphql.await_count == 1
+
+    async def test_list_cache_keyed_on_filter(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {"notifications": {"list": []}}
+        tool_fn = _make_tool()
+        await tool_fn(action="notification", subaction="list")
+        await tool_fn(action="notification", subaction="list")
+        await tool_fn(action="notification", subaction="list", list_type="ARCHIVE")
+        assert _mock_graphql.await_count == 2
+
+    async def test_later_pages_not_cached(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {"notifications": {"list": []}}
+        tool_fn = _make_tool()
+        await tool_fn(action="notification", subaction="list", offset=20)
+        await tool_fn(action="notification", subaction="list", offset=20)
+        assert _mock_graphql.await_count == 2
+
+
 class TestNotificationsCreateValidation:
     """Tests for importance enum and field length validation added in this PR."""
 
@@ -331,6 +379,97 @@ class TestNewNotificationMutations:
         with pytest.raises(ToolError, match="notification_ids"):
             await tool_fn(action="notification", subaction="unarchive_many")
 
+    async def test_archive_with_ids_runs_bulk_mutation(self, _mock_graphql: AsyncMock) -> None:
+        overview = {"unread": {"total": 0}, "archive": {"total": 2}}
+        _mock_graphql.return_value = {"archiveNotifications": overview}
+        tool_fn = _make_tool()
+        result = await tool_fn(
+            action="notification", subaction="archive", notification_ids=["n:1", "n:2"]
+        )
+        assert result == {"success": True, "subaction": "archive_many", "data": overview}
+        assert _mock_graphql.await_count == 1
+        assert _mock_graphql.call_args.args[1] == {"ids": ["n:1", "n:2"]}
+
+    async def test_mark_unread_with_ids_runs_unarchive_many(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {"unarchiveNotifications": {"unread": {"total": 2}}}
+        tool_fn = _make_tool()
+        result = await tool_fn(
+            action="notification", subaction="mark_unread", notification_ids=["n:1", "n:2"]
+        )
+        assert result["subaction"] == "unarchive_many"
+        assert "UnarchiveNotifications" in _mock_graphql.call_args.args[0]
+
+    async def test_delete_many_sends_one_aliased_document(self, _mock_graphql: AsyncMock) -> None:
+        overview = {"unread": {"total": 0}, "archive": {"total": 0}}
+        _mock_graphql.return_value = {"d0": {"unread": {"total": 1}}, "d1": overview}
+        tool_fn = _make_tool()
+        result = await tool_fn(
+            action="notification",
+            subaction="delete",
+            notification_ids=["n:1", "n:2", "n:1"],
+            notification_type="unread",
+            confirm=True,
+        )
+        assert result == {"success": True, "subaction": "delete", "deleted": 2, "data": overview}
+        assert _mock_graphql.await_count == 1
+        query, variables = _mock_graphql.call_args.args
+        assert "d1: deleteNotification(id: $id1, type: $type)" in query
+        assert variables == {"id0": "n:1", "id1": "n:2", "type": "UNREAD"}
+
+    async def test_delete_many_splits_large_batches(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.side_effect = lambda query, variables: {
+            f"d{len(variables) - 2}": {"unread": {"total": 0}}
+        }
+        tool_fn = _make_tool()
+        result = await tool_fn(
+            action="notification",
+            subaction="delete",
+            notification_ids=[f"n:{i}" for i in range(45)],
+            notification_type="ARCHIVE",
+            confirm=True,
+        )
+        assert result["deleted"] == 45
+        sizes = [len(call.args[1]) - 1 for call in _mock_graphql.call_args_list]
+        assert sizes == [20, 20, 5]
+
+    async def test_delete_many_reports_partial_progress(self, _mock_graphql: AsyncMock) -> None:
+        overview = {"unread": {"total": 0}}
+        _mock_graphql.side_effect = [
+            {"d19": overview},
+            ToolError("GraphQL API error: Notification not found"),
+            {"d4": None},
+        ]
+        ids = [f"n:{i}" for i in range(45)]
+        result = await _make_tool()(
+            action="notification",
+            subaction="delete",
+            notification_ids=ids,
+            notification_type="UNREAD",
+            confirm=True,
+        )
+        assert result["success"] is False
+        assert result["deleted"] == 20
+        assert result["indeterminate_ids"] == ids[20:]
+        assert "failed_ids" not in result
+        assert "Notification not found" in result["error"]
+        assert result["data"] == overview
+        assert _mock_graphql.await_count == 3
+
+    async def test_delete_prefers_single_id_over_ids(self, _mock_graphql: AsyncMock) -> None:
+        # Same precedence as archive/mark_unread: notification_id wins.
+        _mock_graphql.return_value = {"deleteNotification": {}}
+        await _make_tool()(
+            action="notification",
+            subaction="delete",
+            notification_id="n:9",
+            notification_ids=["n:1", "n:2"],
+            notification_type="UNREAD",
+            confirm=True,
+        )
+        query, variables = _mock_graphql.call_args.args
+        assert query.startswith("mutation DeleteNotification(")
+        assert variables == {"id": "n:9", "type": "UNREAD"}
+
     async def test_unarchive_all_success(self, _mock_graphql: AsyncMock) -> None:
         overview = {
             "unread": {"info": 5, "warning": 1, "alert": 0, "total": 6},
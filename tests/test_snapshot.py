@@ -272,6 +272,13 @@ def test_snapshot_actions_importable_from_subscriptions() -> None:
     assert "log_tail" in COLLECT_ACTIONS
 
 
+def test_subscription_queries_are_whitespace_compacted() -> None:
+    from unraid_mcp.subscriptions.queries import COLLECT_ACTIONS, SNAPSHOT_ACTIONS
+
+    for query in (*SNAPSHOT_ACTIONS.values(), *COLLECT_ACTIONS.values()):
+        assert query == " ".join(query.split())
+
+
 # ---------------------------------------------------------------------------
 # Malformed-frame resilience (T-M4)
 #
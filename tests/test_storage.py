@@ -1,6 +1,7 @@
 """Tests for disk subactions of the consolidated unraid tool."""
 
 import posixpath
+import re
 from collections.abc import Generator
 from unittest.mock import AsyncMock, patch
 
@@ -10,6 +11,7 @@ from conftest import make_tool_fn
 from unraid_mcp.core.exceptions import ToolError
 from unraid_mcp.core.utils import (
     coerce_list,
+    compact_query,
     format_bytes,
     format_kb,
     mutation_success,
@@ -29,6 +31,46 @@ class TestCoerceList:
         assert coerce_list(value) == []
 
 
+class TestCompactQuery:
+    def test_collapses_indentation(self) -> None:
+        query = """
+            query GetX {
+              x { id name }
+            }
+        """
+        assert compact_query(query) == "query GetX { x { id name } }"
+
+    def test_domain_queries_are_sent_compacted(self) -> None:
+        from unraid_mcp.tools._connect import _CONNECT_QUERIES
+        from unraid_mcp.tools._customization import _CUSTOMIZATION_QUERIES
+        from unraid_mcp.tools._system import _SYSTEM_QUERIES
+
+        for queries in (_SYSTEM_QUERIES, _CONNECT_QUERIES, _CUSTOMIZATION_QUERIES):
+            for query in queries.values():
+                assert query == compact_query(query)
+
+    def test_every_domain_operation_table_is_compact(self) -> None:
+        # Single-line literals are compact by construction; this catches a new
+        # multi-line table that forgets to run through compact_query at import.
+        import importlib
+        import pkgutil
+
+        import unraid_mcp.tools as tools_pkg
+
+        checked = 0
+        for info in pkgutil.iter_modules(tools_pkg.__path__):
+            module = importlib.import_module(f"unraid_mcp.tools.{info.name}")
+            for attr, table in vars(module).items():
+                if not re.fullmatch(r"_[A-Z_]+_(QUERIES|MUTATIONS)", attr) or not isinstance(
+                    table, dict
+                ):
+                    continue
+                for name, query in table.items():
+                    assert query == compact_query(query), f"{info.name}.{attr}[{name!r}]"
+                    checked += 1
+        assert checked
+
+
 class TestMutationSuccess:
     @pytest.mark.parametrize(
         ("result", "boolean", "expected"),
@@ -70,6 +112,16 @@ class TestFormatBytes:
     def test_terabytes(self) -> None:
         assert format_bytes(1099511627776) == "1.00 TB"
 
+    def test_exabytes_is_the_largest_unit(self) -> None:
+        assert format_bytes(1 << 60) == "1.00 EB"
+        assert format_bytes(1 << 70) == "1024.00 EB"
+
+    def test_unit_boundaries(self) -> None:
+        assert format_bytes(0) == "0.00 B"
+        assert format_bytes(1023) == "1023.00 B"
+        assert format_bytes(1024) == "1.00 KB"
+        assert format_bytes((1 << 20) - 1) == "1024.00 KB"
+
 
 class TestValidatePathBoundary:
     """Pin the boundary-correct prefix check in disk._validate_path.
@@ -292,6 +344,30 @@ class TestStorageActions:
         result = await tool_fn(action="disk", subaction="disks")
         assert len(result["disks"]) == 1
 
+    @pytest.mark.parametrize("subaction", ["shares", "disks", "log_files"])
+    async def test_null_list_field_is_empty(self, _mock_graphql: AsyncMock, subaction: str) -> None:
+        _mock_graphql.return_value = {"shares": None, "disks": None, "logFiles": None}
+        result = await _make_tool()(action="disk", subaction=subaction)
+        assert result[subaction] == []
+        assert result["page"]["total"] == 0
+
+    async def test_overview_fetches_all_sections_in_one_request(
+        self, _mock_graphql: AsyncMock
+    ) -> None:
+        _mock_graphql.return_value = {
+            "shares": [{"name": "media"}],
+            "disks": [{"id": "d:1", "device": "sda"}, {"id": "d:2", "device": "sdb"}],
+            "logFiles": [{"name": "syslog", "path": "/var/log/syslog"}],
+        }
+        result = await _make_tool()(action="disk", subaction="overview", limit=1)
+        assert _mock_graphql.await_count == 1
+        query = _mock_graphql.call_args.args[0]
+        assert all(root in query for root in ("shares {", "disks {", "logFiles {"))
+        assert result["shares"]["shares"] == [{"name": "media", "id": "media"}]
+        assert len(result["disks"]["disks"]) == 1
+        assert result["disks"]["page"]["truncated"] is True
+        assert result["log_files"]["log_files"][0]["name"] == "syslog"
+
 
 class TestStorageListCaps:
     """disk/shares and disk/disks cap large lists via cap_list and surface page meta."""
@@ -631,3 +707,54 @@ class TestLogsFiltering:
         )
         assert result["content"] == ""
         assert result["matchedLines"] == 0
+
+
+class TestLogsByteBudget:
+    """disk/logs trims content to whole lines under the response byte budget."""
+
+    # Five 10-byte lines (9 chars + newline), 49 bytes in total.
+    _CONTENT = "\n".join(f"line{i}xxxx" for i in range(5))
+
+    @pytest.fixture(autouse=True)
+    def _small_budget(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Half the response cap, read from settings on every call.
+        monkeypatch.setattr("unraid_mcp.config.settings.UNRAID_MCP_MAX_RESPONSE_BYTES", 50)
+
+    async def test_tail_keeps_newest_whole_lines(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {
+            "logFile": {"path": "/var/log/syslog", "content": self._CONTENT, "startLine": 96}
+        }
+        result = await _make_tool()(action="disk", subaction="logs", log_path="/var/log/syslog")
+        assert result["content"] == "line3xxxx\nline4xxxx"
+        assert result["truncated"] is True
+        assert result["omittedLines"] == 3
+        # The omitted lines start where the returned tail started.
+        assert result["nextStartLine"] == 96
+
+    async def test_start_line_reads_forward(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {
+            "logFile": {"path": "/var/log/syslog", "content": self._CONTENT, "startLine": 1}
+        }
+        result = await _make_tool()(
+            action="disk", subaction="logs", log_path="/var/log/syslog", start_line=1
+        )
+        assert _mock_graphql.call_args.args[1]["startLine"] == 1
+        assert result["content"] == "line0xxxx\nline1xxxx"
+        assert result["omittedLines"] == 3
+        assert result["nextStartLine"] == 3
+
+    async def test_content_within_budget_is_untouched(self, _mock_graphql: AsyncMock) -> None:
+        _mock_graphql.return_value = {
+            "logFile": {"path": "/var/log/syslog", "content": "short", "startLine": 1}
+        }
+        result = await _make_tool()(action="disk", subaction="logs", log_path="/var/log/syslog")
+        assert result["content"] == "short"
+        assert "truncated" not in result
+        assert "startLine" not in _mock_graphql.call_args.args[1]
+
+    async def test_start_line_must_be_positive(self, _mock_graphql: AsyncMock) -> None:
+        with pytest.raises(ToolError, match="start_line"):
+            await _make_tool()(
+                action="disk", subaction="logs", log_path="/var/log/syslog", start_line=0
+            )
+        _mock_graphql.assert_not_awaited()